@@ -5,8 +5,12 @@ set -e
 LOGLEVEL=${CELERY_LOGLEVEL:-INFO}
 CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-1}
 
-QUEUE=${CELERY_WORKER_QUEUE:=celery}
-WORKER_NAME=${CELERY_WORKER_NAME:="${QUEUE}"@%n}
+# By default, consume all the queues the tasks are routed to (see CELERY_TASK_ROUTES
+# in the settings). Specify (a comma separated list of) queues to start a dedicated
+# worker instead.
+ALL_QUEUES="celery,${CELERY_USER_FACING_QUEUE:-user-facing},${CELERY_PDF_QUEUE:-pdf},${CELERY_REGISTRATION_QUEUE:-registration},${CELERY_MAINTENANCE_QUEUE:-maintenance}"
+QUEUE=${CELERY_WORKER_QUEUE:-$ALL_QUEUES}
+WORKER_NAME=${CELERY_WORKER_NAME:="${CELERY_WORKER_QUEUE:-celery}"@%n}
 
 _binary=$(which celery)
 
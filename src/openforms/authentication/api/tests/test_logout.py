@@ -105,6 +105,21 @@ class SubmissionLogoutTest(SubmissionsMixin, APITestCase):
         # admin user still authenticated
         self.assertIn(SESSION_KEY, session)
 
+    @patch("openforms.prefill.signals.clear_cached_prefill_values")
+    def test_logout_discards_cached_prefill_values(self, mock_clear):
+        submission = SubmissionFactory.create(
+            completed=False,
+            auth_info__attribute=AuthAttribute.bsn,
+            auth_info__value="000000000",
+        )
+        self._add_submission_to_session(submission)
+        url = reverse("api:submission-logout", kwargs={"uuid": submission.uuid})
+
+        response = self.client.delete(url)
+
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
+        mock_clear.assert_called_once_with(AuthAttribute.bsn, "000000000")
+
     def test_logout_non_existing_plugin(self):
         register = Registry()
 
@@ -15,6 +15,7 @@ from openforms.submissions.utils import remove_submission_from_session
 
 from ..constants import FORM_AUTH_SESSION_KEY, REGISTRATOR_SUBJECT_SESSION_KEY
 from ..registry import register
+from ..signals import authentication_logout
 from .serializers import AuthPluginSerializer
 
 
@@ -68,6 +69,14 @@ class SubmissionLogoutView(GenericAPIView[Submission]):
                 plugin = register[submission.auth_info.plugin]
                 plugin.logout(request)
 
+            if not submission.auth_info.attribute_hashed:
+                authentication_logout.send(
+                    sender=self.__class__,
+                    request=request,
+                    auth_attribute=submission.auth_info.attribute,
+                    auth_value=submission.auth_info.value,
+                )
+
             if submission.is_ready_to_hash_identifying_attributes:
                 if not submission.auth_info.attribute_hashed:
                     submission.auth_info.hash_identifying_attributes()
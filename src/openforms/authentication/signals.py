@@ -1,6 +1,7 @@
 import logging
 
 from django.core.exceptions import PermissionDenied
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -15,8 +16,10 @@ from openforms.submissions.signals import (
     submission_resumed,
     submission_start,
 )
+from openforms.variables.cache import invalidate_submission_values
 
 from .constants import FORM_AUTH_SESSION_KEY, REGISTRATOR_SUBJECT_SESSION_KEY
+from .models import AuthInfo
 from .registry import register
 from .utils import (
     remove_auth_info_from_session,
@@ -45,6 +48,8 @@ Signals that a user that had logged in with an authentication plugin logged out.
 
 Provides:
     :arg request: the HttpRequest instance
+    :arg auth_attribute: the authentication attribute of the user, if known
+    :arg auth_value: the (unhashed) value of the authentication attribute, if known
 """
 
 
@@ -160,3 +165,13 @@ def set_cosign_data_on_submission(
     instance.save()
 
     remove_auth_info_from_session(request)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=AuthInfo,
+    dispatch_uid="auth.invalidate_static_variables",
+)
+def invalidate_static_variables(sender, instance: AuthInfo, **kwargs):
+    # the authentication static variables derive their value from the auth info
+    invalidate_submission_values(instance.submission_id)
@@ -6,7 +6,10 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from openforms.variables.base import BaseStaticVariable
-from openforms.variables.constants import FormVariableDataTypes
+from openforms.variables.constants import (
+    FormVariableDataTypes,
+    StaticVariableVolatility,
+)
 from openforms.variables.registry import register_static_variable
 
 from ..constants import AuthAttribute
@@ -20,6 +23,7 @@ if TYPE_CHECKING:
 class SubmissionID(BaseStaticVariable):
     name = _("Internal ID")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return str(submission.uuid) if submission else ""
@@ -37,6 +41,7 @@ class SubmissionID(BaseStaticVariable):
 class LanguageCode(BaseStaticVariable):
     name = _("Language code")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return submission.language_code if submission else ""
@@ -54,6 +59,7 @@ class LanguageCode(BaseStaticVariable):
 class Auth(BaseStaticVariable):
     name = _("Authentication")
     data_type = FormVariableDataTypes.object
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(
         self, submission: Submission | None = None
@@ -82,6 +88,7 @@ class Auth(BaseStaticVariable):
 class AuthType(BaseStaticVariable):
     name = _("Authentication type")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if not submission or not submission.is_authenticated:
@@ -110,6 +117,7 @@ def get_auth_value(submission: Submission | None, attribute: AuthAttribute) -> s
 class AuthBSN(BaseStaticVariable):
     name = _("Authentication BSN")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return get_auth_value(submission, AuthAttribute.bsn)
@@ -131,6 +139,7 @@ class AuthBSN(BaseStaticVariable):
 class AuthKvK(BaseStaticVariable):
     name = _("Authentication KvK")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return get_auth_value(submission, AuthAttribute.kvk)
@@ -152,6 +161,7 @@ class AuthKvK(BaseStaticVariable):
 class AuthPseudo(BaseStaticVariable):
     name = _("Authentication pseudo")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return get_auth_value(submission, AuthAttribute.pseudo)
@@ -164,6 +174,7 @@ class AuthPseudo(BaseStaticVariable):
 class AuthContext(BaseStaticVariable):
     name = _("Authentication context data")
     data_type = FormVariableDataTypes.object
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None):
         if submission is None:
@@ -190,6 +201,7 @@ class AuthContext(BaseStaticVariable):
 class AuthContextSource(BaseStaticVariable):
     name = _("Authentication context data: source")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -209,6 +221,7 @@ class AuthContextSource(BaseStaticVariable):
 class AuthContextLOA(BaseStaticVariable):
     name = _("Authentication context data: level of assurance")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -232,6 +245,7 @@ class AuthContextLOA(BaseStaticVariable):
 class AuthContextRepresenteeType(BaseStaticVariable):
     name = _("Authentication context data: representee identifier type")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -253,6 +267,7 @@ class AuthContextRepresenteeType(BaseStaticVariable):
 class AuthContextRepresenteeIdentifier(BaseStaticVariable):
     name = _("Authentication context data: representee identifier")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -274,6 +289,7 @@ class AuthContextRepresenteeIdentifier(BaseStaticVariable):
 class AuthContextLegalSubjectIdentifierType(BaseStaticVariable):
     name = _("Authentication context data: authorizee, legal subject identifier type")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -296,6 +312,7 @@ class AuthContextLegalSubjectIdentifierType(BaseStaticVariable):
 class AuthContextLegalSubjectIdentifier(BaseStaticVariable):
     name = _("Authentication context data: authorizee, legal subject identifier")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -318,6 +335,7 @@ class AuthContextLegalSubjectIdentifier(BaseStaticVariable):
 class AuthContextBranchNumber(BaseStaticVariable):
     name = _("Authentication context data: branch number")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -343,6 +361,7 @@ class AuthContextBranchNumber(BaseStaticVariable):
 class AuthContextActingSubjectIdentifierType(BaseStaticVariable):
     name = _("Authentication context data: authorizee, acting subject identifier type")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -360,6 +379,7 @@ class AuthContextActingSubjectIdentifierType(BaseStaticVariable):
 class AuthContextActingSubjectIdentifier(BaseStaticVariable):
     name = _("Authentication context data: authorizee, acting subject identifier")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         if submission is None or not submission.is_authenticated:
@@ -460,7 +460,12 @@ class AuthPluginLogoutView(UserPassesTestMixin, View):
         plugin = register[auth_info["plugin"]]
         plugin.logout(request=request)
 
-        authentication_logout.send(sender=self.__class__, request=request)
+        authentication_logout.send(
+            sender=self.__class__,
+            request=request,
+            auth_attribute=auth_info["attribute"],
+            auth_value=auth_info["value"],
+        )
 
         return HttpResponseRedirect(reverse("authentication:logout-confirmation"))
 
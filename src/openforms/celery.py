@@ -1,14 +1,22 @@
+import logging
 from pathlib import Path
 
 from django.conf import settings
 
 from celery import Celery, bootsteps
-from celery.signals import worker_ready, worker_shutdown
+from celery.signals import (
+    celeryd_after_setup,
+    worker_process_init,
+    worker_ready,
+    worker_shutdown,
+)
 
 from .setup import setup_env
 
 setup_env()
 
+logger = logging.getLogger(__name__)
+
 app = Celery("open-forms")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.conf.ONCE = {
@@ -61,3 +69,45 @@ def worker_shutdown(**_):
 
 
 app.steps["worker"].add(LivenessProbe)
+
+
+def get_routed_queues() -> set[str]:
+    """
+    Return the names of all the queues that tasks are sent to.
+    """
+    return {settings.CELERY_TASK_DEFAULT_QUEUE} | {
+        route["queue"] for route in settings.CELERY_TASK_ROUTES.values()
+    }
+
+
+@celeryd_after_setup.connect
+def warn_about_unconsumed_queues(sender: str, instance, **_):
+    """
+    Warn when the worker does not consume all the queues the tasks are routed to.
+
+    Dedicated workers per queue are fine, but a deployment that (still) starts its only
+    worker with ``CELERY_WORKER_QUEUE=celery`` silently stops processing the
+    submissions, reports and registrations.
+    """
+    consumed = set(instance.app.amqp.queues.consume_from)
+    if missing := get_routed_queues() - consumed:
+        logger.warning(
+            "Worker %s does not consume the queue(s) %s that tasks are routed to. "
+            "Make sure other workers consume them, otherwise these tasks are never "
+            "processed (see CELERY_WORKER_QUEUE).",
+            sender,
+            ", ".join(sorted(missing)),
+        )
+
+
+@worker_process_init.connect
+def preload_pdf_renderer(**_):
+    """
+    Keep WeasyPrint loaded and initialized in the worker (child) processes.
+    """
+    if not settings.PDF_WORKER_PRELOAD:
+        return
+
+    from openforms.utils.pdf import warm_up
+
+    warm_up()
@@ -118,6 +118,13 @@ CACHES = {
         "BACKEND": "openforms.utils.cache.RequestProxyCache",
         "LOCATION": "default",
     },
+    # values only live in memory for the duration of a request, nothing is persisted
+    "request": {
+        "BACKEND": "openforms.utils.cache.RequestProxyCache",
+        "LOCATION": "dummy",
+        "KEY_PREFIX": "request",
+    },
+    "dummy": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
 #
@@ -215,6 +222,7 @@ INSTALLED_APPS = [
     "openforms.contrib.kvk",
     "openforms.contrib.microsoft.apps.MicrosoftApp",
     "openforms.contrib.objects_api",
+    "openforms.contrib.reference_lists",
     "openforms.dmn",
     "openforms.dmn.contrib.camunda",
     "openforms.registrations",
@@ -629,6 +637,9 @@ MAX_UNTRUSTED_JSON_PARSE_SIZE = config(
 # Perform HTML escaping on user's data-input
 ESCAPE_REGISTRATION_OUTPUT = config("ESCAPE_REGISTRATION_OUTPUT", default=False)
 DISABLE_SENDING_HIDDEN_FIELDS = config("DISABLE_SENDING_HIDDEN_FIELDS", default=False)
+# Maximum number of validation plugin calls (to external services) performed in
+# parallel when validating the submission completion
+VALIDATION_PLUGINS_MAX_WORKERS = config("VALIDATION_PLUGINS_MAX_WORKERS", default=4)
 
 # TODO: convert to feature flags so that newly deployed instances get the new behaviour
 # while staying backwards compatible for existing instances
@@ -785,6 +796,62 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# Route the tasks to a queue per kind of workload, so that e.g. the nightly maintenance
+# jobs or slow registration backends don't delay the processing that end-users are
+# waiting for. By default, a worker consumes all the queues - start dedicated workers
+# for (some of) the queues with the ``CELERY_WORKER_QUEUE`` envvar of
+# ``bin/celery_worker.sh``.
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+# latency-critical steps of the submission processing that end-users are waiting for
+CELERY_USER_FACING_QUEUE = config("CELERY_USER_FACING_QUEUE", default="user-facing")
+# CPU-heavy rendering of the submission reports (PDF)
+CELERY_PDF_QUEUE = config("CELERY_PDF_QUEUE", default="pdf")
+# calls to the (potentially slow) external registration backends
+CELERY_REGISTRATION_QUEUE = config("CELERY_REGISTRATION_QUEUE", default="registration")
+# bulk data removal and cleanup jobs
+CELERY_MAINTENANCE_QUEUE = config("CELERY_MAINTENANCE_QUEUE", default="maintenance")
+
+CELERY_TASK_ROUTES = {
+    **dict.fromkeys(
+        [
+            "openforms.appointments.tasks.maybe_register_appointment",
+            "openforms.registrations.tasks.pre_registration",
+            "openforms.submissions.tasks.finalise_completion",
+            "openforms.submissions.tasks.emails.schedule_emails",
+            "openforms.submissions.tasks.emails.send_confirmation_email",
+            "openforms.submissions.tasks.emails.send_email_cosigner",
+            "openforms.submissions.tasks.user_uploads.cleanup_temporary_files_for",
+        ],
+        {"queue": CELERY_USER_FACING_QUEUE},
+    ),
+    "openforms.submissions.tasks.pdf.generate_submission_report": {
+        "queue": CELERY_PDF_QUEUE
+    },
+    **dict.fromkeys(
+        [
+            "openforms.registrations.tasks.register_submission",
+            "openforms.payments.tasks.update_submission_payment_status",
+        ],
+        {"queue": CELERY_REGISTRATION_QUEUE},
+    ),
+    **dict.fromkeys(
+        [
+            "openforms.data_removal.tasks.delete_submissions",
+            "openforms.data_removal.tasks.make_sensitive_data_anonymous",
+            "openforms.submissions.tasks.user_uploads.cleanup_unclaimed_temporary_files",
+            "openforms.submissions.tasks.cleanup.cleanup_on_completion_results",
+            "openforms.utils.tasks.clear_session_store",
+            "openforms.utils.tasks.cleanup_csp_reports",
+            "openforms.forms.admin.tasks.clear_forms_export",
+            "openforms.emails.tasks.send_email_digest",
+            "openforms.authentication.tasks.update_saml_metadata",
+            "log_outgoing_requests.tasks.prune_logs",
+            "django_yubin.tasks.delete_old_emails",
+        ],
+        {"queue": CELERY_MAINTENANCE_QUEUE},
+    ),
+}
+
 RETRY_SUBMISSIONS_TIME_LIMIT = config(
     "RETRY_SUBMISSIONS_TIME_LIMIT", default=48  # hours
 )
@@ -801,6 +868,33 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 CELERY_ONCE_REDIS_URL = config("CELERY_ONCE_REDIS_URL", CELERY_BROKER_URL)
 
+# Import and initialize WeasyPrint when the worker processes start rather than while
+# rendering the first PDF. Enable this for the workers generating the submission
+# reports.
+PDF_WORKER_PRELOAD = config("PDF_WORKER_PRELOAD", default=False)
+
+# Maximum number of seconds the submission status endpoint may wait for the processing
+# to progress before responding (long-polling). Every waiting request occupies a
+# web server worker/thread, so size them accordingly. Disabled by default.
+SUBMISSION_STATUS_MAX_WAIT = config("SUBMISSION_STATUS_MAX_WAIT", default=0)
+
+# Cache the values retrieved by these prefill plugins (comma separated identifiers, e.g.
+# "haalcentraal,stufbg,kvk-kvknumber") for the authenticated user, so that restarting a
+# form or starting another form doesn't fetch them again. The values are encrypted and
+# discarded when the user logs out or after PREFILL_CACHE_TIMEOUT seconds.
+PREFILL_CACHE_PLUGINS = config("PREFILL_CACHE_PLUGINS", split=True, default=[])
+PREFILL_CACHE_TIMEOUT = config("PREFILL_CACHE_TIMEOUT", default=5 * 60)
+
+# Look up the addresses for the postcode and house number autocomplete in the local
+# index imported with the `import_bag_addresses` management command, before falling
+# back to the BAG API.
+BAG_LOCAL_ADDRESS_INDEX = config("BAG_LOCAL_ADDRESS_INDEX", default=False)
+
+# Path to the reverse geocoding index built with the `build_reverse_geocoding_index`
+# management command, to look up the address nearest to the location selected in the
+# map component locally before falling back to the Locatieserver.
+BAG_REVERSE_GEOCODING_INDEX = config("BAG_REVERSE_GEOCODING_INDEX", default="")
+
 #
 # DJANGO-CORS-MIDDLEWARE
 #
@@ -1009,6 +1103,10 @@ ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
 
 ZGW_CONSUMERS_IGNORE_OAS_FIELDS = True
 
+# Upload large documents in parts (bestandsdelen) to the Documenten API rather than
+# in a single request. Requires Documenten API 1.1 or newer.
+DOCUMENTEN_API_UPLOAD_IN_PARTS = config("DOCUMENTEN_API_UPLOAD_IN_PARTS", default=False)
+
 #
 # Django Solo
 #
@@ -0,0 +1,131 @@
+"""
+Local index of the BAG addresses, for the postcode and house number lookups.
+
+The address autocomplete is called for (nearly) every address entered in a form. With
+the ``BAG_LOCAL_ADDRESS_INDEX`` setting enabled, the addresses are looked up in the
+:class:`openforms.contrib.kadaster.models.BAGAddress` table first, which is populated
+from a BAG extract with the ``import_bag_addresses`` management command. The BAG API is
+only called for addresses that are not in the (possibly outdated) extract.
+
+Both CSV files and GeoPackages (e.g. the "BAG light" extract of PDOK) with the columns
+in :data:`COLUMNS` are supported. The location of the addresses (in Rijksdriehoek
+coordinates) is read from the ``x`` and ``y`` columns of a CSV file, or from the
+geometry column of a GeoPackage.
+"""
+
+import csv
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing
+from itertools import batched
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.gis.geos import GEOSException, GEOSGeometry
+from django.db import transaction
+
+from .clients.bag import AddressResult, build_address_result
+from .models import BAGAddress
+
+# column in the extract -> model field
+COLUMNS = {
+    "postcode": "postcode",
+    "huisnummer": "house_number",
+    "huisletter": "house_letter",
+    "toevoeging": "house_number_addition",
+    "openbare_ruimte_naam": "street_name",
+    "woonplaats_naam": "city",
+}
+
+
+def lookup_local_address(postcode: str, house_number: str) -> AddressResult | None:
+    """
+    Look up the address in the local index.
+
+    :returns: the address, or ``None`` if the index is disabled or doesn't contain the
+      address.
+    """
+    if not settings.BAG_LOCAL_ADDRESS_INDEX or not house_number.isdigit():
+        return None
+
+    # like the BAG API, return the first of the addresses with a house letter and/or
+    # addition
+    address = (
+        BAGAddress.objects.filter(
+            postcode=postcode.upper().replace(" ", ""),
+            house_number=int(house_number),
+        )
+        .order_by("house_letter", "house_number_addition")
+        .values_list("street_name", "city")
+        .first()
+    )
+    if address is None:
+        return None
+
+    street_name, city = address
+    return build_address_result(postcode, house_number, city, street_name)
+
+
+def read_csv(path: Path) -> Iterator[dict[str, str]]:
+    with path.open(newline="", encoding="utf-8-sig") as infile:
+        yield from csv.DictReader(infile)
+
+
+def _parse_geopackage_point(blob: bytes | None) -> tuple[float, float] | None:
+    # GeoPackage binary: "GP" magic, version, flags, SRS ID and an optional envelope,
+    # followed by the well-known binary (WKB) geometry
+    if not blob or blob[:2] != b"GP" or blob[3] & 0b10000:  # empty geometry
+        return None
+    envelope_sizes = (0, 32, 48, 48, 64)
+    if (envelope := (blob[3] >> 1) & 0b111) >= len(envelope_sizes):
+        return None
+    try:
+        geometry = GEOSGeometry(memoryview(blob[8 + envelope_sizes[envelope] :]))
+    except (GEOSException, ValueError):
+        return None
+    point = geometry if geometry.geom_type == "Point" else geometry.centroid
+    return point.x, point.y
+
+
+def read_geopackage(
+    path: Path, table: str, geometry_column: str = ""
+) -> Iterator[dict[str, str]]:
+    # a GeoPackage is an SQLite database
+    with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as connection:
+        connection.row_factory = sqlite3.Row
+        columns = [f'"{column}"' for column in COLUMNS]
+        if geometry_column:
+            columns.append(f'"{geometry_column}" AS geometry')
+        for row in connection.execute(f'SELECT {", ".join(columns)} FROM "{table}"'):
+            record = {column: row[column] for column in COLUMNS}
+            if geometry_column and (point := _parse_geopackage_point(row["geometry"])):
+                record["x"], record["y"] = point
+            yield record
+
+
+def _to_address(record: dict[str, str]) -> BAGAddress:
+    values = {field: record.get(column) or "" for column, field in COLUMNS.items()}
+    values["postcode"] = values["postcode"].upper().replace(" ", "")
+    values["house_number"] = int(values["house_number"])
+    if record.get("x") and record.get("y"):
+        values["rd_x"], values["rd_y"] = float(record["x"]), float(record["y"])
+    return BAGAddress(**values)
+
+
+@transaction.atomic
+def import_addresses(records: Iterator[dict[str, str]], batch_size: int = 5000) -> int:
+    """
+    Replace the addresses in the local index with the given records.
+
+    Records without a postcode (e.g. of buildings without an address) are skipped.
+
+    :returns: the number of imported addresses.
+    """
+    BAGAddress.objects.all().delete()
+
+    count = 0
+    addresses = (_to_address(record) for record in records if record.get("postcode"))
+    for batch in batched(addresses, batch_size):
+        BAGAddress.objects.bulk_create(batch)
+        count += len(batch)
+    return count
@@ -16,7 +16,9 @@ from openforms.api.views.mixins import ListMixin
 from openforms.contrib.kadaster.clients.bag import AddressResult
 from openforms.submissions.api.permissions import AnyActiveSubmissionPermission
 
+from ..address_index import lookup_local_address
 from ..clients import get_bag_client, get_locatieserver_client
+from ..reverse_geocoding import reverse_geocode
 from .serializers import (
     AddressSearchResultSerializer,
     GetStreetNameAndCityViewInputSerializer,
@@ -34,6 +36,8 @@ ADDRESS_AUTOCOMPLETE_CACHE_TIMEOUT = (
 
 
 def lookup_address(postcode: str, number: str) -> AddressResult | None:
+    if address := lookup_local_address(postcode, number):
+        return address
     with get_bag_client() as client:
         return client.get_address(postcode, number)
 
@@ -123,12 +127,12 @@ class LatLngSearchView(APIView):
         input_serializer = LatLngSearchInputSerializer(data=request.GET)
         input_serializer.is_valid(raise_exception=True)
 
-        client = get_locatieserver_client()
-        with client:
-            label = client.reverse_address_search(
-                input_serializer.validated_data["lat"],
-                input_serializer.validated_data["lng"],
-            )
+        lat = input_serializer.validated_data["lat"]
+        lng = input_serializer.validated_data["lng"]
+        if not (label := reverse_geocode(lat, lng)):
+            client = get_locatieserver_client()
+            with client:
+                label = client.reverse_address_search(lat, lng)
 
         if not label:
             return Response(status=status.HTTP_204_NO_CONTENT)
@@ -17,6 +17,25 @@ class AddressResult:
     secret_street_city: str = ""
 
 
+def build_address_result(
+    postcode: str, house_number: str, city: str = "", street_name: str = ""
+) -> AddressResult:
+    secret_street_city = salt_location_message(
+        {
+            "postcode": postcode.upper().replace(" ", ""),
+            "number": house_number,
+            "city": city,
+            "street_name": street_name,
+        }
+    )
+
+    return AddressResult(
+        street_name=street_name,
+        city=city,
+        secret_street_city=secret_street_city,
+    )
+
+
 class BAGClient(HALClient):
     """
     Client for the LV BAG API.
@@ -63,17 +82,4 @@ class BAGClient(HALClient):
     def build_address_result(
         self, postcode: str, house_number: str, city: str = "", street_name: str = ""
     ) -> AddressResult:
-        secret_street_city = salt_location_message(
-            {
-                "postcode": postcode.upper().replace(" ", ""),
-                "number": house_number,
-                "city": city,
-                "street_name": street_name,
-            }
-        )
-
-        return AddressResult(
-            street_name=street_name,
-            city=city,
-            secret_street_city=secret_street_city,
-        )
+        return build_address_result(postcode, house_number, city, street_name)
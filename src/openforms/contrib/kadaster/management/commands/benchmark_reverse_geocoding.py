@@ -0,0 +1,86 @@
+"""
+Management command to benchmark the nearest address queries of the reverse geocoding
+index.
+
+The index is built from random points within the bounds of the Netherlands in a
+temporary file, the database and the configured index are not used.
+"""
+
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management import BaseCommand
+
+from ...reverse_geocoding import (
+    DEFAULT_NODE_SIZE,
+    RD_BOUNDS,
+    ReverseGeocodingIndex,
+    build_index,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the nearest address queries of the reverse geocoding index."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--points",
+            type=int,
+            default=10_000_000,
+            help="Number of (random) points in the index.",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=100_000,
+            help="Number of (random) nearest address queries.",
+        )
+        parser.add_argument(
+            "--node-size",
+            type=int,
+            default=DEFAULT_NODE_SIZE,
+            help="Maximum number of points in the leaf nodes of the tree.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, **options):
+        rng = random.Random(options["seed"])
+        min_x, max_x, min_y, max_y = RD_BOUNDS
+
+        def random_point() -> tuple[float, float]:
+            return rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / "index.bin"
+            points = ((pk, *random_point()) for pk in range(options["points"]))
+
+            start = time.perf_counter()
+            build_index(path, points, node_size=options["node_size"])
+            self.stdout.write(
+                f"Built the index of {options['points']} point(s) in "
+                f"{time.perf_counter() - start:.1f}s "
+                f"({path.stat().st_size / 1024 / 1024:.0f} MiB)."
+            )
+
+            index = ReverseGeocodingIndex(path)
+            try:
+                queries = [random_point() for _ in range(options["queries"])]
+                durations = []
+                start = time.perf_counter()
+                for x, y in queries:
+                    query_start = time.perf_counter()
+                    index.nearest(x, y)
+                    durations.append(time.perf_counter() - query_start)
+                elapsed = time.perf_counter() - start
+            finally:
+                index.close()
+
+        self.stdout.write(f"Queries per second: {len(queries) / elapsed:.0f}")
+        self.stdout.write(
+            f"Query time: {statistics.mean(durations) * 1000:.3f}ms (mean), "
+            f"{statistics.quantiles(durations, n=100)[98] * 1000:.3f}ms (p99), "
+            f"{max(durations) * 1000:.3f}ms (max)"
+        )
@@ -0,0 +1,48 @@
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from ...models import BAGAddress
+from ...reverse_geocoding import DEFAULT_NODE_SIZE, build_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the reverse geocoding index from the imported BAG addresses with a "
+        "location. Run this after importing the addresses with import_bag_addresses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help=(
+                "Path of the index file. Defaults to the BAG_REVERSE_GEOCODING_INDEX "
+                "setting."
+            ),
+        )
+        parser.add_argument(
+            "--node-size",
+            type=int,
+            default=DEFAULT_NODE_SIZE,
+            help="Maximum number of points in the leaf nodes of the tree.",
+        )
+
+    def handle(self, **options):
+        if not (path := options["output"] or settings.BAG_REVERSE_GEOCODING_INDEX):
+            raise CommandError(
+                "Specify the --output path or the BAG_REVERSE_GEOCODING_INDEX setting."
+            )
+
+        points = (
+            BAGAddress.objects.filter(rd_x__isnull=False, rd_y__isnull=False)
+            .values_list("pk", "rd_x", "rd_y")
+            .iterator(chunk_size=10_000)
+        )
+        start = time.perf_counter()
+        count = build_index(Path(path), points, node_size=options["node_size"])
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(f"Indexed {count} address(es) in {elapsed:.1f}s.")
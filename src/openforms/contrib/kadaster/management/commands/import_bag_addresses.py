@@ -0,0 +1,64 @@
+import sqlite3
+import time
+from pathlib import Path
+
+from django.core.management import BaseCommand, CommandError
+
+from ...address_index import import_addresses, read_csv, read_geopackage
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the addresses of a BAG extract (CSV or GeoPackage) into the local "
+        "address index, replacing the previously imported addresses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "file", type=Path, help="Path to the CSV (.csv) or GeoPackage (.gpkg) file."
+        )
+        parser.add_argument(
+            "--table",
+            default="verblijfsobject",
+            help="Table of the GeoPackage containing the addresses.",
+        )
+        parser.add_argument(
+            "--geometry-column",
+            default="geom",
+            help=(
+                "Column of the GeoPackage table containing the location of the "
+                "addresses. Pass an empty value to skip the locations."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of addresses to insert per query.",
+        )
+
+    def handle(self, **options):
+        path: Path = options["file"]
+        if not path.is_file():
+            raise CommandError(f"File '{path}' does not exist.")
+
+        match path.suffix.lower():
+            case ".csv":
+                records = read_csv(path)
+            case ".gpkg":
+                records = read_geopackage(
+                    path, options["table"], options["geometry_column"]
+                )
+            case _:
+                raise CommandError(
+                    "Only CSV (.csv) and GeoPackage (.gpkg) files are supported."
+                )
+
+        start = time.perf_counter()
+        try:
+            count = import_addresses(records, batch_size=options["batch_size"])
+        except (ValueError, sqlite3.Error) as exc:
+            raise CommandError(f"Invalid address data: {exc!r}") from exc
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(f"Imported {count} address(es) in {elapsed:.1f}s.")
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.20 on 2026-10-18 23:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kadaster", "0004_alter_kadasterapiconfig_search_service"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BAGAddress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("postcode", models.CharField(max_length=6, verbose_name="postcode")),
+                (
+                    "house_number",
+                    models.PositiveIntegerField(verbose_name="house number"),
+                ),
+                (
+                    "house_letter",
+                    models.CharField(
+                        blank=True, max_length=1, verbose_name="house letter"
+                    ),
+                ),
+                (
+                    "house_number_addition",
+                    models.CharField(
+                        blank=True, max_length=4, verbose_name="house number addition"
+                    ),
+                ),
+                (
+                    "street_name",
+                    models.CharField(max_length=80, verbose_name="street name"),
+                ),
+                ("city", models.CharField(max_length=80, verbose_name="city")),
+            ],
+            options={
+                "verbose_name": "BAG address",
+                "verbose_name_plural": "BAG addresses",
+                "indexes": [
+                    models.Index(
+                        fields=["postcode", "house_number"],
+                        name="kadaster_bag_postcode_number",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.20 on 2026-10-18 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kadaster", "0005_bagaddress"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bagaddress",
+            name="rd_x",
+            field=models.FloatField(
+                blank=True,
+                help_text="Rijksdriehoek (EPSG:28992) x",
+                null=True,
+                verbose_name="x",
+            ),
+        ),
+        migrations.AddField(
+            model_name="bagaddress",
+            name="rd_y",
+            field=models.FloatField(
+                blank=True,
+                help_text="Rijksdriehoek (EPSG:28992) y",
+                null=True,
+                verbose_name="y",
+            ),
+        ),
+    ]
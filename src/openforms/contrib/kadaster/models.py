@@ -61,3 +61,49 @@ class KadasterApiConfig(SingletonModel):
 
     class Meta:
         verbose_name = _("Kadaster API configuration")
+
+
+class BAGAddress(models.Model):
+    """
+    Address from a BAG extract, imported with the ``import_bag_addresses`` command.
+
+    The local index answers the postcode and house number lookups without calling the
+    BAG API, see the ``BAG_LOCAL_ADDRESS_INDEX`` setting. The addresses with a location
+    can be used for reverse geocoding, see the ``BAG_REVERSE_GEOCODING_INDEX`` setting.
+    """
+
+    postcode = models.CharField(_("postcode"), max_length=6)
+    house_number = models.PositiveIntegerField(_("house number"))
+    house_letter = models.CharField(_("house letter"), max_length=1, blank=True)
+    house_number_addition = models.CharField(
+        _("house number addition"), max_length=4, blank=True
+    )
+    street_name = models.CharField(_("street name"), max_length=80)
+    city = models.CharField(_("city"), max_length=80)
+    rd_x = models.FloatField(
+        _("x"), null=True, blank=True, help_text=_("Rijksdriehoek (EPSG:28992) x")
+    )
+    rd_y = models.FloatField(
+        _("y"), null=True, blank=True, help_text=_("Rijksdriehoek (EPSG:28992) y")
+    )
+
+    class Meta:
+        verbose_name = _("BAG address")
+        verbose_name_plural = _("BAG addresses")
+        indexes = [
+            models.Index(
+                fields=["postcode", "house_number"],
+                name="kadaster_bag_postcode_number",
+            )
+        ]
+
+    def __str__(self):
+        return self.label
+
+    @property
+    def label(self) -> str:
+        # formatted like the display name (weergavenaam) of the Locatieserver
+        number = f"{self.house_number}{self.house_letter}"
+        if self.house_number_addition:
+            number = f"{number}-{self.house_number_addition}"
+        return f"{self.street_name} {number}, {self.postcode} {self.city}"
@@ -0,0 +1,248 @@
+"""
+Local reverse geocoding of the BAG addresses, for the map component.
+
+Every location selected in the map component is looked up to display the nearest
+address. With the ``BAG_REVERSE_GEOCODING_INDEX`` setting pointing to an index file
+(built with the ``build_reverse_geocoding_index`` management command from the
+imported BAG addresses), the nearest address is found locally, falling back to the
+Locatieserver if the index is not available.
+
+The index is a static k-d tree over the Rijksdriehoek (EPSG:28992) coordinates of the
+addresses, stored as flat arrays in a single file. The file is memory-mapped read-only,
+so it's loaded lazily by the operating system and shared between all processes of the
+web server, rather than being read into the memory of every process. The (WGS84)
+coordinates of the map component are converted to Rijksdriehoek coordinates, in which
+the distances are in metres.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+from django.conf import settings
+
+from .models import BAGAddress
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OFRG"
+VERSION = 1
+# magic, version, number of points, node size and padding (to align the arrays)
+HEADER = struct.Struct("<4sIQI4x")
+DEFAULT_NODE_SIZE = 64
+
+# bounds of the Rijksdriehoek coordinate system, the approximation of the conversion
+# from WGS84 is not valid outside of the Netherlands
+RD_BOUNDS = (-7_000, 289_000, 300_000, 629_000)
+
+# Coefficients of the approximated conversion from WGS84 to Rijksdriehoek coordinates
+# (Schreutelkamp and Strang van Hees), as (p, q, coefficient) for the terms
+# coefficient * dlat^p * dlng^q. The error is below one metre.
+_RD_X_TERMS = (
+    (0, 1, 190094.945),
+    (1, 1, -11832.228),
+    (2, 1, -114.221),
+    (0, 3, -32.391),
+    (1, 0, -0.705),
+    (3, 1, -2.340),
+    (1, 3, -0.608),
+    (0, 2, -0.008),
+    (2, 3, 0.148),
+)
+_RD_Y_TERMS = (
+    (1, 0, 309056.544),
+    (0, 2, 3638.893),
+    (2, 0, 73.077),
+    (1, 2, -157.984),
+    (3, 0, 59.788),
+    (0, 1, 0.433),
+    (2, 2, -6.439),
+    (1, 1, -0.032),
+    (0, 4, 0.092),
+    (1, 4, -0.054),
+)
+
+
+def wgs84_to_rd(lat: float, lng: float) -> tuple[float, float]:
+    dlat = 0.36 * (lat - 52.15517440)
+    dlng = 0.36 * (lng - 5.38720621)
+    x = 155000 + sum(c * dlat**p * dlng**q for p, q, c in _RD_X_TERMS)
+    y = 463000 + sum(c * dlat**p * dlng**q for p, q, c in _RD_Y_TERMS)
+    return x, y
+
+
+def _within_bounds(x: float, y: float) -> bool:
+    min_x, max_x, min_y, max_y = RD_BOUNDS
+    return min_x <= x <= max_x and min_y <= y <= max_y
+
+
+def build_index(
+    path: Path,
+    points: Iterable[tuple[int, float, float]],
+    node_size: int = DEFAULT_NODE_SIZE,
+) -> int:
+    """
+    Build the index file from the ``(id, x, y)`` points, replacing an existing file.
+
+    The coordinates are stored with centimetre precision. The file is replaced
+    atomically, so that the processes using the old index aren't affected.
+
+    :returns: the number of indexed points.
+    """
+    ids, xs, ys = array("q"), array("i"), array("i")
+    for pk, x, y in points:
+        ids.append(pk)
+        xs.append(round(x * 100))
+        ys.append(round(y * 100))
+
+    # sort the points into an implicit k-d tree: the median point of every range
+    # splits it (alternating on the x and y axis) in two ranges, until the ranges fit
+    # in a leaf node
+    order = list(range(len(ids)))
+
+    def sort_range(lo: int, hi: int, axis: int) -> None:
+        if hi - lo <= node_size:
+            return
+        coordinates = xs if axis == 0 else ys
+        order[lo : hi + 1] = sorted(order[lo : hi + 1], key=coordinates.__getitem__)
+        middle = (lo + hi) // 2
+        sort_range(lo, middle - 1, 1 - axis)
+        sort_range(middle + 1, hi, 1 - axis)
+
+    sort_range(0, len(order) - 1, 0)
+
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with temp_path.open("wb") as outfile:
+        outfile.write(HEADER.pack(MAGIC, VERSION, len(order), node_size))
+        for values in (xs, ys, ids):
+            array(values.typecode, (values[index] for index in order)).tofile(outfile)
+    os.replace(temp_path, path)
+    return len(order)
+
+
+class ReverseGeocodingIndex:
+    """
+    Nearest neighbour queries on a (memory-mapped) index file.
+    """
+
+    def __init__(self, path: Path):
+        with path.open("rb") as infile:
+            self._mmap = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, node_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not a (supported) reverse geocoding index.")
+
+        self._view = view = memoryview(self._mmap)
+        offset = HEADER.size
+        self.xs = view[offset : offset + 4 * count].cast("i")
+        self.ys = view[offset + 4 * count : offset + 8 * count].cast("i")
+        self.ids = view[offset + 8 * count : offset + 16 * count].cast("q")
+        self.count = count
+        self.node_size = node_size
+
+    def close(self) -> None:
+        for view in (self.xs, self.ys, self.ids, self._view):
+            view.release()
+        self._mmap.close()
+
+    def nearest(self, x: float, y: float) -> tuple[int, float] | None:
+        """
+        Find the point nearest to the given Rijksdriehoek coordinates.
+
+        :returns: the id of the point and its distance in metres, or ``None`` if the
+          index is empty.
+        """
+        if not self.count:
+            return None
+
+        xs, ys, node_size = self.xs, self.ys, self.node_size
+        qx, qy = x * 100, y * 100
+        best_distance, best_index = math.inf, -1
+
+        # ranges to visit, with the minimal (squared) distance of their points
+        stack = [(0, self.count - 1, 0, 0.0)]
+        while stack:
+            lo, hi, axis, min_distance = stack.pop()
+            if min_distance >= best_distance:
+                continue
+
+            if hi - lo <= node_size:
+                for index in range(lo, hi + 1):
+                    dx, dy = xs[index] - qx, ys[index] - qy
+                    if (distance := dx * dx + dy * dy) < best_distance:
+                        best_distance, best_index = distance, index
+                continue
+
+            middle = (lo + hi) // 2
+            dx, dy = xs[middle] - qx, ys[middle] - qy
+            if (distance := dx * dx + dy * dy) < best_distance:
+                best_distance, best_index = distance, middle
+
+            delta = -dx if axis == 0 else -dy
+            lower, upper = (lo, middle - 1), (middle + 1, hi)
+            near, far = (lower, upper) if delta <= 0 else (upper, lower)
+            # visit the range on the side of the query point first
+            stack.append((*far, 1 - axis, delta * delta))
+            stack.append((*near, 1 - axis, 0.0))
+
+        return self.ids[best_index], math.sqrt(best_distance) / 100
+
+
+_lock = threading.Lock()
+_loaded: tuple[tuple[str, int, int], ReverseGeocodingIndex] | None = None
+
+
+def get_index() -> ReverseGeocodingIndex | None:
+    """
+    Return the configured index, (re-)opening it when the file has been replaced.
+    """
+    global _loaded
+
+    if not (path := settings.BAG_REVERSE_GEOCODING_INDEX):
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    key = (path, stat.st_ino, stat.st_mtime_ns)
+    with _lock:
+        if _loaded is None or _loaded[0] != key:
+            try:
+                index = ReverseGeocodingIndex(Path(path))
+            except (OSError, ValueError) as exc:
+                logger.error("Could not open the reverse geocoding index", exc_info=exc)
+                return None
+            # the old index may still be in use by another thread, it's unmapped once
+            # it's no longer referenced
+            _loaded = (key, index)
+        return _loaded[1]
+
+
+def reverse_geocode(lat: float, lng: float) -> str:
+    """
+    Look up the label of the address nearest to the given location in the local index.
+
+    :returns: the label, or an empty string if the index is not available or the
+      location is outside of the Netherlands.
+    """
+    x, y = wgs84_to_rd(lat, lng)
+    if not _within_bounds(x, y) or (index := get_index()) is None:
+        return ""
+    if (result := index.nearest(x, y)) is None:
+        return ""
+
+    pk, _distance = result
+    address = BAGAddress.objects.filter(pk=pk).first()
+    # the index may be outdated after importing the addresses again
+    return address.label if address else ""
@@ -0,0 +1,209 @@
+import sqlite3
+import struct
+import tempfile
+from contextlib import closing
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.gis.geos import Point
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from openforms.formio.components.utils import salt_location_message
+
+from ..address_index import lookup_local_address
+from ..api.views import lookup_address
+from ..clients.bag import AddressResult
+from ..models import BAGAddress
+
+CSV_EXTRACT = """postcode,huisnummer,huisletter,toevoeging,openbare_ruimte_naam,woonplaats_naam
+1015CJ,117,,,Keizersgracht,Amsterdam
+1015CJ,117,A,,Keizersgracht,Amsterdam
+2514EA,1,,,Lange Voorhout,'s-Gravenhage
+,2,,,Weiland,Ergens
+"""
+
+
+class ImportBAGAddressesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.dir = Path(tempdir.name)
+
+    def test_import_csv(self):
+        BAGAddress.objects.create(
+            postcode="9999ZZ", house_number=1, street_name="Oud", city="Oud"
+        )
+        path = self.dir / "bag.csv"
+        path.write_text(CSV_EXTRACT)
+        stdout = StringIO()
+
+        call_command("import_bag_addresses", path, batch_size=2, stdout=stdout)
+
+        self.assertIn("Imported 3 address(es)", stdout.getvalue())
+        self.assertQuerySetEqual(
+            BAGAddress.objects.order_by("postcode", "house_letter"),
+            [
+                ("1015CJ", 117, "", "Keizersgracht"),
+                ("1015CJ", 117, "A", "Keizersgracht"),
+                ("2514EA", 1, "", "Lange Voorhout"),
+            ],
+            transform=lambda address: (
+                address.postcode,
+                address.house_number,
+                address.house_letter,
+                address.street_name,
+            ),
+        )
+
+    def test_import_geopackage(self):
+        path = self.dir / "bag.gpkg"
+        with closing(sqlite3.connect(path)) as connection, connection:
+            connection.execute(
+                "CREATE TABLE verblijfsobject (postcode, huisnummer, huisletter, "
+                "toevoeging, openbare_ruimte_naam, woonplaats_naam, geom)"
+            )
+            connection.execute(
+                "INSERT INTO verblijfsobject VALUES "
+                "('1015 CJ', 117, NULL, NULL, 'Keizersgracht', 'Amsterdam', x'00')"
+            )
+
+        call_command("import_bag_addresses", path, stdout=StringIO())
+
+        address = BAGAddress.objects.get()
+        self.assertEqual(address.postcode, "1015CJ")
+        self.assertEqual(address.house_number, 117)
+        self.assertEqual(address.house_letter, "")
+        self.assertEqual(str(address), "Keizersgracht 117, 1015CJ Amsterdam")
+
+    def test_import_locations(self):
+        csv_path = self.dir / "bag.csv"
+        csv_path.write_text(
+            "postcode,huisnummer,huisletter,toevoeging,openbare_ruimte_naam,"
+            "woonplaats_naam,x,y\n"
+            "1015CJ,117,,,Keizersgracht,Amsterdam,120936.5,487627.25\n"
+            "2514EA,1,,,Lange Voorhout,'s-Gravenhage,,\n"
+        )
+        gpkg_path = self.dir / "bag.gpkg"
+        point = Point(120936.5, 487627.25, srid=28992)
+        # GeoPackage binary header: magic, version, flags (little endian, with an
+        # envelope of four doubles), SRS ID and the envelope
+        header = b"GP\x00\x03" + struct.pack("<i4d", 28992, *point.extent)
+        with closing(sqlite3.connect(gpkg_path)) as connection, connection:
+            connection.execute(
+                "CREATE TABLE verblijfsobject (postcode, huisnummer, huisletter, "
+                "toevoeging, openbare_ruimte_naam, woonplaats_naam, geom)"
+            )
+            connection.execute(
+                "INSERT INTO verblijfsobject VALUES "
+                "('1015CJ', 117, NULL, NULL, 'Keizersgracht', 'Amsterdam', ?)",
+                [header + bytes(point.wkb)],
+            )
+
+        for path in (gpkg_path, csv_path):
+            with self.subTest(path=path.name):
+                call_command("import_bag_addresses", path, stdout=StringIO())
+
+                address = BAGAddress.objects.get(postcode="1015CJ")
+                self.assertEqual((address.rd_x, address.rd_y), (120936.5, 487627.25))
+
+        # imported last
+        without_location = BAGAddress.objects.filter(postcode="2514EA")
+        self.assertEqual(without_location.values_list("rd_x", flat=True).get(), None)
+
+    def test_invalid_files(self):
+        with self.subTest("missing file"):
+            with self.assertRaises(CommandError):
+                call_command("import_bag_addresses", self.dir / "missing.csv")
+
+        with self.subTest("unsupported format"):
+            path = self.dir / "bag.json"
+            path.write_text("[]")
+
+            with self.assertRaises(CommandError):
+                call_command("import_bag_addresses", path)
+
+        with self.subTest("missing column"):
+            path = self.dir / "invalid.csv"
+            path.write_text("postcode,straat\n1015CJ,Keizersgracht\n")
+
+            with self.assertRaises(CommandError):
+                call_command("import_bag_addresses", path)
+
+
+class LocalAddressLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        BAGAddress.objects.bulk_create(
+            [
+                BAGAddress(
+                    postcode="1015CJ",
+                    house_number=117,
+                    house_letter="A",
+                    street_name="Keizersgracht",
+                    city="Amsterdam",
+                ),
+                BAGAddress(
+                    postcode="1015CJ",
+                    house_number=117,
+                    street_name="Keizersgracht",
+                    city="Amsterdam",
+                ),
+            ]
+        )
+
+    @override_settings(BAG_LOCAL_ADDRESS_INDEX=True)
+    def test_lookup(self):
+        with self.assertNumQueries(1):
+            address = lookup_local_address("1015 cj", "117")
+
+        self.assertEqual(
+            address,
+            AddressResult(
+                street_name="Keizersgracht",
+                city="Amsterdam",
+                secret_street_city=salt_location_message(
+                    {
+                        "postcode": "1015CJ",
+                        "number": "117",
+                        "city": "Amsterdam",
+                        "street_name": "Keizersgracht",
+                    }
+                ),
+            ),
+        )
+
+    @override_settings(BAG_LOCAL_ADDRESS_INDEX=True)
+    def test_address_not_in_index(self):
+        self.assertIsNone(lookup_local_address("1015CJ", "118"))
+        self.assertIsNone(lookup_local_address("1015CJ", "117A"))
+
+    @override_settings(BAG_LOCAL_ADDRESS_INDEX=False)
+    def test_index_disabled(self):
+        with self.assertNumQueries(0):
+            self.assertIsNone(lookup_local_address("1015CJ", "117"))
+
+    @override_settings(BAG_LOCAL_ADDRESS_INDEX=True)
+    @patch("openforms.contrib.kadaster.api.views.get_bag_client")
+    def test_bag_api_is_fallback(self, m_get_bag_client):
+        client = m_get_bag_client.return_value.__enter__.return_value
+        client.get_address.return_value = AddressResult(
+            street_name="Keizersgracht", city="Amsterdam"
+        )
+
+        with self.subTest("address in index"):
+            address = lookup_address("1015CJ", "117")
+
+            assert address is not None
+            self.assertEqual(address.street_name, "Keizersgracht")
+            client.get_address.assert_not_called()
+
+        with self.subTest("address not in index"):
+            lookup_address("1015CJ", "119")
+
+            client.get_address.assert_called_once_with("1015CJ", "119")
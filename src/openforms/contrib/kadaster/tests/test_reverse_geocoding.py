@@ -0,0 +1,198 @@
+import math
+import os
+import random
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.submissions.tests.mixins import SubmissionsMixin
+
+from ..models import BAGAddress
+from ..reverse_geocoding import (
+    RD_BOUNDS,
+    ReverseGeocodingIndex,
+    build_index,
+    get_index,
+    reverse_geocode,
+    wgs84_to_rd,
+)
+
+
+class TempDirMixin:
+    def setUp(self):
+        super().setUp()  # type: ignore
+
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)  # type: ignore
+        self.dir = Path(tempdir.name)
+
+
+class WGS84ToRDTests(SimpleTestCase):
+    def test_conversion(self):
+        cases = (
+            # Onze Lieve Vrouwetoren, Amersfoort (origin of the RD coordinates)
+            ((52.15517440, 5.38720621), (155000, 463000)),
+            # Dam, Amsterdam
+            ((52.373169, 4.890660), (121186, 487370)),
+            # Grote Markt, Groningen
+            ((53.219383, 6.566502), (233770, 582063)),
+        )
+
+        for (lat, lng), (expected_x, expected_y) in cases:
+            with self.subTest(lat=lat, lng=lng):
+                x, y = wgs84_to_rd(lat, lng)
+
+                self.assertAlmostEqual(x, expected_x, delta=1)
+                self.assertAlmostEqual(y, expected_y, delta=1)
+
+
+class ReverseGeocodingIndexTests(TempDirMixin, SimpleTestCase):
+    def _open_index(self, path: Path) -> ReverseGeocodingIndex:
+        index = ReverseGeocodingIndex(path)
+        self.addCleanup(index.close)
+        return index
+
+    def test_nearest_matches_brute_force(self):
+        rng = random.Random(42)
+        min_x, max_x, min_y, max_y = RD_BOUNDS
+        points = [
+            (pk, rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
+            for pk in range(1, 2001)
+        ]
+        path = self.dir / "index.bin"
+
+        self.assertEqual(build_index(path, points, node_size=4), 2000)
+
+        index = self._open_index(path)
+        for _ in range(200):
+            x, y = rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)
+            expected = min(points, key=lambda p: math.dist((x, y), p[1:]))
+            with self.subTest(x=x, y=y):
+                result = index.nearest(x, y)
+
+                assert result is not None
+                pk, distance = result
+                self.assertEqual(pk, expected[0])
+                self.assertAlmostEqual(
+                    distance, math.dist((x, y), expected[1:]), delta=0.01
+                )
+
+    def test_empty_index(self):
+        path = self.dir / "index.bin"
+        build_index(path, [])
+
+        self.assertIsNone(self._open_index(path).nearest(155000, 463000))
+
+    def test_invalid_file(self):
+        path = self.dir / "index.bin"
+        path.write_bytes(b"not an index" * 10)
+
+        with self.assertRaises(ValueError):
+            ReverseGeocodingIndex(path)
+
+    def test_rebuilt_index_is_reopened(self):
+        path = self.dir / "index.bin"
+        build_index(path, [(1, 155000, 463000)])
+
+        with override_settings(BAG_REVERSE_GEOCODING_INDEX=str(path)):
+            index = get_index()
+            assert index is not None
+            self.assertIs(get_index(), index)
+
+            build_index(path, [(2, 155000, 463000)])
+            # make sure the modification time differs on coarse filesystems
+            os.utime(path, ns=(0, 0))
+            reopened = get_index()
+
+        assert reopened is not None
+        self.assertIsNot(reopened, index)
+        self.assertEqual(reopened.nearest(155000, 463000), (2, 0))
+
+    def test_index_not_configured_or_missing(self):
+        with override_settings(BAG_REVERSE_GEOCODING_INDEX=""):
+            self.assertIsNone(get_index())
+
+        with override_settings(BAG_REVERSE_GEOCODING_INDEX=str(self.dir / "missing")):
+            self.assertIsNone(get_index())
+
+
+class ReverseGeocodeTests(TempDirMixin, SubmissionsMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.keizersgracht = BAGAddress.objects.create(
+            postcode="1015CJ",
+            house_number=117,
+            house_number_addition="1",
+            street_name="Keizersgracht",
+            city="Amsterdam",
+            rd_x=120936.0,
+            rd_y=487627.0,
+        )
+        BAGAddress.objects.create(
+            postcode="3511LX",
+            house_number=1,
+            street_name="Domplein",
+            city="Utrecht",
+            rd_x=136879.0,
+            rd_y=455912.0,
+        )
+        BAGAddress.objects.create(
+            postcode="9999ZZ",
+            house_number=1,
+            street_name="Zonder locatie",
+            city="Ergens",
+        )
+
+        path = self.dir / "index.bin"
+        stdout = StringIO()
+        call_command("build_reverse_geocoding_index", output=path, stdout=stdout)
+        self.assertIn("Indexed 2 address(es)", stdout.getvalue())
+
+        patcher = override_settings(BAG_REVERSE_GEOCODING_INDEX=str(path))
+        patcher.enable()
+        self.addCleanup(patcher.disable)
+
+    def test_reverse_geocode(self):
+        self.assertEqual(
+            reverse_geocode(52.3756, 4.8857), "Keizersgracht 117-1, 1015CJ Amsterdam"
+        )
+        self.assertEqual(reverse_geocode(52.0907, 5.1214), "Domplein 1, 3511LX Utrecht")
+
+    def test_outside_of_the_netherlands(self):
+        self.assertEqual(reverse_geocode(48.8584, 2.2945), "")
+
+    def test_address_deleted_after_building_index(self):
+        self.keizersgracht.delete()
+
+        self.assertEqual(reverse_geocode(52.3756, 4.8857), "")
+
+    @patch("openforms.contrib.kadaster.api.views.get_locatieserver_client")
+    def test_locatieserver_is_fallback(self, m_get_client):
+        client = m_get_client.return_value
+        client.reverse_address_search.return_value = "Rue de Paris"
+        self._add_submission_to_session(SubmissionFactory.create())
+        url = reverse("api:geo:latlng-search")
+
+        with self.subTest("address in index"):
+            response = self.client.get(url, {"lat": "52.3756", "lng": "4.8857"})
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                response.json(), {"label": "Keizersgracht 117-1, 1015CJ Amsterdam"}
+            )
+            client.reverse_address_search.assert_not_called()
+
+        with self.subTest("location outside of the index"):
+            response = self.client.get(url, {"lat": "48.8584", "lng": "2.2945"})
+
+            self.assertEqual(response.json(), {"label": "Rue de Paris"})
+            client.reverse_address_search.assert_called_once_with(48.8584, 2.2945)
@@ -10,6 +10,7 @@ from requests.exceptions import RequestException
 from openforms.contrib.objects_api.clients import ObjectsClient
 from openforms.logging import logevent
 from openforms.prefill.base import BasePlugin as BasePrefillPlugin
+from openforms.prefill.coalescing import coalesced
 from openforms.registrations.base import BasePlugin as BaseRegistrationPlugin
 from openforms.submissions.models import Submission
 
@@ -42,7 +43,11 @@ def validate_object_ownership(
 
     object = None
     try:
-        object = client.get_object(submission.initial_data_reference)
+        object = coalesced(
+            ("objects_api", client.base_url, submission.initial_data_reference),
+            client.get_object,
+            submission.initial_data_reference,
+        )
     except RequestException as e:
         logger.exception(
             "Something went wrong while trying to retrieve "
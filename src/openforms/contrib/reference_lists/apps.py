@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class ReferenceListsConfig(AppConfig):
+    name = "openforms.contrib.reference_lists"
+    label = "reference_lists"
+    verbose_name = _("Reference lists")
@@ -0,0 +1,139 @@
+"""
+Stale-while-revalidate cache of the Reference Lists API tables and their items.
+
+The options of reference lists components are looked up in every dynamic configuration
+pass of a form. The table and its items are cached per service, table code and language.
+An entry is fresh for ``REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT`` seconds, after which it
+is still served (for up to ``REFERENCE_LISTS_STALE_CACHE_TIMEOUT`` seconds) while a
+Celery task refreshes it in the background. Only a cold cache blocks on the upstream
+service - the tables used by a form are prewarmed when the form is activated.
+
+Every entry carries a version, a digest of its contents, which changes when the table or
+its items are modified upstream.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from zgw_consumers.client import build_client
+from zgw_consumers.models import Service
+
+from .client import (
+    REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT,
+    ReferenceListsClient,
+    Table,
+    TableItem,
+)
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_LISTS_STALE_CACHE_TIMEOUT = 24 * 60 * 60
+REFRESH_LOCK_TIMEOUT = 60
+
+
+@dataclass
+class CachedTable:
+    table: Table | None
+    items: list[TableItem]
+    version: str
+    fetched_at: datetime
+
+    @property
+    def is_stale(self) -> bool:
+        max_age = timedelta(seconds=REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT)
+        return timezone.now() - self.fetched_at >= max_age
+
+
+def _get_cache_key(service_slug: str, code: str, language: str) -> str:
+    return (
+        f"reference_lists|table|service:{service_slug}|code:{code}|language:{language}"
+    )
+
+
+def _get_version(table: Table | None, items: list[TableItem]) -> str:
+    def serialize(obj: Table | TableItem) -> list[str | None]:
+        expires_on = obj.expires_on.isoformat() if obj.expires_on else None
+        return [obj.code, obj.name, expires_on]
+
+    data = [serialize(table) if table else None, [serialize(item) for item in items]]
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+def fetch_table(service: Service, code: str, language: str) -> CachedTable:
+    """
+    Retrieve the table and its items from the API and (re-)populate the cache.
+
+    :raises requests.RequestException: if the API can't be reached or returns an error.
+    """
+    with build_client(service, client_factory=ReferenceListsClient) as client:
+        table = client.get_table(code)
+        # the options of an expired table are not shown, so don't bother retrieving
+        # them. Note that the (cached) ``is_expired`` property is not evaluated here, as
+        # its value would be stored in the cache.
+        if table and table.expires_on and table.expires_on <= timezone.now():
+            items = []
+        else:
+            items = client.get_items_for_table(code, language)
+
+    entry = CachedTable(
+        table=table,
+        items=items,
+        version=_get_version(table, items),
+        fetched_at=timezone.now(),
+    )
+    cache_key = _get_cache_key(service.slug, code, language)
+    previous: CachedTable | None = cache.get(cache_key)
+    if previous is not None and previous.version != entry.version:
+        logger.info(
+            "Table %s of reference lists service %s changed (version %s -> %s)",
+            code,
+            service.slug,
+            previous.version,
+            entry.version,
+        )
+    cache.set(cache_key, entry, timeout=REFERENCE_LISTS_STALE_CACHE_TIMEOUT)
+    return entry
+
+
+def get_cached_table(service_slug: str, code: str, language: str) -> CachedTable | None:
+    """
+    Look up the table and its items in the cache.
+
+    A stale entry is returned as is, and a refresh is scheduled in the background.
+
+    :returns: the cached entry, or ``None`` if the table is not in the cache (yet).
+    """
+    entry: CachedTable | None = cache.get(_get_cache_key(service_slug, code, language))
+    if entry is not None and entry.is_stale:
+        schedule_refresh(service_slug, code, language)
+    return entry
+
+
+def schedule_refresh(service_slug: str, code: str, language: str) -> None:
+    from .tasks import refresh_reference_list
+
+    # only schedule one refresh at a time, the lock is released by the task
+    lock_key = f"{_get_cache_key(service_slug, code, language)}|refreshing"
+    if not cache.add(lock_key, True, timeout=REFRESH_LOCK_TIMEOUT):
+        return
+    transaction.on_commit(
+        partial(refresh_reference_list.delay, service_slug, code, language)
+    )
+
+
+def release_refresh_lock(service_slug: str, code: str, language: str) -> None:
+    cache.delete(f"{_get_cache_key(service_slug, code, language)}|refreshing")
+
+
+def discard_table(service_slug: str, code: str, language: str) -> None:
+    cache.delete(_get_cache_key(service_slug, code, language))
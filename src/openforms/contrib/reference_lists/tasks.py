@@ -0,0 +1,82 @@
+import logging
+
+from django.conf import settings
+
+from requests.exceptions import RequestException
+from zgw_consumers.models import Service
+
+from openforms.celery import app
+from openforms.formio.constants import DataSrcOptions
+from openforms.forms.models import Form
+
+from .cache import discard_table, fetch_table, release_refresh_lock
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def refresh_reference_list(service_slug: str, code: str, language: str) -> None:
+    """
+    Refresh the cached table and items, which are served stale in the meantime.
+    """
+    try:
+        service = Service.objects.get(slug=service_slug)
+    except Service.DoesNotExist:
+        # don't keep serving the options of a service that no longer exists
+        discard_table(service_slug, code, language)
+        release_refresh_lock(service_slug, code, language)
+        return
+
+    try:
+        fetch_table(service, code, language)
+    except RequestException as exc:
+        logger.warning(
+            "Refreshing table %s of reference lists service %s failed",
+            code,
+            service_slug,
+            exc_info=exc,
+        )
+    finally:
+        release_refresh_lock(service_slug, code, language)
+
+
+@app.task(ignore_result=True)
+def prewarm_reference_lists(form_id: int) -> None:
+    """
+    Populate the cache with the reference lists tables used by the form.
+    """
+    form = Form.objects.get(pk=form_id)
+
+    tables: set[tuple[str, str]] = set()
+    for component in form.iter_components():
+        open_forms = component.get("openForms", {})
+        if open_forms.get("dataSrc") != DataSrcOptions.reference_lists:
+            continue
+        if (service_slug := open_forms.get("service")) and (
+            code := open_forms.get("code")
+        ):
+            tables.add((service_slug, code))
+    if not tables:
+        return
+
+    services = Service.objects.in_bulk(
+        {service_slug for service_slug, _ in tables}, field_name="slug"
+    )
+    languages = (
+        [code for code, _ in settings.LANGUAGES]
+        if form.translation_enabled
+        else [settings.LANGUAGE_CODE]
+    )
+    for service_slug, code in sorted(tables):
+        if (service := services.get(service_slug)) is None:
+            continue
+        for language in languages:
+            try:
+                fetch_table(service, code, language)
+            except RequestException as exc:
+                logger.warning(
+                    "Prewarming table %s of reference lists service %s failed",
+                    code,
+                    service_slug,
+                    exc_info=exc,
+                )
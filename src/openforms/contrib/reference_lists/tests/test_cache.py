@@ -0,0 +1,179 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import requests_mock
+from freezegun import freeze_time
+from requests import RequestException
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.formio.constants import DataSrcOptions
+from openforms.forms.tests.factories import FormFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ..cache import fetch_table, get_cached_table
+from ..tasks import prewarm_reference_lists, refresh_reference_list
+
+API_ROOT = "https://reference-lists.example.com/api/v1/"
+
+
+def _paginated(*results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+@requests_mock.Mocker()
+class ReferenceListsCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.service = ServiceFactory.create(
+            api_root=API_ROOT, slug="reference-lists", auth_type=AuthTypes.no_auth
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
+    def _mock_table(self, m, *items: tuple[str, str]):
+        m.get(
+            f"{API_ROOT}tabellen?code=tabel1",
+            json=_paginated({"code": "tabel1", "naam": "Tabel 1"}),
+        )
+        m.get(
+            f"{API_ROOT}items?tabel__code=tabel1",
+            json=_paginated(*({"code": code, "naam": name} for code, name in items)),
+        )
+
+    def test_fetched_table_is_cached(self, m):
+        self._mock_table(m, ("option1", "Option 1"))
+
+        fetched = fetch_table(self.service, "tabel1", "nl")
+        cached = get_cached_table("reference-lists", "tabel1", "nl")
+
+        assert cached is not None
+        self.assertEqual(cached.version, fetched.version)
+        assert cached.table is not None
+        self.assertEqual(cached.table.name, "Tabel 1")
+        self.assertEqual([item.code for item in cached.items], ["option1"])
+        self.assertEqual(m.last_request.headers["Accept-Language"], "nl")
+        self.assertIsNone(get_cached_table("reference-lists", "tabel1", "en"))
+
+    def test_version_changes_with_contents(self, m):
+        self._mock_table(m, ("option1", "Option 1"))
+        original = fetch_table(self.service, "tabel1", "nl")
+        self.assertEqual(
+            fetch_table(self.service, "tabel1", "nl").version, original.version
+        )
+
+        self._mock_table(m, ("option1", "Option 1 (renamed)"))
+        updated = fetch_table(self.service, "tabel1", "nl")
+
+        self.assertNotEqual(updated.version, original.version)
+
+    @patch("openforms.contrib.reference_lists.tasks.refresh_reference_list.delay")
+    def test_stale_entry_is_served_and_refreshed_once(self, m, mock_refresh):
+        self._mock_table(m, ("option1", "Option 1"))
+        with freeze_time("2025-01-01T12:00:00Z"):
+            fetch_table(self.service, "tabel1", "nl")
+
+        with freeze_time("2025-01-01T12:01:00Z"):
+            with self.captureOnCommitCallbacks(execute=True):
+                fresh = get_cached_table("reference-lists", "tabel1", "nl")
+
+            assert fresh is not None
+            self.assertFalse(fresh.is_stale)
+            mock_refresh.assert_not_called()
+
+        with freeze_time("2025-01-01T12:10:00Z"):
+            with self.captureOnCommitCallbacks(execute=True):
+                stale = get_cached_table("reference-lists", "tabel1", "nl")
+                get_cached_table("reference-lists", "tabel1", "nl")
+
+            assert stale is not None
+            self.assertTrue(stale.is_stale)
+            self.assertEqual([item.code for item in stale.items], ["option1"])
+            # no upstream requests are made while serving the stale entry
+            self.assertEqual(m.call_count, 2)
+            mock_refresh.assert_called_once_with("reference-lists", "tabel1", "nl")
+
+    def test_refresh_task_updates_entry(self, m):
+        self._mock_table(m, ("option1", "Option 1"))
+        with freeze_time("2025-01-01T12:00:00Z"):
+            original = fetch_table(self.service, "tabel1", "nl")
+        self._mock_table(m, ("option1", "Option 1"), ("option2", "Option 2"))
+
+        refresh_reference_list("reference-lists", "tabel1", "nl")
+
+        entry = get_cached_table("reference-lists", "tabel1", "nl")
+        assert entry is not None
+        self.assertFalse(entry.is_stale)
+        self.assertNotEqual(entry.version, original.version)
+        self.assertEqual([item.code for item in entry.items], ["option1", "option2"])
+
+    def test_failed_refresh_keeps_stale_entry(self, m):
+        self._mock_table(m, ("option1", "Option 1"))
+        with freeze_time("2025-01-01T12:00:00Z"):
+            original = fetch_table(self.service, "tabel1", "nl")
+        m.get(f"{API_ROOT}tabellen?code=tabel1", exc=RequestException("down"))
+
+        with freeze_time("2025-01-01T12:10:00Z"):
+            with self.assertLogs("openforms.contrib.reference_lists.tasks", "WARNING"):
+                refresh_reference_list("reference-lists", "tabel1", "nl")
+
+            entry = get_cached_table("reference-lists", "tabel1", "nl")
+
+        assert entry is not None
+        self.assertTrue(entry.is_stale)
+        self.assertEqual(entry.version, original.version)
+
+    def test_refresh_of_deleted_service_discards_entry(self, m):
+        self._mock_table(m, ("option1", "Option 1"))
+        fetch_table(self.service, "tabel1", "nl")
+        self.service.delete()
+
+        refresh_reference_list("reference-lists", "tabel1", "nl")
+
+        self.assertIsNone(get_cached_table("reference-lists", "tabel1", "nl"))
+
+    @override_settings(LANGUAGE_CODE="nl")
+    def test_prewarm_form_tables(self, m):
+        self._mock_table(m, ("option1", "Option 1"))
+        component = {
+            "type": "select",
+            "key": "select",
+            "openForms": {
+                "dataSrc": DataSrcOptions.reference_lists,
+                "service": "reference-lists",
+                "code": "tabel1",
+            },
+        }
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={"components": [component]},
+        )
+        translated_form = FormFactory.create(
+            translation_enabled=True,
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={"components": [component]},
+        )
+
+        with self.subTest("default language"):
+            prewarm_reference_lists(form.pk)
+
+            self.assertIsNotNone(get_cached_table("reference-lists", "tabel1", "nl"))
+            self.assertIsNone(get_cached_table("reference-lists", "tabel1", "en"))
+
+        with self.subTest("all languages"):
+            prewarm_reference_lists(translated_form.pk)
+
+            self.assertIsNotNone(get_cached_table("reference-lists", "tabel1", "en"))
+
+    def test_prewarm_form_without_reference_lists(self, m):
+        form = FormFactory.create(generate_minimal_setup=True)
+
+        prewarm_reference_lists(form.pk)
+
+        self.assertFalse(m.called)
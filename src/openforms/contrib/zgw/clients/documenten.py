@@ -1,12 +1,17 @@
+import json
+import os
 from base64 import b64encode
 from typing import BinaryIO, Literal, TypeAlias
+from uuid import uuid4
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 
 from zgw_consumers.nlx import NLXClient
 
 from openforms.translations.utils import to_iso639_2b
 from openforms.utils.date import get_today
+from openforms.utils.streaming import Base64StreamingBody
 
 DocumentStatus: TypeAlias = Literal[
     "in_bewerking",
@@ -15,6 +20,38 @@ DocumentStatus: TypeAlias = Literal[
     "gearchiveerd",
 ]
 
+# documents larger than this (in bytes) are not loaded in memory to create the request
+# body, but are read and encoded while sending the request
+STREAMING_UPLOAD_THRESHOLD = 1024 * 1024
+
+
+def _get_size(content: ContentFile | BinaryIO) -> int:
+    if hasattr(content, "size"):
+        return content.size
+    position = content.tell()
+    size = content.seek(0, os.SEEK_END)
+    content.seek(position)
+    return size - position
+
+
+class Base64JSONBody(Base64StreamingBody):
+    """
+    File-like JSON request body, containing the base64 encoded content of a file.
+
+    The JSON document is identical to the one produced by the ``json`` argument of
+    requests, with the encoded file content as value of ``key``.
+    """
+
+    def __init__(self, data: dict, key: str, content: BinaryIO, size: int):
+        placeholder = f'"{uuid4().hex}"'
+        prefix, suffix = json.dumps({**data, key: placeholder[1:-1]}).split(placeholder)
+        super().__init__(
+            head=f'{prefix}"'.encode(),
+            content=content,
+            size=size,
+            tail=f'"{suffix}'.encode(),
+        )
+
 
 class DocumentenClient(NLXClient):
     def create_document(
@@ -31,11 +68,23 @@ class DocumentenClient(NLXClient):
         received_date: str | None = None,
         description: str = "",
         vertrouwelijkheidaanduiding: str = "",
-    ):
+        upload_in_parts: bool | None = None,
+    ) -> dict:
+        """
+        Create a document (enkelvoudig informatieobject) with the given content.
+
+        Large documents are streamed to the API instead of being loaded in memory. If
+        ``upload_in_parts`` is enabled (it defaults to the
+        ``DOCUMENTEN_API_UPLOAD_IN_PARTS`` setting), they are uploaded in the parts
+        (bestandsdelen) determined by the API instead, which requires version 1.1 or
+        newer of the Documenten API.
+        """
         assert author, "author must be a non-empty string"
+        if upload_in_parts is None:
+            upload_in_parts = settings.DOCUMENTEN_API_UPLOAD_IN_PARTS
+
         today = get_today()
-        file_content = content.read()
-        base64_body = b64encode(file_content).decode()
+        size = _get_size(content)
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -44,21 +93,49 @@ class DocumentenClient(NLXClient):
             "auteur": author,
             "taal": to_iso639_2b(language),
             "formaat": format,
-            "inhoud": base64_body,
+            "inhoud": None,
             "status": status,
             "bestandsnaam": filename,
             "ontvangstdatum": received_date,
             "beschrijving": description,
             "indicatieGebruiksrecht": False,
-            "bestandsomvang": (
-                content.size if hasattr(content, "size") else len(file_content)
-            ),
+            "bestandsomvang": size,
         }
 
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        if size <= STREAMING_UPLOAD_THRESHOLD:
+            data["inhoud"] = b64encode(content.read()).decode()
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
+        elif upload_in_parts:
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
+            response.raise_for_status()
+            document = response.json()
+            self._upload_file_parts(document, content, filename)
+            return document
+        else:
+            response = self.post(
+                "enkelvoudiginformatieobjecten",
+                data=Base64JSONBody(data, "inhoud", content, size),
+                headers={"Content-Type": "application/json"},
+            )
         response.raise_for_status()
 
         return response.json()
+
+    def _upload_file_parts(
+        self, document: dict, content: ContentFile | BinaryIO, filename: str
+    ) -> None:
+        lock = document["lock"]
+        file_parts = sorted(document["bestandsdelen"], key=lambda p: p["volgnummer"])
+        for file_part in file_parts:
+            response = self.put(
+                file_part["url"],
+                data={"lock": lock},
+                files={"inhoud": (filename, content.read(file_part["omvang"]))},
+            )
+            response.raise_for_status()
+
+        response = self.post(f"{document['url']}/unlock", json={"lock": lock})
+        response.raise_for_status()
@@ -0,0 +1,146 @@
+"""
+Unit tests for the Documenten client.
+
+These tests make use of requests-mock rather than VCR, as we're interested in the
+requests being made for large documents rather than the actual API behaviour.
+"""
+
+import json
+from base64 import b64decode, b64encode
+from io import BytesIO
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+
+from ..clients import DocumentenClient
+from ..clients.documenten import Base64JSONBody
+
+
+class ShortReadsIO(BytesIO):
+    def read(self, size=-1):
+        # simulate a raw stream, returning less than requested
+        return super().read(min(size, 1000) if size > 0 else size)
+
+
+class Base64JSONBodyTests(SimpleTestCase):
+    def test_body_matches_json_encoding(self):
+        content = bytes(range(256)) * 1000
+        data = {"titel": "Document é", "inhoud": None, "bestandsomvang": 256000}
+
+        for stream in (BytesIO(content), ShortReadsIO(content)):
+            with self.subTest(stream=stream):
+                body = Base64JSONBody(data, "inhoud", stream, len(content))
+                expected = json.dumps({**data, "inhoud": b64encode(content).decode()})
+
+                result = b"".join(iter(lambda: body.read(5000), b""))
+
+                self.assertEqual(result, expected.encode())
+                self.assertEqual(len(body), len(result))
+
+    def test_empty_content(self):
+        body = Base64JSONBody({"inhoud": None}, "inhoud", BytesIO(), 0)
+
+        self.assertEqual(body.read(), b'{"inhoud": ""}')
+        self.assertEqual(len(body), 14)
+
+
+@patch("openforms.contrib.zgw.clients.documenten.STREAMING_UPLOAD_THRESHOLD", 10)
+class DocumentenClientTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.requests_mock = requests_mock.Mocker()
+        self.requests_mock.start()
+        self.addCleanup(self.requests_mock.stop)
+
+        patcher = patch(
+            "openforms.contrib.zgw.clients.documenten.get_today",
+            return_value="2024-01-01",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create_document(self, content: bytes, **kwargs):
+        client = DocumentenClient(base_url="https://documenten.example.com/api/v1/")
+        with client:
+            return client.create_document(
+                informatieobjecttype="https://catalogi.example.com/api/v1/iot/1",
+                bronorganisatie="000000000",
+                title="Document",
+                author="Aanvrager",
+                language="nl",
+                format="application/pdf",
+                content=BytesIO(content),
+                status="definitief",
+                filename="document.pdf",
+                **kwargs,
+            )
+
+    def test_small_document(self):
+        self.requests_mock.post(
+            "https://documenten.example.com/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={"url": "https://documenten.example.com/api/v1/eio/1"},
+        )
+
+        self._create_document(b"small")
+
+        request_data = self.requests_mock.last_request.json()
+        self.assertEqual(b64decode(request_data["inhoud"]), b"small")
+        self.assertEqual(request_data["bestandsomvang"], 5)
+
+    def test_large_document_is_streamed(self):
+        self.requests_mock.post(
+            "https://documenten.example.com/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={"url": "https://documenten.example.com/api/v1/eio/1"},
+        )
+        content = b"a larger document"
+
+        document = self._create_document(content)
+
+        self.assertEqual(
+            document, {"url": "https://documenten.example.com/api/v1/eio/1"}
+        )
+        request = self.requests_mock.last_request
+        self.assertIsInstance(request.body, Base64JSONBody)
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.headers["Content-Length"], str(len(request.body)))
+        request_data = json.loads(request.body.read())
+        self.assertEqual(b64decode(request_data["inhoud"]), content)
+        self.assertEqual(request_data["bestandsomvang"], len(content))
+        self.assertEqual(request_data["creatiedatum"], "2024-01-01")
+
+    @override_settings(DOCUMENTEN_API_UPLOAD_IN_PARTS=True)
+    def test_large_document_is_uploaded_in_parts(self):
+        eio_url = "https://documenten.example.com/api/v1/eio/1"
+        self.requests_mock.post(
+            "https://documenten.example.com/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={
+                "url": eio_url,
+                "lock": "some-lock",
+                "bestandsdelen": [
+                    {"url": f"{eio_url}/part/2", "volgnummer": 2, "omvang": 7},
+                    {"url": f"{eio_url}/part/1", "volgnummer": 1, "omvang": 10},
+                ],
+            },
+        )
+        self.requests_mock.put(f"{eio_url}/part/1", status_code=200, json={})
+        self.requests_mock.put(f"{eio_url}/part/2", status_code=200, json={})
+        self.requests_mock.post(f"{eio_url}/unlock", status_code=204)
+
+        self._create_document(b"a larger document")
+
+        create, part_1, part_2, unlock = self.requests_mock.request_history
+        create_data = create.json()
+        self.assertIsNone(create_data["inhoud"])
+        self.assertEqual(create_data["bestandsomvang"], 17)
+        self.assertEqual(part_1.url, f"{eio_url}/part/1")
+        self.assertIn(b"a larger d", part_1.body)
+        self.assertIn(b"some-lock", part_1.body)
+        self.assertEqual(part_2.url, f"{eio_url}/part/2")
+        self.assertIn(b"ocument", part_2.body)
+        self.assertEqual(unlock.json(), {"lock": "some-lock"})
@@ -8,6 +8,7 @@ adjacent custom.py module.
 import logging
 from collections.abc import Mapping
 from datetime import time
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from django.core.files.uploadedfile import UploadedFile
@@ -57,7 +58,7 @@ from ..formatters.formio import (
     TimeFormatter,
 )
 from ..registry import BasePlugin, register
-from ..serializers import build_serializer
+from ..serializers import ValidationSchema
 from ..service import as_json_schema
 from ..typing import (
     Component,
@@ -985,14 +986,15 @@ class EditGridField(serializers.Field):
             for item in value
         ]
 
+    @cached_property
+    def schema(self) -> ValidationSchema:
+        # the same for every item, so only compile it once
+        return ValidationSchema(self.components)
+
     def _build_child(self, **kwargs):
-        return build_serializer(
-            components=self.components,
-            # XXX: check out type annotations here, there's some co/contra variance
-            # in play
-            register=self.registry,
-            **kwargs,
-        )
+        # XXX: check out type annotations here, there's some co/contra variance
+        # in play
+        return self.schema.build_serializer(register=self.registry, **kwargs)
 
     def run_child_validation(self, data):
         result = []
@@ -1,17 +1,61 @@
-import re
-from collections import UserDict
-from typing import Iterator, cast
-
-from glom import glom
+import logging
+import threading
+from collections import OrderedDict, UserDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Hashable, Iterable, Iterator, Mapping, NamedTuple, Self
 
 from openforms.typing import DataMapping, VariableValue
 
 from .typing import Component, EditGridComponent, FormioConfiguration
 from .utils import flatten_by_path, is_visible_in_frontend, iter_components
 
+logger = logging.getLogger(__name__)
+
 # TODO: mechanism to wrap/mark root components?
 
-RE_PATH = re.compile(r"(components|columns|rows)\.([0-9]+)")
+type _Path = tuple[str | int, ...]
+
+
+def _to_path(config_path: str) -> _Path:
+    return tuple(int(bit) if bit.isdigit() else bit for bit in config_path.split("."))
+
+
+def _resolve(configuration: FormioConfiguration, path: _Path):
+    node = configuration
+    for bit in path:
+        node = node[bit]
+    return node
+
+
+# the number of distinct (nested) keys to keep parsed in memory, per process
+PATH_CACHE_SIZE = 8192
+
+# a path segment, together with its value as list index (if it is a valid index)
+type _CompiledPath = tuple[tuple[str, int | None], ...]
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _compile_path(key: str) -> _CompiledPath:
+    segments = []
+    for segment in key.split("."):
+        try:
+            index = int(segment)
+        except ValueError:
+            index = None
+        segments.append((segment, index))
+    return tuple(segments)
+
+
+def _get_signature(component: Component) -> tuple:
+    return (
+        component.get("key"),
+        component.get("type"),
+        "components" in component,
+        "columns" in component,
+    )
 
 
 def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Component]:
@@ -34,12 +78,162 @@ def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Compo
     return component_map
 
 
+@dataclass(frozen=True)
+class ConfigurationIndex:
+    """
+    The structure of a Formio configuration, without references to the components.
+
+    The index captures everything needed to (re)build the lookup datastructures of a
+    :class:`FormioConfigurationWrapper` from a configuration with the same structure,
+    which is much cheaper than walking the component tree. Because it only holds
+    paths and keys, it can be shared between wrappers (and thus requests) while each
+    wrapper gets its own datastructures pointing to its own configuration.
+    """
+
+    paths: tuple[str, ...]
+    """
+    The configuration paths of all components, in :func:`flatten_by_path` order.
+    """
+    resolved_paths: tuple[_Path, ...]
+    signatures: tuple[tuple, ...]
+    """
+    The key, type and child containers of each component, to validate the structure.
+    """
+    containers: tuple[tuple[_Path, int], ...]
+    """
+    The paths to the component containers and their expected sizes.
+    """
+    component_map: tuple[tuple[str, int], ...]
+    """
+    The component map keys and the index of the component in :attr:`paths`.
+    """
+    reverse_flattened: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_wrapper(cls, wrapper: "FormioConfigurationWrapper") -> Self:
+        flattened = wrapper.flattened_by_path
+        positions = {
+            id(component): index for index, component in enumerate(flattened.values())
+        }
+        containers: list[tuple[_Path, int]] = [
+            (("components",), len(wrapper.configuration.get("components", [])))
+        ]
+        for path, component in flattened.items():
+            resolved_path = _to_path(path)
+            if "columns" in component:
+                containers.append(
+                    (resolved_path + ("columns",), len(component["columns"]))
+                )
+                containers += [
+                    (
+                        resolved_path + ("columns", index, "components"),
+                        len(column.get("components", [])),
+                    )
+                    for index, column in enumerate(component["columns"])
+                ]
+            elif "components" in component:
+                containers.append(
+                    (resolved_path + ("components",), len(component["components"]))
+                )
+
+        return cls(
+            paths=tuple(flattened.keys()),
+            resolved_paths=tuple(_to_path(path) for path in flattened.keys()),
+            signatures=tuple(_get_signature(c) for c in flattened.values()),
+            containers=tuple(containers),
+            component_map=tuple(
+                (key, positions[id(component)])
+                for key, component in wrapper.component_map.items()
+            ),
+            reverse_flattened=tuple(wrapper.reverse_flattened.items()),
+        )
+
+    def resolve(self, configuration: FormioConfiguration) -> list[Component] | None:
+        """
+        Look up the components in the configuration.
+
+        :returns: The components in :attr:`paths` order, or ``None`` if the
+          configuration does not have the indexed structure.
+        """
+        try:
+            for path, size in self.containers:
+                container = _resolve(configuration, path[:-1]).get(path[-1], [])
+                if len(container) != size:
+                    return None
+            components = [_resolve(configuration, path) for path in self.resolved_paths]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return None
+
+        for component, signature in zip(components, self.signatures):
+            if _get_signature(component) != signature:
+                return None
+        return components
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ConfigurationIndexCache:
+    """
+    Process-wide LRU cache of :class:`ConfigurationIndex` instances.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, ConfigurationIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> ConfigurationIndex | None:
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None:
+                self._entries.move_to_end(key)
+            return index
+
+    def set(self, key: Hashable, index: ConfigurationIndex) -> None:
+        with self._lock:
+            self._entries[key] = index
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def record(self, hit: bool) -> None:
+        # counters are informative only, so we don't bother with the lock
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+configuration_index_cache = ConfigurationIndexCache()
+
+
 class FormioConfigurationWrapper:
     """
     Wrap around the Formio configuration dictionary for further processing.
 
     This datastructure caches the internal datastructure to optimize mutations of the
     formio configuration.
+
+    If a ``cache_key`` is provided, the structure of the configuration is looked up in
+    (or stored in) the process-wide :data:`configuration_index_cache`, which avoids
+    walking the component tree for every new wrapper of the same configuration. The
+    key must change whenever the configuration is changed, but the structure is
+    validated anyway before it's used.
     """
 
     _configuration: FormioConfiguration
@@ -47,12 +241,43 @@ class FormioConfigurationWrapper:
     _cached_component_map: dict[str, Component] | None = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
+    # pre-ordered nodes (components and columns) with the position of their parent
+    _visibility_tree: None | tuple[list[tuple[Component, int]], dict[int, int]] = None
 
-    def __init__(self, configuration: FormioConfiguration):
+    def __init__(
+        self, configuration: FormioConfiguration, cache_key: Hashable | None = None
+    ):
         self._configuration = configuration
+        self._cache_key = cache_key
+
+    def _load_cached_index(self) -> None:
+        cache_key = self._cache_key
+        if cache_key is None:
+            return
+        # only attempt this once
+        self._cache_key = None
+
+        index = configuration_index_cache.get(cache_key)
+        components = index.resolve(self.configuration) if index else None
+        configuration_index_cache.record(hit=components is not None)
+        if index is None or components is None:
+            logger.debug("Configuration index cache miss for key %r", cache_key)
+            try:
+                index = ConfigurationIndex.from_wrapper(self)
+            except KeyError:  # pragma: no cover - not all components are flattened
+                return
+            configuration_index_cache.set(cache_key, index)
+            return
+
+        self._flattened_by_path = dict(zip(index.paths, components))
+        self._cached_component_map = {
+            key: components[position] for key, position in index.component_map
+        }
+        self._reverse_flattened = dict(index.reverse_flattened)
 
     @property
     def component_map(self) -> dict[str, Component]:
+        self._load_cached_index()
         if self._cached_component_map is None:
             self._cached_component_map = {}
 
@@ -109,6 +334,7 @@ class FormioConfigurationWrapper:
     ) -> "FormioConfigurationWrapper":
         self._configuration["components"] += other_wrapper._configuration["components"]
         self.component_map.update(other_wrapper.component_map)
+        self._visibility_tree = None
         return self
 
     @property
@@ -117,12 +343,14 @@ class FormioConfigurationWrapper:
 
     @property
     def flattened_by_path(self) -> dict[str, Component]:
+        self._load_cached_index()
         if self._flattened_by_path is None:
             self._flattened_by_path = flatten_by_path(self.configuration)
         return self._flattened_by_path
 
     @property
     def reverse_flattened(self) -> dict[str, str]:
+        self._load_cached_index()
         if self._reverse_flattened is None:
             self._reverse_flattened = {
                 component["key"]: path
@@ -130,15 +358,69 @@ class FormioConfigurationWrapper:
             }
         return self._reverse_flattened
 
+    def _get_visibility_tree(
+        self,
+    ) -> tuple[list[tuple[Component, int]], dict[int, int]]:
+        """
+        Index the component tree with parent pointers.
+
+        The nodes are the components in the same (pre-)order as
+        :attr:`flattened_by_path`, interleaved with the columns of column components,
+        since those can be hidden too. Every node is stored with the position of its
+        parent node (-1 for root components).
+        """
+        if self._visibility_tree is None:
+            nodes: list[tuple[Component, int]] = []
+            positions: dict[int, int] = {}
+
+            def _visit(container, parent: int) -> None:
+                for component in container.get("components", []):
+                    position = len(nodes)
+                    nodes.append((component, parent))
+                    positions[id(component)] = position
+                    if "columns" in component:
+                        for column in component["columns"]:
+                            nodes.append((column, position))
+                            _visit(column, len(nodes) - 1)
+                    elif "components" in component:
+                        _visit(component, position)
+
+            _visit(self.configuration, -1)
+            self._visibility_tree = (nodes, positions)
+        return self._visibility_tree
+
+    def _get_position(self, key: str) -> int:
+        component = self.flattened_by_path[self.reverse_flattened[key]]
+        return self._get_visibility_tree()[1][id(component)]
+
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
-        return all(is_visible_in_frontend(node, values) for node in nodes)
+        """
+        Check if the component and all of its ancestors are visible.
+        """
+        nodes, _ = self._get_visibility_tree()
+        position = self._get_position(key)
+        while position != -1:
+            node, position = nodes[position]
+            if not is_visible_in_frontend(node, values):
+                return False
+        return True
+
+    def visible_components(self, values: DataMapping) -> dict[str, bool]:
+        """
+        Determine the visibility of all components at once.
+
+        Equivalent to calling :meth:`is_visible_in_frontend` for every component key,
+        but the tree is processed top-down so that every node is only checked once, and
+        not at all if one of its ancestors is hidden.
+
+        :returns: A mapping of component key to visibility.
+        """
+        nodes, _ = self._get_visibility_tree()
+        visible: list[bool] = []
+        for node, parent in nodes:
+            parent_visible = visible[parent] if parent != -1 else True
+            visible.append(parent_visible and is_visible_in_frontend(node, values))
+        return {key: visible[self._get_position(key)] for key in self.reverse_flattened}
 
 
 class FormioData(UserDict):
@@ -174,25 +456,9 @@ class FormioData(UserDict):
         if "." not in key:
             return self.data[key]
 
-        value = self.data
-        raise_error = False
-        for k in key.split("."):
-            if isinstance(value, dict):
-                try:
-                    value = value[k]
-                except KeyError:
-                    raise_error = True
-            elif isinstance(value, list):
-                try:
-                    value = value[int(k)]
-                except (ValueError, IndexError):
-                    raise_error = True
-            else:
-                raise_error = True
-
-            if raise_error:
-                raise KeyError(f"Key '{key}' is not present in the data")
-
+        value = self._lookup(_compile_path(key))
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' is not present in the data")
         return value
 
     def __setitem__(self, key: str, value: VariableValue):
@@ -208,27 +474,7 @@ class FormioData(UserDict):
             self.data[key] = value
             return
 
-        data = self.data
-        key_list = key.split(".")
-        for k in key_list[:-1]:
-            if isinstance(data, dict):
-                child = data.get(k, None)
-            elif isinstance(data, list):
-                try:
-                    k = int(k)
-                    child = data[k]
-                except (ValueError, IndexError):
-                    raise KeyError(f"Cannot set an item in a list on index '{k}'")
-            else:
-                raise AttributeError(f"Item '{data}' has no attribute '{k}'")
-
-            if not isinstance(child, (dict, list)):
-                # TODO-5179: should this be configurable?
-                data[k] = {}
-
-            data = data[k]
-
-        data[key_list[-1]] = value
+        self._assign(_compile_path(key), value)
 
     def __contains__(self, key: object) -> bool:
         """
@@ -243,22 +489,106 @@ class FormioData(UserDict):
         if "." not in key:
             return key in self.data
 
+        return self._lookup(_compile_path(key)) is not _MISSING
+
+    def get(self, key: str, default: VariableValue = None) -> VariableValue:
+        if "." not in key:
+            return self.data.get(key, default)
+
+        value = self._lookup(_compile_path(key))
+        return default if value is _MISSING else value
+
+    def get_many(
+        self, keys: Iterable[str], default: VariableValue = None
+    ) -> dict[str, VariableValue]:
+        """
+        Get the values of multiple (possibly nested) keys at once.
+
+        :arg keys: The keys to look up.
+        :arg default: The value to use for keys that are not present in the data.
+        :returns: A mapping of each key to its value.
+        """
+        data = self.data
+        values = {}
+        for key in keys:
+            if "." not in key:
+                values[key] = data.get(key, default)
+                continue
+            value = self._lookup(_compile_path(key))
+            values[key] = default if value is _MISSING else value
+        return values
+
+    def set_many(self, values: Mapping[str, VariableValue]) -> None:
+        """
+        Set the values of multiple (possibly nested) keys at once.
+
+        The values are assigned in the iteration order of ``values``, with the same
+        semantics as setting them one by one.
+        """
+        data = self.data
+        for key, value in values.items():
+            if "." not in key:
+                data[key] = value
+            else:
+                self._assign(_compile_path(key), value)
+
+    def snapshot(self, keys: Iterable[str]) -> dict[str, VariableValue]:
+        """
+        Capture the current values of the given (possibly nested) keys.
+
+        Unlike a deep copy, the snapshot only holds references to the values. It stays
+        valid as long as values are replaced rather than mutated in place, which is
+        what assigning through this datastructure does. Absent keys are left out.
+
+        :arg keys: The keys to capture.
+        :returns: A flat mapping of each present key to its value.
+        """
+        values = self.get_many(keys, default=_MISSING)
+        return {key: value for key, value in values.items() if value is not _MISSING}
+
+    def _lookup(self, path: _CompiledPath) -> VariableValue | object:
         value = self.data
-        for k in key.split("."):
+        for segment, index in path:
             if isinstance(value, dict):
                 try:
-                    value = value[k]
+                    value = value[segment]
                 except KeyError:
-                    return False
+                    return _MISSING
             elif isinstance(value, list):
+                if index is None:
+                    return _MISSING
                 try:
-                    value = value[int(k)]
-                except (ValueError, IndexError):
-                    return False
+                    value = value[index]
+                except IndexError:
+                    return _MISSING
             else:
-                return False
+                return _MISSING
+        return value
 
-        return True
+    def _assign(self, path: _CompiledPath, value: VariableValue) -> None:
+        data = self.data
+        for segment, index in path[:-1]:
+            k: str | int = segment
+            if isinstance(data, dict):
+                child = data.get(segment, None)
+            elif isinstance(data, list):
+                if index is None:
+                    raise KeyError(f"Cannot set an item in a list on index '{k}'")
+                k = index
+                try:
+                    child = data[index]
+                except IndexError:
+                    raise KeyError(f"Cannot set an item in a list on index '{k}'")
+            else:
+                raise AttributeError(f"Item '{data}' has no attribute '{k}'")
+
+            if not isinstance(child, (dict, list)):
+                # TODO-5179: should this be configurable?
+                data[k] = {}
+
+            data = data[k]
+
+        data[path[-1][0]] = value
 
     def __iter__(self):
         raise AttributeError(
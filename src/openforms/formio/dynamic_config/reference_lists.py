@@ -1,11 +1,10 @@
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
 
 from glom import glom
 from requests.exceptions import RequestException
-from zgw_consumers.client import build_client
 from zgw_consumers.models import Service
 
-from openforms.contrib.reference_lists.client import ReferenceListsClient
+from openforms.contrib.reference_lists.cache import fetch_table, get_cached_table
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
@@ -37,48 +36,43 @@ def fetch_options_from_reference_lists(
         )
         return
 
-    try:
-        service = Service.objects.get(slug=service_slug)
-    except Service.DoesNotExist:
-        logevent.form_configuration_error(
-            submission.form,
-            component,  # pyright: ignore[reportArgumentType]
-            _(
-                "Cannot fetch from ReferenceLists API, service with {service_slug} does not exist."
-            ).format(service_slug=service_slug),
-        )
-        return
+    language = get_language()
+    if (entry := get_cached_table(service_slug, code, language)) is None:
+        try:
+            service = Service.objects.get(slug=service_slug)
+        except Service.DoesNotExist:
+            logevent.form_configuration_error(
+                submission.form,
+                component,  # pyright: ignore[reportArgumentType]
+                _(
+                    "Cannot fetch from ReferenceLists API, service with {service_slug} does not exist."
+                ).format(service_slug=service_slug),
+            )
+            return
+
+        try:
+            entry = fetch_table(service, code, language)
+        except RequestException as e:
+            logevent.reference_lists_failure_response(
+                submission.form,
+                component,  # pyright: ignore[reportArgumentType]
+                _(
+                    "Exception occurred while fetching from ReferenceLists API: {exception}."
+                ).format(exception=e),
+            )
+            return
 
-    try:
-        with build_client(service, client_factory=ReferenceListsClient) as client:
-            # check if the table is valid (we don't want to show the possible valid
-            # options of an invalid table)
-            table = client.get_table(code)
-            if table:
-                if table.expires_on and table.is_expired:
-                    return []
+    # check if the table is valid (we don't want to show the possible valid
+    # options of an invalid table)
+    if entry.table and entry.table.is_expired:
+        return []
 
-            items = client.get_items_for_table_cached(code)
-    except RequestException as e:
+    if not entry.items:
         logevent.reference_lists_failure_response(
             submission.form,
             component,  # pyright: ignore[reportArgumentType]
-            _(
-                "Exception occurred while fetching from ReferenceLists API: {exception}."
-            ).format(exception=e),
+            _("No results found from ReferenceLists API."),
         )
         return
-    else:
-        if not items:
-            logevent.reference_lists_failure_response(
-                submission.form,
-                component,  # pyright: ignore[reportArgumentType]
-                _("No results found from ReferenceLists API."),
-            )
-            return
 
-        return [
-            (item.code, item.name)
-            for item in items
-            if not item.expires_on or not item.is_expired
-        ]
+    return [(item.code, item.name) for item in entry.items if not item.is_expired]
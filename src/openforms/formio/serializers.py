@@ -11,7 +11,6 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, TypeAlias
 
-from glom import assign, glom
 from rest_framework import serializers
 
 from openforms.typing import DataMapping, JSONObject
@@ -30,7 +29,7 @@ FieldOrNestedFields: TypeAlias = serializers.Field | dict[str, "FieldOrNestedFie
 class StepDataSerializer(serializers.Serializer):
 
     def apply_hidden_state(
-        self, configuration: JSONObject, fields: dict[str, FieldOrNestedFields]
+        self, schema: ValidationSchema, fields: dict[str, FieldOrNestedFields]
     ) -> None:
         """
         Apply the hidden/visible state of the formio components to the serializer.
@@ -46,29 +45,25 @@ class StepDataSerializer(serializers.Serializer):
         if not hasattr(self, "initial_data"):
             return
 
-        config_wrapper = FormioConfigurationWrapper(configuration)
-
         # can't use FormioData yet because of is_visible_in_frontend
         values: DataMapping = self.initial_data
 
-        # loop over all components and delegate application to the registry
-        for component in iter_components(configuration, recurse_into_editgrid=False):
-            # XXX: is_visible_in_frontend does not understand editgrid at all yet, which
-            # is a broader issue, but also manifests here.
-            is_visible = config_wrapper.is_visible_in_frontend(component["key"], values)
+        # XXX: is_visible_in_frontend does not understand editgrid at all yet, which
+        # is a broader issue, but also manifests here.
+        visibility = schema.config_wrapper.visible_components(values)
 
+        # loop over all components and delegate application to the registry
+        for path, component in schema.components:
             # we don't have to do anything when the component is visible, regular
             # validation rules apply
-            if is_visible:
-                continue
-
-            # Layout components do not have serializer fields associated with them
-            if is_layout_component(component):
+            if visibility[component["key"]]:
                 continue
 
             # when it's not visible, grab the field from the serializer and remove all
             # the validators to match Formio's behaviour.
-            serializer_field = glom(fields, component["key"])
+            serializer_field = fields
+            for bit in path:
+                serializer_field = serializer_field[bit]
             self._remove_validations_from_field(serializer_field)
 
     def _remove_validations_from_field(self, field: serializers.Field) -> None:
@@ -140,6 +135,49 @@ def dict_to_serializer(
     return serializer
 
 
+class ValidationSchema:
+    """
+    The data-independent structure of the serializer for a list of components.
+
+    Walking the component tree and indexing it for the visibility checks only needs to
+    happen once for a given configuration, e.g. once for all the items of an editgrid.
+    The serializer fields themselves are stateful (they get bound to their parent
+    serializer) and are built for every validation, after which the (dynamic) hidden
+    state is applied to them.
+    """
+
+    def __init__(self, components: list[Component]):
+        self.configuration: JSONObject = {"components": components}
+        self.config_wrapper = FormioConfigurationWrapper(self.configuration)
+        self.components: list[tuple[list[str], Component]] = [
+            (component["key"].split("."), component)
+            for component in iter_components(
+                self.configuration, recurse_into_editgrid=False
+            )
+            # Layout components do not have serializer fields associated with them
+            if not is_layout_component(component)
+        ]
+
+    def build_fields(
+        self, register: ComponentRegistry
+    ) -> dict[str, FieldOrNestedFields]:
+        fields: dict[str, FieldOrNestedFields] = {}
+        for path, component in self.components:
+            container = fields
+            for bit in path[:-1]:
+                container = container.setdefault(bit, {})
+            container[path[-1]] = register.build_serializer_field(component)
+        return fields
+
+    def build_serializer(
+        self, register: ComponentRegistry, **kwargs
+    ) -> StepDataSerializer:
+        fields = self.build_fields(register)
+        serializer = dict_to_serializer(fields, **kwargs)
+        serializer.apply_hidden_state(self, fields)
+        return serializer
+
+
 def build_serializer(
     components: list[Component], register: ComponentRegistry, **kwargs
 ) -> StepDataSerializer:
@@ -149,16 +187,5 @@ def build_serializer(
     This recursively builds up the serializer fields for each (nested) component and
     puts them into a serializer instance ready for validation.
     """
-    fields: dict[str, FieldOrNestedFields] = {}
-
-    config: JSONObject = {"components": components}
-    for component in iter_components(config, recurse_into_editgrid=False):
-        if is_layout_component(component):
-            continue
-
-        field = register.build_serializer_field(component)
-        assign(obj=fields, path=component["key"], val=field, missing=dict)
-
-    serializer = dict_to_serializer(fields, **kwargs)
-    serializer.apply_hidden_state(config, fields)
-    return serializer
+    schema = ValidationSchema(components)
+    return schema.build_serializer(register, **kwargs)
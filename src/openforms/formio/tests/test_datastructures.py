@@ -1,8 +1,19 @@
-from unittest import TestCase
+import os
+import timeit
+from collections import UserDict
+from copy import deepcopy
+from unittest import TestCase, skipUnless
+
+from django.test import tag
 
 from openforms.formio.typing import Component, EditGridComponent
 
-from ..datastructures import FormioConfiguration, FormioConfigurationWrapper, FormioData
+from ..datastructures import (
+    FormioConfiguration,
+    FormioConfigurationWrapper,
+    FormioData,
+    configuration_index_cache,
+)
 
 
 class FormioDataTests(TestCase):
@@ -141,6 +152,135 @@ class FormioDataTests(TestCase):
             ):
                 formio_data[key]
 
+    def test_get_many(self):
+        formio_data = FormioData(
+            {
+                "topLevel": "foo",
+                "container": {"nested": "bar"},
+                "list": [{"field": "baz"}],
+            }
+        )
+
+        values = formio_data.get_many(
+            ["topLevel", "container.nested", "list.0.field", "list.1.field", "missing"],
+            default="default",
+        )
+
+        self.assertEqual(
+            values,
+            {
+                "topLevel": "foo",
+                "container.nested": "bar",
+                "list.0.field": "baz",
+                "list.1.field": "default",
+                "missing": "default",
+            },
+        )
+
+    def test_set_many(self):
+        formio_data = FormioData({"list": [{"field": "foo"}]})
+
+        formio_data.set_many(
+            {
+                "topLevel": "foo",
+                "container.nested": "bar",
+                "list.0.field": "baz",
+            }
+        )
+
+        self.assertEqual(
+            formio_data.data,
+            {
+                "topLevel": "foo",
+                "container": {"nested": "bar"},
+                "list": [{"field": "baz"}],
+            },
+        )
+
+    def test_set_many_invalid_list_index(self):
+        formio_data = FormioData({"list": [{"field": "foo"}]})
+
+        for key in ("list.1.field", "list.foo.field"):
+            with (
+                self.subTest(key=key),
+                self.assertRaises(KeyError),
+            ):
+                formio_data.set_many({key: "bar"})
+
+    def test_snapshot(self):
+        formio_data = FormioData({"topLevel": "foo", "container": {"nested": [1]}})
+
+        snapshot = formio_data.snapshot(["topLevel", "container.nested", "missing"])
+        formio_data["container.nested"] = [1, 2]
+
+        self.assertEqual(snapshot, {"topLevel": "foo", "container.nested": [1]})
+
+
+class FormioDataBulkAccessTests(TestCase):
+    """
+    Compare the bulk accessors with key-by-key access for a submission with 2000
+    (nested) variables.
+
+    The micro-benchmark only runs on demand, e.g.:
+    ``RUN_BENCHMARKS=1 src/manage.py test openforms.formio --tag=benchmark``
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.keys = [f"container{i // 10}.nested{i % 10}" for i in range(1000)] + [
+            f"editgrid{i // 10}.{i % 10}.field" for i in range(1000)
+        ]
+        self.initial_data = {
+            f"editgrid{i}": [{"field": j} for j in range(10)] for i in range(100)
+        }
+        self.formio_data = FormioData(deepcopy(self.initial_data))
+        self.formio_data.set_many({key: key for key in self.keys[:1000]})
+
+    def test_get_many(self):
+        # what ``UserDict.get`` does: a containment check and a lookup
+        key_by_key = {key: UserDict.get(self.formio_data, key) for key in self.keys}
+
+        self.assertEqual(self.formio_data.get_many(self.keys), key_by_key)
+
+    def test_set_many(self):
+        values = {key: f"new {key}" for key in self.keys}
+        key_by_key = FormioData(deepcopy(self.initial_data))
+        for key, value in values.items():
+            key_by_key[key] = value
+        bulk = FormioData(deepcopy(self.initial_data))
+
+        bulk.set_many(values)
+
+        self.assertEqual(bulk.data, key_by_key.data)
+
+    @tag("benchmark")
+    @skipUnless(os.environ.get("RUN_BENCHMARKS"), "Benchmarks are opt-in.")
+    def test_benchmark(self):
+        values = {key: key for key in self.keys}
+
+        def get_key_by_key():
+            return {key: UserDict.get(self.formio_data, key) for key in self.keys}
+
+        def set_key_by_key():
+            for key, value in values.items():
+                self.formio_data[key] = value
+
+        cases = [
+            ("get", get_key_by_key, lambda: self.formio_data.get_many(self.keys)),
+            ("set", set_key_by_key, lambda: self.formio_data.set_many(values)),
+        ]
+
+        print(f"\nFormioData access of {len(self.keys)} variables (best of 5 x 10):")
+        for name, key_by_key, bulk in cases:
+            key_by_key_time = min(timeit.repeat(key_by_key, number=10, repeat=5))
+            bulk_time = min(timeit.repeat(bulk, number=10, repeat=5))
+            print(
+                f"  {name}: key by key {key_by_key_time * 100:.2f}ms, "
+                f"bulk {bulk_time * 100:.2f}ms "
+                f"({key_by_key_time / bulk_time:.1f}x)"
+            )
+
 
 class FormioConfigurationWrapperTests(TestCase):
 
@@ -199,3 +339,153 @@ class FormioConfigurationWrapperTests(TestCase):
             config_wrapper["outerEditgrid.innerEditgrid.innerTextfield"],
             inner_textfield,
         )
+
+    def test_visibility_takes_ancestors_into_account(self):
+        config: FormioConfiguration = {
+            "components": [
+                {"type": "checkbox", "key": "toggle"},
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "conditional": {"show": True, "when": "toggle", "eq": True},
+                    "components": [
+                        {
+                            "type": "columns",
+                            "key": "columns",
+                            "columns": [
+                                {"components": [{"type": "textfield", "key": "a"}]},
+                                {
+                                    "hidden": True,
+                                    "components": [{"type": "textfield", "key": "b"}],
+                                },
+                            ],
+                        }
+                    ],
+                },
+                {"type": "textfield", "key": "c", "hidden": True},
+            ]
+        }
+        config_wrapper = FormioConfigurationWrapper(config)
+
+        for toggle, expected in (
+            (
+                True,
+                {
+                    "toggle": True,
+                    "fieldset": True,
+                    "columns": True,
+                    "a": True,
+                    "b": False,
+                    "c": False,
+                },
+            ),
+            (
+                False,
+                {
+                    "toggle": True,
+                    "fieldset": False,
+                    "columns": False,
+                    "a": False,
+                    "b": False,
+                    "c": False,
+                },
+            ),
+        ):
+            with self.subTest(toggle=toggle):
+                values = {"toggle": toggle}
+
+                visibility = config_wrapper.visible_components(values)
+
+                self.assertEqual(visibility, expected)
+                for key, visible in expected.items():
+                    self.assertEqual(
+                        config_wrapper.is_visible_in_frontend(key, values), visible
+                    )
+
+
+CACHED_CONFIGURATION: FormioConfiguration = {
+    "components": [
+        {"type": "textfield", "key": "textfield"},
+        {
+            "type": "columns",
+            "key": "columns",
+            "columns": [
+                {"components": [{"type": "number", "key": "number"}]},
+                {"components": []},
+            ],
+        },
+        {
+            "type": "editgrid",
+            "key": "editgrid",
+            "components": [{"type": "textfield", "key": "nested"}],
+        },
+    ]
+}
+
+
+class ConfigurationIndexCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        configuration_index_cache.clear()
+        self.addCleanup(configuration_index_cache.clear)
+
+    def _get_wrapper(self, configuration=CACHED_CONFIGURATION):
+        return FormioConfigurationWrapper(deepcopy(configuration), cache_key="test")
+
+    def test_cached_lookups_equal_fresh_lookups(self):
+        self._get_wrapper().component_map  # populate the cache
+        cached = self._get_wrapper()
+        fresh = FormioConfigurationWrapper(deepcopy(CACHED_CONFIGURATION))
+
+        self.assertEqual(cached.component_map, fresh.component_map)
+        self.assertEqual(list(cached.component_map), list(fresh.component_map))
+        self.assertEqual(cached.flattened_by_path, fresh.flattened_by_path)
+        self.assertEqual(cached.reverse_flattened, fresh.reverse_flattened)
+        self.assertEqual(configuration_index_cache.cache_info().hits, 1)
+        self.assertEqual(configuration_index_cache.cache_info().misses, 1)
+
+    def test_lookups_point_to_own_configuration(self):
+        self._get_wrapper().component_map
+        wrapper = self._get_wrapper()
+
+        wrapper["editgrid.nested"]["hidden"] = True
+
+        self.assertIs(
+            wrapper["editgrid.nested"],
+            wrapper.configuration["components"][2]["components"][0],
+        )
+        self.assertNotIn("hidden", self._get_wrapper()["nested"])
+
+    def test_changed_structure_is_detected(self):
+        self._get_wrapper().component_map
+        configurations = [
+            {"components": CACHED_CONFIGURATION["components"][:2]},
+            {
+                "components": [
+                    {"type": "textfield", "key": "renamed"},
+                    *CACHED_CONFIGURATION["components"][1:],
+                ]
+            },
+            {
+                "components": [
+                    *CACHED_CONFIGURATION["components"][:2],
+                    {
+                        "type": "editgrid",
+                        "key": "editgrid",
+                        "components": [
+                            {"type": "textfield", "key": "nested"},
+                            {"type": "textfield", "key": "nested2"},
+                        ],
+                    },
+                ]
+            },
+        ]
+
+        for configuration in configurations:
+            with self.subTest(configuration=configuration):
+                wrapper = self._get_wrapper(configuration)
+                fresh = FormioConfigurationWrapper(deepcopy(configuration))
+
+                self.assertEqual(wrapper.component_map, fresh.component_map)
+                self.assertEqual(wrapper.reverse_flattened, fresh.reverse_flattened)
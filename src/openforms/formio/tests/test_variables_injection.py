@@ -1,13 +1,16 @@
 from copy import deepcopy
 from datetime import date
+from unittest.mock import patch
 
+from django.template.backends.django import Template as DjangoTemplate
 from django.test import SimpleTestCase, override_settings
 from django.utils import timezone
+from django.utils.safestring import SafeString
 
 from freezegun import freeze_time
 
 from ..datastructures import FormioConfigurationWrapper
-from ..variables import inject_variables, render
+from ..variables import _get_template, inject_variables, render
 
 VARIABLES = {
     "html_variable": "<span>HTML injection!</span>",
@@ -202,3 +205,76 @@ class VariableInjectionTests(SimpleTestCase):
             configuration["components"][0]["html"],
             "<p>I am hidden</p>{{ missingFields }}{% now %}",
         )
+
+
+class TemplateCachingTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _get_template.cache_clear()
+        self.addCleanup(_get_template.cache_clear)
+
+    def test_plain_text_is_not_parsed(self):
+        configuration = {
+            "components": [
+                {"type": "textfield", "key": "textfield1", "label": "<b>Plain</b>"}
+            ]
+        }
+
+        with patch("openforms.formio.variables.parse") as mock_parse:
+            inject_variables(FormioConfigurationWrapper(configuration), {})
+
+        mock_parse.assert_not_called()
+        label = configuration["components"][0]["label"]
+        self.assertEqual(label, "<b>Plain</b>")
+        self.assertIsInstance(label, SafeString)
+
+    def test_output_reused_when_variables_unchanged(self):
+        def _inject(values):
+            configuration = {
+                "components": [
+                    {
+                        "type": "textfield",
+                        "key": "textfield1",
+                        "label": "Hello {{ name|upper }}",
+                        "description": "{{ other }}",
+                    }
+                ]
+            }
+            inject_variables(FormioConfigurationWrapper(configuration), values)
+            return configuration["components"][0]["label"]
+
+        with patch.object(
+            DjangoTemplate, "render", autospec=True, side_effect=DjangoTemplate.render
+        ) as mock_render:
+            with self.subTest("first render"):
+                self.assertEqual(_inject({"name": "bob", "other": 1}), "Hello BOB")
+                self.assertEqual(mock_render.call_count, 2)
+
+            with self.subTest("unrelated variable changed"):
+                self.assertEqual(_inject({"name": "bob", "other": 2}), "Hello BOB")
+                self.assertEqual(mock_render.call_count, 3)
+
+            with self.subTest("used variable changed"):
+                self.assertEqual(_inject({"name": "alice", "other": 2}), "Hello ALICE")
+                self.assertEqual(mock_render.call_count, 4)
+
+    def test_output_not_reused_for_template_tags_or_mutable_values(self):
+        sources = [
+            ("{% now 'Y' %}", {}),
+            ("{{ items|join:',' }}", {"items": ["a", "b"]}),
+        ]
+
+        for source, context in sources:
+            with self.subTest(source=source):
+                render(source, context)
+
+                with patch.object(
+                    DjangoTemplate,
+                    "render",
+                    autospec=True,
+                    side_effect=DjangoTemplate.render,
+                ) as mock_render:
+                    render(source, context)
+
+                mock_render.assert_called_once()
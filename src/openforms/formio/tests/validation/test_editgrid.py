@@ -1,4 +1,5 @@
 from collections import namedtuple
+from unittest.mock import ANY, patch
 
 from django.test import SimpleTestCase, tag
 
@@ -10,6 +11,7 @@ from openforms.typing import JSONObject, JSONValue
 
 from ...components.vanilla import EditGridField
 from ...registry import register
+from ...serializers import ValidationSchema
 from ...service import build_serializer
 from ...typing import EditGridComponent, FieldsetComponent
 from .helpers import extract_error, validate_formio_data
@@ -511,3 +513,76 @@ class EditGridFieldTests(SimpleTestCase):
             ]
         }
         self.assertEqual(data, expected)
+
+    def test_validation_schema_compiled_once_for_all_items(self):
+        component: EditGridComponent = {
+            "type": "editgrid",
+            "key": "editgrid",
+            "label": "Edit grid with compiled schema",
+            "components": [
+                {
+                    "type": "textfield",
+                    "key": "textfield",
+                    "label": "Text field",
+                    "validate": {"required": True},
+                },
+            ],
+        }
+        data: JSONValue = {"editgrid": [{"textfield": "foo"}] * 5 + [{}]}
+
+        with patch.object(
+            ValidationSchema,
+            "__init__",
+            autospec=True,
+            side_effect=ValidationSchema.__init__,
+        ) as mock_init:
+            is_valid, errors = validate_formio_data(component, data)
+
+        self.assertFalse(is_valid)
+        error = extract_error(errors["editgrid"][5], "textfield")
+        self.assertEqual(error.code, "required")
+        # one schema for the outer configuration, one shared by all editgrid items
+        self.assertEqual(mock_init.call_count, 2)
+        mock_init.assert_called_with(ANY, component["components"])
+
+    def test_validation_schema_not_kept_between_validations(self):
+        # the (post-logic) configuration can contain submission data, so the schemas
+        # must not outlive the validation
+        component: EditGridComponent = {
+            "type": "editgrid",
+            "key": "editgrid",
+            "label": "Edit grid",
+            "components": [{"type": "textfield", "key": "textfield", "label": "Text"}],
+        }
+
+        with patch.object(
+            ValidationSchema,
+            "__init__",
+            autospec=True,
+            side_effect=ValidationSchema.__init__,
+        ) as mock_init:
+            for _ in range(2):
+                validate_formio_data(component, {"editgrid": [{"textfield": "foo"}]})
+
+        self.assertEqual(mock_init.call_count, 4)
+
+
+class ValidationSchemaTests(SimpleTestCase):
+    def test_nested_keys_and_layout_components(self):
+        schema = ValidationSchema(
+            [
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "components": [
+                        {"type": "textfield", "key": "foo.bar", "label": "Foo bar"},
+                    ],
+                },
+            ]
+        )
+
+        fields = schema.build_fields(register)
+
+        self.assertEqual(list(fields), ["foo"])
+        self.assertIsInstance(fields["foo"]["bar"], serializers.CharField)
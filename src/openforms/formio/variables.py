@@ -1,9 +1,18 @@
 import logging
+from datetime import date, time
+from decimal import Decimal
+from functools import lru_cache
 from typing import Iterator
 
+from django.core.signals import setting_changed
 from django.template import TemplateSyntaxError
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import TextNode, Variable, VariableNode
+from django.template.defaultfilters import random as random_filter
+from django.utils import timezone, translation
+from django.utils.safestring import SafeString
 
-from openforms.template import parse, render_from_string
+from openforms.template import parse
 from openforms.typing import DataMapping, JSONObject, JSONValue
 
 from .datastructures import FormioConfigurationWrapper
@@ -26,9 +35,130 @@ SUPPORTED_TEMPLATE_PROPERTIES = (
     "tooltip",
 )
 
+# the number of distinct templates to keep the last rendered output of, per process
+RENDERED_TEMPLATE_CACHE_SIZE = 1024
+
+# context values that can't be mutated in place, so that they can be compared to the
+# values a template was last rendered with
+_IMMUTABLE_TYPES = (str, int, float, Decimal, date, time, type(None))
+
+_IMPURE_FILTERS = {random_filter}
+
+_MISSING = object()
+
+
+def _get_context_dependencies(template: DjangoTemplate) -> frozenset[str] | None:
+    """
+    Determine the context variables the output of the template depends on.
+
+    Only templates consisting of text and variable nodes are analyzed - any template
+    tag may have side effects or depend on something else than the context.
+
+    :returns: The (root) names of the context variables, or ``None`` if the output
+      can not be determined from the context alone.
+    """
+    names = set()
+    for node in template.template.nodelist:
+        match node:
+            case TextNode():
+                continue
+            case VariableNode(filter_expression=filter_expression):
+                variables = [filter_expression.var]
+                for func, args in filter_expression.filters:
+                    if func in _IMPURE_FILTERS:
+                        return None
+                    variables += [arg for lookup, arg in args if lookup]
+                names.update(
+                    var.lookups[0]
+                    for var in variables
+                    if isinstance(var, Variable) and var.lookups
+                )
+            case _:
+                return None
+    return frozenset(names)
+
+
+class _RenderableTemplate:
+    """
+    A parsed template that remembers the output of the last time it was rendered.
+
+    Rendering it again with the same values for the context variables it depends on
+    returns the remembered output instead of going through the template engine.
+    """
+
+    def __init__(self, source: str):
+        self.template = parse(source)
+        self.dependencies = _get_context_dependencies(self.template)
+        self._last_render: tuple[tuple, SafeString] | None = None
+
+    def _get_render_key(self, context: DataMapping) -> tuple | None:
+        if self.dependencies is None:
+            return None
+        values = []
+        for name in sorted(self.dependencies):
+            value = context.get(name, _MISSING)
+            if value is not _MISSING and not isinstance(value, _IMMUTABLE_TYPES):
+                return None
+            # include the type, as 1 == 1.0 == True
+            values.append((type(value), value))
+        return (
+            translation.get_language(),
+            timezone.get_current_timezone_name(),
+            *values,
+        )
+
+    def render(self, context: DataMapping) -> SafeString:
+        key = self._get_render_key(context)
+        if key is not None and (last_render := self._last_render) is not None:
+            last_key, output = last_render
+            if last_key == key:
+                return output
+
+        output = self.template.render(context)
+        if key is not None:
+            self._last_render = (key, output)
+        return output
+
+
+@lru_cache(maxsize=RENDERED_TEMPLATE_CACHE_SIZE)
+def _get_template(source: str) -> _RenderableTemplate:
+    return _RenderableTemplate(source)
+
+
+def _clear_rendered_templates(**kwargs) -> None:
+    # rendered output depends on (formatting) settings
+    _get_template.cache_clear()
+
+
+setting_changed.connect(
+    _clear_rendered_templates,
+    dispatch_uid="openforms.formio.variables.clear_rendered_templates",
+)
+
+
+def _has_template_syntax(source: str) -> bool:
+    return "{{" in source or "{%" in source or "{#" in source
+
+
+def _render_string(source: str, context: DataMapping) -> SafeString:
+    """
+    Render a single template-enabled string with the given context.
+
+    Plain text is returned as is, without going through the template engine. Parsed
+    templates are cached, and when a template is rendered again with unchanged values
+    for the variables it uses, the previous output is re-used.
+
+    :raises: :class:`django.template.TemplateSyntaxError` if the template source is
+      invalid
+    """
+    if not _has_template_syntax(source):
+        # the template engine outputs literal text as is
+        return SafeString(source)
+    return _get_template(source).render(context)
+
 
 def render(formio_bit: JSONValue, context: dict) -> JSONValue:
-    return recursive_apply(formio_bit, render_from_string, context=context)
+    return recursive_apply(formio_bit, _render_string, context=context)
 
 
 def iter_template_properties(component: Component) -> Iterator[tuple[str, JSONValue]]:
@@ -76,6 +206,9 @@ def inject_variables(
     component is checked for properties that can be templated. Note that the
     configuration is mutated in the process!
 
+    Only the strings containing template syntax go through the template engine, see
+    :func:`_render_string`.
+
     :arg configuration: A dictionary containing the static Formio configuration (from
       the form designer)
     :arg values: A mapping of variable key to its value (Python native objects)
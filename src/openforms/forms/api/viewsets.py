@@ -1,4 +1,5 @@
 import inspect
+from functools import partial
 from uuid import UUID
 
 from django.conf import settings
@@ -20,6 +21,7 @@ from rest_framework.response import Response
 
 from openforms.api.pagination import PageNumberPagination
 from openforms.api.serializers import ExceptionSerializer, ValidationErrorSerializer
+from openforms.submissions.logic.rules import invalidate_form_logic
 from openforms.translations.utils import set_language_cookie
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 from openforms.utils.urls import is_admin_request
@@ -578,6 +580,12 @@ class FormViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
+        # the rules are bulk created, which doesn't send the ``post_save`` signals that
+        # invalidate the compiled logic rules (and without existing rules, the delete
+        # doesn't send any signals either)
+        invalidate_form_logic(form.pk)
+        transaction.on_commit(partial(invalidate_form_logic, form.pk))
+
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @extend_schema(
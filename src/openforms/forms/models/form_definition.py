@@ -161,7 +161,10 @@ class FormDefinition(models.Model):
     def configuration_wrapper(self) -> "FormioConfigurationWrapper":
         from openforms.formio.service import FormioConfigurationWrapper
 
-        return FormioConfigurationWrapper(self.configuration)
+        cache_key = (
+            ("form-definition", self.pk, self._num_components) if self.pk else None
+        )
+        return FormioConfigurationWrapper(self.configuration, cache_key=cache_key)
 
     def iter_components(self, configuration=None, recursive=True, **kwargs):
         if configuration is None:
@@ -1,4 +1,6 @@
 import uuid as _uuid
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -6,6 +8,11 @@ from django.utils.translation import gettext_lazy as _
 
 from ordered_model.models import OrderedModel
 
+from openforms.utils.json_logic import CompiledExpression, compile_expression
+
+if TYPE_CHECKING:
+    from openforms.submissions.logic.actions import ActionOperation
+
 
 class FormLogic(OrderedModel):
     uuid = models.UUIDField(_("UUID"), unique=True, default=_uuid.uuid4)
@@ -69,10 +76,15 @@ class FormLogic(OrderedModel):
                 code="invalid",
             )
 
-    @property
-    def action_operations(self):
+    @cached_property
+    def compiled_trigger(self) -> CompiledExpression:
+        return compile_expression(self.json_logic_trigger)
+
+    @cached_property
+    def action_operations(self) -> tuple["ActionOperation", ...]:
         from openforms.submissions.logic.actions import compile_action_operation
 
-        for action in map(compile_action_operation, self.actions):
-            action.rule = self
-            yield action
+        operations = tuple(map(compile_action_operation, self.actions))
+        for operation in operations:
+            operation.rule = self
+        return operations
@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 @app.task()
 def activate_forms():
     """Activate all the forms that should be activated by the specific date and time."""
+    from openforms.contrib.reference_lists.tasks import prewarm_reference_lists
     from openforms.logging import logevent
 
     now = timezone.now()
@@ -37,6 +38,9 @@ def activate_forms():
                 )
             else:
                 transaction.on_commit(partial(logevent.form_activated, form))
+                transaction.on_commit(
+                    partial(prewarm_reference_lists.delay, form_id=form.pk)
+                )
 
 
 @app.task()
@@ -7,10 +7,14 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from openforms.accounts.tests.factories import SuperUserFactory, UserFactory
+from openforms.submissions.logic.rules import (
+    get_compiled_form_logic,
+    invalidate_form_logic,
+)
 from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
 
 from ..constants import LogicActionTypes
-from ..models import FormLogic
+from ..models import Form, FormLogic
 from .factories import (
     FormFactory,
     FormLogicFactory,
@@ -131,6 +135,51 @@ class FormLogicAPITests(APITestCase):
 
         self.assertEqual(form, form_logic.form)
 
+    def test_bulk_update_invalidates_compiled_logic(self):
+        user = SuperUserFactory.create()
+        form = FormFactory.create()
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"type": "textfield", "key": "textfield"}]
+            },
+        )
+        self.addCleanup(invalidate_form_logic, form.pk)
+        # compile the (absent) rules of the form before the bulk update
+        self.assertEqual(
+            get_compiled_form_logic(Form.objects.get(pk=form.pk)).rules, ()
+        )
+        form_logic_data = [
+            {
+                "form": f"http://testserver{reverse('api:form-detail', kwargs={'uuid_or_slug': form.uuid})}",
+                "order": 0,
+                "json_logic_trigger": {"==": [{"var": "textfield"}, "hide"]},
+                "actions": [
+                    {
+                        "component": "textfield",
+                        "action": {
+                            "name": "Hide element",
+                            "type": "property",
+                            "property": {"value": "hidden", "type": "bool"},
+                            "state": True,
+                        },
+                    }
+                ],
+            }
+        ]
+
+        self.client.force_authenticate(user=user)
+        url = reverse("api:form-logic-rules", kwargs={"uuid_or_slug": form.uuid})
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(url, data=form_logic_data)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        compiled = get_compiled_form_logic(Form.objects.get(pk=form.pk))
+        self.assertEqual(len(compiled.rules), 1)
+        self.assertEqual(
+            compiled.rules[0].json_logic_trigger, {"==": [{"var": "textfield"}, "hide"]}
+        )
+
     def test_create_logic_with_dates(self):
         user = SuperUserFactory.create(username="test", password="test")
         form = FormFactory.create()
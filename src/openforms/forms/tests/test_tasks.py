@@ -16,7 +16,8 @@ logger = logging.getLogger(__name__)
 
 class ActivateFormsTests(TestCase):
     @freeze_time("2023-10-10T21:15:00Z")
-    def test_forms_are_activated_on_specified_datetime(self):
+    @patch("openforms.contrib.reference_lists.tasks.prewarm_reference_lists.delay")
+    def test_forms_are_activated_on_specified_datetime(self, mock_prewarm):
         form1 = FormFactory(active=False, activate_on="2023-10-10T21:15:00Z")
         form2 = FormFactory(active=False, activate_on="2023-10-10T21:15:00Z")
 
@@ -31,6 +32,11 @@ class ActivateFormsTests(TestCase):
         self.assertTrue(form2.active)
         self.assertIsNone(form2.activate_on)
 
+        # the reference lists used by the forms are cached in advance
+        self.assertEqual(mock_prewarm.call_count, 2)
+        mock_prewarm.assert_any_call(form_id=form1.pk)
+        mock_prewarm.assert_any_call(form_id=form2.pk)
+
         # make sure the activation is logged as well
         log_entries = TimelineLogProxy.objects.all()
         self.assertEqual(log_entries.count(), 2)
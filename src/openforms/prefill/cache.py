@@ -0,0 +1,120 @@
+"""
+Short-lived cache of the prefill values retrieved for an authenticated user.
+
+Users often restart a form or fill out multiple forms in one session, which fetches the
+same (personal) data from the prefill backends again. For the plugins enabled in the
+``PREFILL_CACHE_PLUGINS`` setting, the retrieved values are cached for
+``PREFILL_CACHE_TIMEOUT`` seconds.
+
+The values are encrypted with a key derived from the ``SECRET_KEY`` and the identity of
+the authenticated user, and the cache keys are HMACs, so that neither the personal data
+nor the identifiers can be read from the cache. Logging out discards the cached values
+of the user.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import secrets
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from openforms.submissions.models import Submission
+from openforms.typing import JSONEncodable
+
+from .constants import IdentifierRoles
+
+if TYPE_CHECKING:
+    from .base import BasePlugin
+
+logger = logging.getLogger(__name__)
+
+KEY_SALT = "openforms.prefill.cache"
+
+
+def _hmac(*parts: str) -> bytes:
+    return salted_hmac(KEY_SALT, "\x1f".join(parts), algorithm="sha256").digest()
+
+
+def _get_version_key(auth_attribute: str, auth_value: str) -> str:
+    # the version changes every time the cached values of the user are discarded
+    digest = _hmac("version", auth_attribute, auth_value).hex()
+    return f"prefill-cache:version:{digest}"
+
+
+def _get_identity(submission: Submission) -> tuple[str, str] | None:
+    if not submission.is_authenticated:
+        return None
+    auth_info = submission.auth_info
+    if auth_info.attribute_hashed:
+        return None
+    return auth_info.attribute, auth_info.value
+
+
+def get_cached_prefill_values(
+    plugin: BasePlugin,
+    submission: Submission,
+    attributes: list[str],
+    identifier_role: IdentifierRoles,
+) -> dict[str, JSONEncodable]:
+    """
+    Retrieve the prefill values through the plugin, or from the cache if enabled.
+
+    See :meth:`openforms.prefill.base.BasePlugin.get_prefill_values` for the
+    parameters. Empty results are not cached, as they may be caused by a (temporary)
+    failure of the backend.
+    """
+    if plugin.identifier not in settings.PREFILL_CACHE_PLUGINS or not (
+        identity := _get_identity(submission)
+    ):
+        return plugin.get_prefill_values(submission, attributes, identifier_role)
+
+    if not (identifier := plugin.get_identifier_value(submission, identifier_role)):
+        return plugin.get_prefill_values(submission, attributes, identifier_role)
+
+    timeout: int = settings.PREFILL_CACHE_TIMEOUT
+    fernet = Fernet(base64.urlsafe_b64encode(_hmac("encryption", *identity)))
+    version_key = _get_version_key(*identity)
+
+    def get_entry_key(version: str) -> str:
+        parts = (plugin.identifier, identifier_role, identifier, *sorted(attributes))
+        return f"prefill-cache:{_hmac(version, *parts).hex()}"
+
+    if (version := cache.get(version_key)) is not None and (
+        token := cache.get(get_entry_key(version))
+    ) is not None:
+        try:
+            return json.loads(fernet.decrypt(token, ttl=timeout))
+        except InvalidToken:
+            logger.warning("Discarding invalid cached prefill values")
+
+    values = plugin.get_prefill_values(submission, attributes, identifier_role)
+    if not values:
+        return values
+
+    try:
+        data = json.dumps(values).encode()
+    except TypeError:
+        logger.warning(
+            "Prefill values of plugin '%s' can't be cached", plugin.identifier
+        )
+        return values
+
+    version = cache.get_or_set(version_key, secrets.token_hex(16), timeout=timeout)
+    cache.touch(version_key, timeout=timeout)
+    cache.set(get_entry_key(version), fernet.encrypt(data), timeout=timeout)
+    return values
+
+
+def clear_cached_prefill_values(auth_attribute: str, auth_value: str) -> None:
+    """
+    Discard the cached prefill values of the user with the given identity.
+    """
+    cache.delete(_get_version_key(auth_attribute, auth_value))
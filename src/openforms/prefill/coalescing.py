@@ -0,0 +1,79 @@
+"""
+Coalesce identical upstream requests made while prefilling a submission.
+
+Multiple prefill plugins and variables may need the same upstream record, e.g. every
+Objects API variable (and the ownership check) retrieves the object referenced by the
+submission. While :func:`coalesce_requests` is active, calls made through
+:func:`coalesced` with the same key are executed only once, also when they are made
+concurrently from the prefill worker threads - the other callers wait for and share the
+result of the first call.
+
+Note that the threads must run in a copy of the context (see
+:func:`contextvars.copy_context`) to see the active coalescing scope.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_current_calls: ContextVar[_CoalescedCalls | None] = ContextVar(
+    "prefill_coalesced_calls", default=None
+)
+
+
+class _CoalescedCalls:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: dict[Hashable, Future] = {}
+
+    def call(self, key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            is_first = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+
+        if is_first:
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            future.set_result(result)
+        return future.result()
+
+
+@contextmanager
+def coalesce_requests() -> Iterator[None]:
+    """
+    Activate a scope in which identical calls made through :func:`coalesced` are
+    executed only once.
+    """
+    if _current_calls.get() is not None:
+        yield
+        return
+
+    token = _current_calls.set(_CoalescedCalls())
+    try:
+        yield
+    finally:
+        _current_calls.reset(token)
+
+
+def coalesced(key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call ``fn`` with the given arguments, or share the result of an earlier call with
+    the same ``key`` in the active :func:`coalesce_requests` scope.
+
+    The (shared) result must be treated as read-only by the callers.
+    """
+    if (calls := _current_calls.get()) is None:
+        return fn(*args, **kwargs)
+    return calls.call(key, fn, *args, **kwargs)
@@ -16,6 +16,7 @@ from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.submissions.models import Submission
 
 from ...base import BasePlugin
+from ...coalescing import coalesced
 from ...constants import IdentifierRoles
 from ...registry import register
 from .constants import AttributesV1, AttributesV2
@@ -59,7 +60,13 @@ class HaalCentraalPrefill(BasePlugin):
         bsn: str,
         attributes: list[str],
     ) -> dict[str, Any]:
-        if not (data := client.find_person(bsn, attributes=attributes)):
+        data = coalesced(
+            ("haalcentraal_brp", client.base_url, bsn, tuple(attributes)),
+            client.find_person,
+            bsn,
+            attributes=attributes,
+        )
+        if not data:
             return {}
 
         values = dict()
@@ -13,6 +13,7 @@ from openforms.submissions.models import Submission
 from openforms.typing import JSONEncodable, JSONObject
 
 from ...base import BasePlugin
+from ...coalescing import coalesced
 from ...registry import register
 from .api.serializers import ObjectsAPIOptionsSerializer
 from .typing import ObjectsAPIOptions
@@ -51,8 +52,14 @@ class ObjectsAPIPrefill(BasePlugin[ObjectsAPIOptions]):
         submission: Submission,
         options: ObjectsAPIOptions,
     ) -> dict[str, JSONEncodable]:
+        reference = submission.initial_data_reference
         with get_objects_client(options["objects_api_group"]) as client:
-            obj = client.get_object(submission.initial_data_reference)
+            # the object is also retrieved for the ownership check
+            obj = coalesced(
+                ("objects_api", client.base_url, reference),
+                client.get_object,
+                reference,
+            )
 
         obj_record = obj.get("record", {})
         prefix = "data"
@@ -50,6 +50,7 @@ from openforms.submissions.models.submission_value_variable import (
 from openforms.typing import JSONEncodable
 from openforms.variables.constants import FormVariableSources
 
+from .coalescing import coalesce_requests
 from .registry import Registry, register as default_register
 from .sources import (
     fetch_prefill_values_from_attribute,
@@ -150,18 +151,20 @@ def prefill_variables(submission: Submission, register: Registry | None = None)
             ):
                 variables_with_attribute.append(variable)
 
-    if variables_with_attribute and (
-        results_from_attribute := fetch_prefill_values_from_attribute(
-            submission, register, variables_with_attribute
-        )
-    ):
-        prefill_data.update(**results_from_attribute)
-    if variables_with_options and (
-        results_from_options := fetch_prefill_values_from_options(
-            submission, register, variables_with_options
-        )
-    ):
-        prefill_data.update(**results_from_options)
+    # the plugins share the upstream records they retrieve for this submission
+    with coalesce_requests():
+        if variables_with_attribute and (
+            results_from_attribute := fetch_prefill_values_from_attribute(
+                submission, register, variables_with_attribute
+            )
+        ):
+            prefill_data.update(**results_from_attribute)
+        if variables_with_options and (
+            results_from_options := fetch_prefill_values_from_options(
+                submission, register, variables_with_options
+            )
+        ):
+            prefill_data.update(**results_from_options)
 
     total_config_wrapper = submission.total_configuration_wrapper
     for variable_key, prefill_value in prefill_data.items():
@@ -1,5 +1,8 @@
 import logging
 from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextvars import copy_context
+from typing import TypeVar
 
 from django.core.exceptions import PermissionDenied
 
@@ -15,11 +18,32 @@ from openforms.submissions.models.submission_value_variable import (
 from openforms.typing import JSONEncodable
 
 from .base import BasePlugin
+from .cache import get_cached_prefill_values
 from .constants import IdentifierRoles
 from .registry import Registry
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _invoke_concurrently(fn: Callable[[T], R], items: list[T]) -> Iterator[R]:
+    """
+    Call ``fn`` for each of the items, concurrently if there is more than one.
+
+    The calls run in a copy of the current context, so that the plugins share the
+    coalesced requests (see :mod:`openforms.prefill.coalescing`).
+    """
+    if len(items) <= 1:
+        yield from map(fn, items)
+        return
+
+    with parallel() as executor:
+        futures = [executor.submit(copy_context().run, fn, item) for item in items]
+    for future in futures:
+        yield future.result()
+
 
 def fetch_prefill_values_from_attribute(
     submission: Submission,
@@ -62,7 +86,9 @@ def fetch_prefill_values_from_attribute(
 
         attributes = [attribute for field in fields for attribute in field]
         try:
-            values = plugin.get_prefill_values(submission, attributes, identifier_role)
+            values = get_cached_prefill_values(
+                plugin, submission, attributes, identifier_role
+            )
         except Exception as e:
             logger.exception(f"exception in prefill plugin '{plugin_id}'")
             logevent.prefill_retrieve_failure(submission, plugin, e)
@@ -86,10 +112,7 @@ def fetch_prefill_values_from_attribute(
         for identifier_role, fields in field_groups.items():
             invoke_plugin_args.append((plugin, identifier_role, fields))
 
-    with parallel() as executor:
-        results = executor.map(invoke_plugin, invoke_plugin_args)
-
-    for fields, values in list(results):
+    for fields, values in _invoke_concurrently(invoke_plugin, invoke_plugin_args):
         for attribute, value in values.items():
             for field in fields:
                 for attr, var_key in field.items():
@@ -106,20 +129,11 @@ def fetch_prefill_values_from_options(
     # local import to prevent AppRegistryNotReady:
     from openforms.logging import logevent
 
-    values: dict[str, JSONEncodable] = {}
-    for variable in variables:
-        plugin = register[variable.form_variable.prefill_plugin]
-        raw_options = variable.form_variable.prefill_options
-
-        # validate the options before processing them
-        options_serializer = plugin.options(data=raw_options)
-        try:
-            options_serializer.is_valid(raise_exception=True)
-        except ValidationError as exc:
-            logevent.prefill_retrieve_failure(submission, plugin, exc)
-            continue
-
-        plugin_options = options_serializer.validated_data
+    @elasticapm.capture_span(span_type="app.prefill")
+    def invoke_plugin(
+        item: tuple[BasePlugin, dict],
+    ) -> dict[str, JSONEncodable]:
+        plugin, plugin_options = item
 
         # If an `initial_data_reference` was passed, we must verify that the
         # authenticated user is the owner of the referenced object
@@ -152,11 +166,33 @@ def fetch_prefill_values_from_options(
         except Exception as exc:
             logger.exception(f"exception in prefill plugin '{plugin.identifier}'")
             logevent.prefill_retrieve_failure(submission, plugin, exc)
+            return {}
+
+        if new_values:
+            logevent.prefill_retrieve_success(submission, plugin, new_values)
         else:
-            if new_values:
-                values.update(**new_values)
-                logevent.prefill_retrieve_success(submission, plugin, values)
-            else:
-                logevent.prefill_retrieve_empty(submission, plugin, values)
+            logevent.prefill_retrieve_empty(submission, plugin, new_values)
+        return new_values
+
+    invoke_plugin_args = []
+    for variable in variables:
+        plugin = register[variable.form_variable.prefill_plugin]
+        raw_options = variable.form_variable.prefill_options
+
+        # validate the options before processing them
+        options_serializer = plugin.options(data=raw_options)
+        try:
+            options_serializer.is_valid(raise_exception=True)
+        except ValidationError as exc:
+            logevent.prefill_retrieve_failure(submission, plugin, exc)
+            continue
+
+        invoke_plugin_args.append((plugin, options_serializer.validated_data))
+
+    values: dict[str, JSONEncodable] = {}
+    # the results are in the order of the variables, an exception (failed ownership
+    # check) is raised once the preceding results have been collected
+    for new_values in _invoke_concurrently(invoke_plugin, invoke_plugin_args):
+        values.update(**new_values)
 
     return values
@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from openforms.authentication.service import AuthAttribute
+from openforms.authentication.signals import authentication_logout
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..cache import get_cached_prefill_values
+from ..constants import IdentifierRoles
+from ..contrib.demo.constants import Attributes
+from ..contrib.demo.plugin import DemoPrefill
+from ..registry import register
+
+ATTRIBUTES = [Attributes.random_string, Attributes.random_number]
+
+
+@override_settings(PREFILL_CACHE_PLUGINS=["demo"], PREFILL_CACHE_TIMEOUT=60)
+class PrefillCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.plugin = register["demo"]
+        self.addCleanup(cache.clear)
+
+        patcher = patch.object(
+            DemoPrefill, "get_prefill_values", wraps=DemoPrefill.get_prefill_values
+        )
+        self.mock_get_prefill_values = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_values(self, submission):
+        return get_cached_prefill_values(
+            self.plugin, submission, ATTRIBUTES, IdentifierRoles.main
+        )
+
+    def test_values_cached_for_identity(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+        other_form_submission = SubmissionFactory.create(auth_info__value="111222333")
+
+        values = self._get_values(submission)
+
+        self.assertEqual(self._get_values(submission), values)
+        self.assertEqual(self._get_values(other_form_submission), values)
+        self.mock_get_prefill_values.assert_called_once()
+
+        with self.subTest("other attributes"):
+            self.assertEqual(
+                get_cached_prefill_values(
+                    self.plugin,
+                    submission,
+                    [Attributes.random_string],
+                    IdentifierRoles.main,
+                ).keys(),
+                {Attributes.random_string},
+            )
+            self.assertEqual(self.mock_get_prefill_values.call_count, 2)
+
+        with self.subTest("other identity"):
+            self._get_values(SubmissionFactory.create(auth_info__value="123456782"))
+            self.assertEqual(self.mock_get_prefill_values.call_count, 3)
+
+    @override_settings(PREFILL_CACHE_PLUGINS=[])
+    def test_disabled_for_plugin(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+
+        self._get_values(submission)
+        self._get_values(submission)
+
+        self.assertEqual(self.mock_get_prefill_values.call_count, 2)
+
+    def test_not_cached_for_anonymous_users(self):
+        submission = SubmissionFactory.create()
+
+        self._get_values(submission)
+        self._get_values(submission)
+
+        self.assertEqual(self.mock_get_prefill_values.call_count, 2)
+
+    def test_empty_values_not_cached(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+        self.mock_get_prefill_values.side_effect = None
+        self.mock_get_prefill_values.return_value = {}
+
+        self._get_values(submission)
+        self._get_values(submission)
+
+        self.assertEqual(self.mock_get_prefill_values.call_count, 2)
+
+    def test_values_and_identifier_not_readable_from_cache(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+
+        with patch.object(cache, "set", wraps=cache.set) as mock_set:
+            values = self._get_values(submission)
+
+        (key, token), _ = mock_set.call_args
+        self.assertNotIn("111222333", key)
+        self.assertIsInstance(token, bytes)
+        self.assertNotIn(values[Attributes.random_string].encode(), token)
+
+    def test_logout_discards_cached_values(self):
+        submission = SubmissionFactory.create(
+            auth_info__attribute=AuthAttribute.bsn, auth_info__value="111222333"
+        )
+        other_user_submission = SubmissionFactory.create(
+            auth_info__attribute=AuthAttribute.bsn, auth_info__value="123456782"
+        )
+        self._get_values(submission)
+        self._get_values(other_user_submission)
+
+        request = RequestFactory().post("/")
+        request.session = {}
+        authentication_logout.send(
+            sender=None,
+            request=request,
+            auth_attribute=AuthAttribute.bsn,
+            auth_value="111222333",
+        )
+
+        self._get_values(submission)
+        self._get_values(other_user_submission)
+        self.assertEqual(self.mock_get_prefill_values.call_count, 3)
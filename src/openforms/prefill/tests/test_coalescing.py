@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from ..coalescing import coalesce_requests, coalesced
+
+
+class CoalescedTests(SimpleTestCase):
+    def test_calls_made_directly_without_scope(self):
+        fetch = Mock(return_value={"record": 1})
+
+        coalesced("key", fetch, "a")
+        coalesced("key", fetch, "a")
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_calls_with_same_key_made_once(self):
+        fetch = Mock(side_effect=lambda reference: {"reference": reference})
+
+        with coalesce_requests():
+            first = coalesced(("record", "a"), fetch, "a")
+            second = coalesced(("record", "a"), fetch, "a")
+            other = coalesced(("record", "b"), fetch, "b")
+
+        self.assertIs(first, second)
+        self.assertEqual(other, {"reference": "b"})
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_scopes_are_not_shared(self):
+        fetch = Mock(return_value={"record": 1})
+
+        with coalesce_requests():
+            coalesced("key", fetch)
+        with coalesce_requests():
+            coalesced("key", fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_exceptions_are_shared(self):
+        fetch = Mock(side_effect=ConnectionError("down"))
+
+        with coalesce_requests():
+            for _ in range(2):
+                with self.assertRaisesMessage(ConnectionError, "down"):
+                    coalesced("key", fetch)
+
+        fetch.assert_called_once()
+
+    def test_concurrent_calls_wait_for_the_first_call(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(threading.current_thread().name)
+            started.set()
+            release.wait(timeout=5)
+            return {"record": 1}
+
+        with coalesce_requests(), ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(copy_context().run, coalesced, "key", fetch)
+            started.wait(timeout=5)
+            second = executor.submit(copy_context().run, coalesced, "key", fetch)
+            release.set()
+
+            self.assertIs(first.result(), second.result())
+
+        self.assertEqual(len(calls), 1)
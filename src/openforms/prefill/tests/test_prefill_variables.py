@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import patch
 
 from django.core.exceptions import PermissionDenied
@@ -28,6 +29,7 @@ from openforms.submissions.tests.factories import (
 )
 from openforms.variables.constants import FormVariableDataTypes
 
+from ..coalescing import coalesced
 from ..contrib.demo.plugin import DemoPrefill
 from ..service import prefill_variables
 from .utils import get_test_register
@@ -260,6 +262,22 @@ class OwnershipCheckFailsPlugin(DemoPrefill):
         return {options["var_key"]: options["var_value"]}
 
 
+@prefill_from_options_register("shared-record")
+class SharedRecordPlugin(DemoPrefill):
+    options = OptionsSerializer
+    fetched_in_threads: list[str] = []
+
+    @classmethod
+    def get_prefill_values_from_options(cls, submission: Submission, options):
+        record = coalesced(("shared-record", "some reference"), cls._fetch_record)
+        return {options["var_key"]: record[options["var_value"]]}
+
+    @classmethod
+    def _fetch_record(cls):
+        cls.fetched_in_threads.append(threading.current_thread().name)
+        return {"first_name": "John", "last_name": "Doe"}
+
+
 class PrefillVariablesFromOptionsTests(TestCase):
     @patch(
         "openforms.prefill.service.fetch_prefill_values_from_options",
@@ -515,3 +533,32 @@ class PrefillVariablesTransactionTests(TransactionTestCase):
 
         for log in logs:
             self.assertNotEqual(log.event, "prefill_retrieve_success")
+
+    def test_options_prefill_concurrent_with_coalesced_requests(self):
+        SharedRecordPlugin.fetched_in_threads = []
+        form = FormFactory.create(generate_minimal_setup=True)
+        for key, attribute in (
+            ("voornamen", "first_name"),
+            ("achternaam", "last_name"),
+        ):
+            FormVariableFactory.create(form=form, key=key, user_defined=True)
+            FormVariableFactory.create(
+                form=form,
+                key=f"{key}Prefill",
+                user_defined=True,
+                prefill_plugin="shared-record",
+                prefill_options={"var_key": key, "var_value": attribute},
+            )
+        submission = SubmissionFactory.create(form=form)
+
+        prefill_variables(submission=submission, register=prefill_from_options_register)
+
+        variables_state = submission.load_submission_value_variables_state()
+        data = variables_state.get_data()
+        self.assertEqual(data["voornamen"], "John")
+        self.assertEqual(data["achternaam"], "Doe")
+        # one upstream request for both variables, made from a worker thread
+        self.assertEqual(len(SharedRecordPlugin.fetched_in_threads), 1)
+        self.assertNotEqual(
+            SharedRecordPlugin.fetched_in_threads[0], threading.current_thread().name
+        )
@@ -12,7 +12,10 @@ from rest_framework.request import Request
 from rest_framework.settings import api_settings
 
 from openforms.formio.service import build_serializer, get_dynamic_configuration
+from openforms.formio.typing import Component
 from openforms.forms.models import FormDefinition, FormStep
+from openforms.typing import DataMapping
+from openforms.validations.batch import PluginValidationBatch
 
 from ..models import Submission, SubmissionStep
 from .fields import PrivacyPolicyAcceptedField, TruthDeclarationAcceptedField
@@ -80,10 +83,14 @@ class SubmissionCompletionSerializer(serializers.Serializer):
         # of errors must match the index of the steps in the form.
         all_step_errors: list[StepValidationErrors] = []
         step_errors: StepValidationErrors
+        # the validation plugin calls of all steps are collected and executed at once,
+        # after which the affected steps are validated again
+        plugin_validations = PluginValidationBatch()
+        revalidate: dict[int, list[Component]] = {}
 
         data = submission.data
 
-        for step in submission.steps:
+        for index, step in enumerate(submission.steps):
             form_step = step.form_step
             assert isinstance(form_step, FormStep)
             form_definition = form_step.form_definition
@@ -118,18 +125,27 @@ class SubmissionCompletionSerializer(serializers.Serializer):
                     submission=submission,
                     data=data,
                 ).configuration
-                step_data_serializer = build_serializer(
-                    configuration["components"],
-                    data=data,
-                    context={"submission": submission},
-                )
-                if not step_data_serializer.is_valid():
-                    step_errors["data"] = (  # pyright: ignore[reportArgumentType]
-                        step_data_serializer.errors
-                    )
+                components = configuration["components"]
+                deferred = plugin_validations.deferred
+                with plugin_validations:
+                    self._validate_step_data(step_errors, components, data)
+                if plugin_validations.deferred != deferred:
+                    revalidate[index] = components
 
             all_step_errors.append(step_errors)
 
+        # a plugin is only called when the plugins before it are invalid, which can
+        # defer the next plugin in another round
+        while revalidate:
+            plugin_validations.run()
+            pending, revalidate = revalidate, {}
+            for index, components in pending.items():
+                deferred = plugin_validations.deferred
+                with plugin_validations:
+                    self._validate_step_data(all_step_errors[index], components, data)
+                if plugin_validations.deferred != deferred:
+                    revalidate[index] = components
+
         assert len(all_step_errors) == len(
             submission.steps
         ), "Detected a mismatch in validation errors list with actual submission steps."
@@ -140,6 +156,24 @@ class SubmissionCompletionSerializer(serializers.Serializer):
 
         return attrs
 
+    def _validate_step_data(
+        self,
+        step_errors: StepValidationErrors,
+        components: list[Component],
+        data: DataMapping,
+    ) -> None:
+        step_data_serializer = build_serializer(
+            components,
+            data=data,
+            context={"submission": self.context["submission"]},
+        )
+        if not step_data_serializer.is_valid():
+            step_errors["data"] = (  # pyright: ignore[reportArgumentType]
+                step_data_serializer.errors
+            )
+        else:
+            step_errors.pop("data", None)
+
     def save(self, **kwargs) -> None:
         status_url: str = kwargs.pop("status_url")
         submission = self.context["submission"]
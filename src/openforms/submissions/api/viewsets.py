@@ -2,8 +2,11 @@ import contextlib
 import logging
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.types import OpenApiTypes
@@ -357,6 +360,7 @@ class SubmissionViewSet(
         request=None,
         responses={
             200: SubmissionProcessingStatusSerializer,
+            304: None,
             403: ExceptionSerializer,
             429: ExceptionSerializer,
         },
@@ -368,6 +372,17 @@ class SubmissionViewSet(
                 description=_("Time-based authentication token"),
                 required=True,
             ),
+            OpenApiParameter(
+                "wait",
+                OpenApiTypes.INT,
+                OpenApiParameter.QUERY,
+                description=_(
+                    "Number of seconds to wait for the processing to progress before "
+                    "responding, if it is still in progress. The waiting time is "
+                    "limited by the server configuration."
+                ),
+                required=False,
+            ),
         ],
     )
     @action(
@@ -382,16 +397,40 @@ class SubmissionViewSet(
         Obtain the current submission processing status, after completing it.
 
         The submission is processed asynchronously. Poll this endpoint to receive
-        information on the status of this async processing.
+        information on the status of this async processing. While the processing is
+        in progress, the response has an `ETag` header - pass it in the
+        `If-None-Match` header to receive an empty `304` response if nothing changed.
+        Use the `wait` query parameter to let the server respond as soon as the
+        processing progresses instead of polling frequently.
         """
         submission = self.get_object()
         status = SubmissionProcessingStatus(request, submission)
+        if wait := self._get_status_wait_time(request):
+            status = status.wait_for_change(timeout=wait)
         status.ensure_failure_can_be_managed()
+
+        if etag := status.get_etag():
+            etag = quote_etag(etag)
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
         serializer = SubmissionProcessingStatusSerializer(
             instance=status,
             context={"request": request, "view": self},
         )
-        return Response(serializer.data)
+        response = Response(serializer.data)
+        if etag:
+            response["ETag"] = etag
+        return response
+
+    @staticmethod
+    def _get_status_wait_time(request: Request) -> int:
+        try:
+            wait = int(request.query_params.get("wait", 0))
+        except ValueError:
+            return 0
+        return max(0, min(wait, settings.SUBMISSION_STATUS_MAX_WAIT))
 
     @extend_schema(
         summary=_("Suspend a submission"),
@@ -663,6 +702,7 @@ class SubmissionStepViewSet(
                 submission,
                 submission_step,
                 merged_data.data,
+                incremental=True,
                 request=request,
             )
             submission_step.form_step.form_definition.configuration = new_configuration
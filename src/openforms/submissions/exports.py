@@ -1,19 +1,36 @@
+import csv
 import dataclasses
-from typing import Iterator
+import json
+from copy import copy
+from io import BytesIO, StringIO
+from itertools import chain
+from tempfile import TemporaryFile
+from typing import Any, Iterable, Iterator
 
 from django.db import models
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
 from tablib.formats._json import serialize_objects_handler
 
+from openforms.forms.models import Form, FormStep
+
 from .models import Submission
 from .rendering.base import Node
 from .rendering.constants import RenderModes
 from .rendering.renderer import Renderer
 
+# the number of submissions to load from the database at once
+EXPORT_CHUNK_SIZE = 200
+
+# the name tablib gives to the worksheet of an exported dataset
+XLSX_SHEET_TITLE = "Tablib Dataset"
+
 
 @dataclasses.dataclass
 class FileType:
@@ -39,58 +56,268 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
-def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+@dataclasses.dataclass
+class _FormExportState:
     """
-    Turn a submissions queryset into a tablib dataset for export.
+    The data of a form that is shared by all its exported submissions.
+    """
+
+    form: Form
+    form_steps: list[FormStep]
+    configurations: dict[int, str]
+    """
+    The serialized configuration of each form definition, by form definition ID.
+    """
+
+    @classmethod
+    def load(cls, form_id: int) -> "_FormExportState":
+        form = Form.objects.prefetch_related("formvariable_set").get(pk=form_id)
+        form_steps = list(
+            form.formstep_set.select_related("form_definition").order_by("order")
+        )
+        for form_step in form_steps:
+            form_step.form = form
+        return cls(
+            form=form,
+            form_steps=form_steps,
+            configurations={
+                form_step.form_definition.pk: json.dumps(
+                    form_step.form_definition.configuration
+                )
+                for form_step in form_steps
+            },
+        )
+
+    def get_form_steps(self) -> list[FormStep]:
+        """
+        Return copies of the form steps for a single submission.
+
+        Evaluating the logic of a submission modifies the configuration of its form
+        definitions, so every submission needs its own copies.
+        """
+        form_steps = []
+        for form_step in self.form_steps:
+            form_definition = copy(form_step.form_definition)
+            form_definition.configuration = json.loads(
+                self.configurations[form_definition.pk]
+            )
+            form_step = copy(form_step)
+            form_step.form_definition = form_definition
+            form_steps.append(form_step)
+        return form_steps
+
+
+def _iter_submissions(
+    queryset: models.QuerySet[Submission], chunk_size: int
+) -> Iterator[Submission]:
+    """
+    Iterate over the submissions in the order of the queryset, loading them in chunks.
+
+    The related data that is needed to render a submission is loaded for the whole
+    chunk, and the form, its steps and variables are loaded only once per form.
+    """
+    pks = list(queryset.values_list("pk", flat=True))
+    submissions = Submission.objects.select_related("auth_info").prefetch_related(
+        "submissionstep_set", "submissionvaluevariable_set"
+    )
+    forms: dict[int, _FormExportState] = {}
+    for start in range(0, len(pks), chunk_size):
+        chunk_pks = pks[start : start + chunk_size]
+        chunk = submissions.in_bulk(chunk_pks)
+        for pk in chunk_pks:
+            submission = chunk[pk]
+            if (form_state := forms.get(submission.form_id)) is None:
+                form_state = forms[submission.form_id] = _FormExportState.load(
+                    submission.form_id
+                )
+            submission.form = form_state.form
+            submission.load_execution_state(form_steps=form_state.get_form_steps())
+            yield submission
+
+
+def _get_submission_row(
+    submission: Submission, data_nodes: Iterable[Node], translation_enabled: bool
+) -> list[Any]:
+    inzending_datum = (
+        make_naive(submission.completed_on) if submission.completed_on else None
+    )
+    row = [submission.form.admin_name, inzending_datum]
+    if translation_enabled:
+        row.append(submission.language_code)
+    row += [data_node.value for data_node in data_nodes]
+    return row
+
+
+def iter_submission_export(
+    queryset: models.QuerySet[Submission], chunk_size: int | None = None
+) -> tuple[list[str], Iterator[list[Any]]]:
+    """
+    Turn a submissions queryset into the headers and (lazily produced) rows of an
+    export.
+
+    The submissions are processed in the order of the queryset, one chunk of
+    submissions at a time, so that large exports can be streamed.
 
     .. note:: the queryset of submissions must all be of the same form!
+
+    :param chunk_size: The number of submissions to load at once, defaults to
+      :data:`EXPORT_CHUNK_SIZE`.
+    :returns: A tuple of the headers and an iterator over the rows. The headers are
+      empty if there are no submissions.
     """
+    submissions = _iter_submissions(
+        queryset, chunk_size=chunk_size or EXPORT_CHUNK_SIZE
+    )
     # queryset *could* be empty
-    if not queryset:
-        return tablib.Dataset()
+    if (first_submission := next(submissions, None)) is None:
+        return [], iter([])
 
-    first_submission = queryset[0]
+    translation_enabled = first_submission.form.translation_enabled
     headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
+    if translation_enabled:
         headers.append("Taalcode")
 
-    for data_node in iter_submission_data_nodes(first_submission):
+    data_nodes = list(iter_submission_data_nodes(first_submission))
+    for data_node in data_nodes:
         if hasattr(data_node, "component"):
             headers.append(data_node.component["key"])
         elif hasattr(data_node, "variable"):
             headers.append(data_node.variable.key)
 
+    rows = chain(
+        [_get_submission_row(first_submission, data_nodes, translation_enabled)],
+        (
+            _get_submission_row(
+                submission,
+                iter_submission_data_nodes(submission),
+                translation_enabled,
+            )
+            for submission in submissions
+        ),
+    )
+    return headers, rows
+
+
+def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+    """
+    Turn a submissions queryset into a tablib dataset for export.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    headers, rows = iter_submission_export(queryset)
+    if not headers:
+        return tablib.Dataset()
+
     data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
+    return data
+
 
-    for submission in queryset:
-        inzending_datum = (
-            make_naive(submission.completed_on) if submission.completed_on else None
+def _stream_csv(headers: list[str], rows: Iterable[list[Any]]) -> Iterator[str]:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    for row in chain([headers] if headers else [], rows):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _stream_json(headers: list[str], rows: Iterable[list[Any]]) -> Iterator[str]:
+    # same output as the tablib JSON format
+    yield "["
+    for index, row in enumerate(rows):
+        record = json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
-        ]
-        if first_submission.form.translation_enabled:
-            submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
-    return data
+        yield f", {record}" if index else record
+    yield "]"
+
+
+def _stream_xml(headers: list[str], rows: Iterable[list[Any]]) -> Iterator[bytes]:
+    buffer = BytesIO()
+    with etree.xmlfile(buffer, encoding="utf8") as xml_file:
+        xml_file.write_declaration()
+        with xml_file.element("submissions"):
+            xml_file.write("\n")
+            for row in rows:
+                element = _xml_submission_element(dict(zip(headers, row)))
+                # same formatting as the pretty printed tablib XML format
+                etree.indent(element, level=1)
+                xml_file.write("  ", element, "\n")
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    yield buffer.getvalue() + b"\n"
+
+
+def _write_xlsx(headers: list[str], rows: Iterable[list[Any]], file) -> None:
+    # write-only workbooks stream the rows to the file, rather than keeping all the
+    # cells in memory
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(XLSX_SHEET_TITLE)
+
+    bold = Font(bold=True)
+    wrap_text = Alignment(wrap_text=True)
+
+    def _cell(value, header: bool = False) -> WriteOnlyCell:
+        try:
+            cell = WriteOnlyCell(worksheet, value=value)
+        except ValueError:
+            cell = WriteOnlyCell(worksheet, value=str(value))
+        if header:
+            cell.font = bold
+        elif "\n" in str(value):
+            cell.alignment = wrap_text
+        return cell
+
+    if headers:
+        worksheet.freeze_panes = "A2"
+        worksheet.append([_cell(header, header=True) for header in headers])
+    for row in rows:
+        worksheet.append([_cell(value) for value in row])
+    workbook.save(file)
 
 
 def export_submissions(
     queryset: models.QuerySet[Submission], file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> StreamingHttpResponse | FileResponse:
+    """
+    Export the submissions in the requested file format.
+
+    The export file is produced while the response is being sent, so that the
+    submissions don't need to be held in memory. XLSX files can only be written as a
+    whole - the workbook is written to a temporary file first.
+    """
+    headers, rows = iter_submission_export(queryset)
     filename = f"submissions_export.{file_type.extension}"
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if file_type == ExportFileTypes.XLSX:
+        file = TemporaryFile()
+        _write_xlsx(headers, rows, file)
+        file.seek(0)
+        return FileResponse(
+            file,
+            as_attachment=True,
+            filename=filename,
+            content_type=file_type.content_type,
+        )
 
+    match file_type:
+        case ExportFileTypes.CSV:
+            content = _stream_csv(headers, rows)
+        case ExportFileTypes.JSON:
+            content = _stream_json(headers, rows)
+        case ExportFileTypes.XML:
+            content = _stream_xml(headers, rows)
+        case _:  # pragma: no cover
+            raise ValueError(f"Unsupported file type {file_type.extension}")
+
+    response = StreamingHttpResponse(content, content_type=file_type.content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
 
@@ -116,6 +343,14 @@ def _xml_value(parent, value, wrap_single=False):
         node.text = _xml_basic_value(value)
 
 
+def _xml_submission_element(row: dict[str, Any]) -> etree._Element:
+    elem = etree.Element("submission")
+    for key, value in row.items():
+        field = etree.SubElement(elem, "field", name=key)
+        _xml_value(field, value, wrap_single=True)
+    return elem
+
+
 class XMLKeyValueExport:
     title = "xml"
 
@@ -141,10 +376,7 @@ class XMLKeyValueExport:
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            root.append(_xml_submission_element(row))
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
 from django.utils.functional import empty
 
 import elasticapm
@@ -13,18 +14,61 @@ from openforms.formio.utils import get_component_empty_value
 from openforms.typing import DataMapping
 
 from .logic.actions import ActionOperation
-from .logic.rules import get_rules_to_evaluate, iter_evaluate_rules
+from .logic.rules import (
+    LogicEvaluationRecord,
+    RuleOutcome,
+    get_changed_keys,
+    get_rule_dependency_graph,
+    get_rules_fingerprint,
+    get_rules_to_evaluate,
+    iter_evaluate_rules,
+)
 from .models.submission_step import DirtyData
 
 if TYPE_CHECKING:
     from .models import Submission, SubmissionStep
 
+# Evaluation records only need to outlive the debounce interval of the logic checks
+# while a user is filling out a step.
+EVALUATION_RECORD_TIMEOUT = 60 * 15
+
+
+def _get_evaluation_record_cache_key(
+    submission: "Submission", step: "SubmissionStep"
+) -> str:
+    return f"form-logic-evaluation:{submission.uuid}:{step.form_step.uuid}"
+
+
+def _get_reusable_outcomes(
+    submission: "Submission",
+    previous: LogicEvaluationRecord | None,
+    record: LogicEvaluationRecord,
+) -> dict[int, RuleOutcome]:
+    """
+    Determine which rule outcomes of the previous evaluation are still valid.
+
+    Only the rules that (transitively) depend on the data that changed since the
+    previous evaluation need to be evaluated again.
+    """
+    if previous is None or previous.fingerprint != record.fingerprint:
+        return {}
+
+    changed_keys = get_changed_keys(previous.data, record.data)
+    graph = get_rule_dependency_graph(submission.form)
+    affected = {rule.pk for rule in graph.get_affected_rules(changed_keys)}
+    return {
+        rule_id: outcome
+        for rule_id, outcome in previous.outcomes.items()
+        if rule_id not in affected
+    }
+
 
 @elasticapm.capture_span(span_type="app.submissions.logic")
 def evaluate_form_logic(
     submission: "Submission",
     step: "SubmissionStep",
     data: DataMapping,
+    incremental: bool = False,
     **context,
 ) -> DataMapping:
     """
@@ -66,6 +110,10 @@ def evaluate_form_logic(
     :param step: Submission-step instance.
     :param data: Submitted data. This data is assumed to be valid, as we perform a
       conversion to the Python-type domain.
+    :param incremental: Re-use the outcome of the previous (incremental) evaluation
+      for this submission step where possible. Only the logic rules affected by the
+      data that changed since then are evaluated again, the result is identical to
+      a full evaluation.
 
     """
     # grab the configuration that will be mutated
@@ -89,11 +137,30 @@ def evaluate_form_logic(
 
     # 4. Apply the (dirty) data to the variable state.
     submission_variables_state.set_values(FormioData(data))
-    initial_data = submission_variables_state.to_python()
     data_for_evaluation = submission_variables_state.to_python()
+    # values are replaced (never mutated in place) during the evaluation, so keeping
+    # references to the initial values is sufficient to compare before and after
+    initial_data = data_for_evaluation.snapshot(
+        [
+            *submission_variables_state.variables,
+            *submission_variables_state.get_static_data(),
+            *config_wrapper.component_map,
+        ]
+    )
 
     rules = get_rules_to_evaluate(submission, step)
 
+    record, reusable_outcomes = None, None
+    if incremental:
+        cache_key = _get_evaluation_record_cache_key(submission, step)
+        record = LogicEvaluationRecord(
+            fingerprint=get_rules_fingerprint(rules),
+            data=initial_data,
+        )
+        reusable_outcomes = _get_reusable_outcomes(
+            submission, previous=cache.get(cache_key), record=record
+        )
+
     # 5. Evaluate the logic rules in order
     mutation_operations = []
 
@@ -108,10 +175,15 @@ def evaluate_form_logic(
             rules,
             data_for_evaluation,
             submission=submission,
+            reusable_outcomes=reusable_outcomes,
+            outcomes=record.outcomes if record else None,
         ):
             mutation_operations.append(operation)
             if mutations:
-                data_diff.update(mutations)
+                data_diff.set_many(mutations)
+
+    if record is not None:
+        cache.set(cache_key, record, timeout=EVALUATION_RECORD_TIMEOUT)
 
     # 6. Apply the dynamic configuration
 
@@ -132,12 +204,10 @@ def evaluate_form_logic(
     # (eventually) hidden BEFORE we do any further processing. This is only a bandaid
     # fix, as the (stale) data has potentially been input for other logic rules.
     # Note that only the dirty data logic check acts on these differences.
+    visibility = config_wrapper.visible_components(data_for_evaluation.data)
     for component in config_wrapper:
         key = component["key"]
-        is_visible = config_wrapper.is_visible_in_frontend(
-            key, data_for_evaluation.data
-        )
-        if is_visible:
+        if visibility[key]:
             continue
 
         # Reset the value of any field that may have become hidden again after
@@ -153,6 +223,8 @@ def evaluate_form_logic(
         # clear the value
         data_for_evaluation[key] = empty_value
         data_diff[key] = empty_value
+        # the cleared value may affect the visibility of the remaining components
+        visibility = config_wrapper.visible_components(data_for_evaluation.data)
 
     # 6.3 Interpolate the component configuration with the variables.
     inject_variables(config_wrapper, data_for_evaluation.data)
@@ -217,7 +289,7 @@ def check_submission_logic(
     ):
         mutation_operations.append(operation)
         if mutations:
-            data_diff.update(mutations)
+            data_diff.set_many(mutations)
 
     submission_variables_state.set_values(data_diff)
 
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Mapping, Self, TypedDict
 
 from django.core.cache import cache
 from django.core.serializers.json import DjangoJSONEncoder
 
 from glom import assign
-from json_logic import jsonLogic
 
 from openforms.dmn.service import evaluate_dmn
 from openforms.formio.datastructures import FormioData
@@ -16,6 +16,7 @@ from openforms.formio.service import FormioConfigurationWrapper
 from openforms.forms.constants import LogicActionTypes
 from openforms.forms.models import FormLogic
 from openforms.typing import DataMapping, JSONObject
+from openforms.utils.json_logic import CompiledExpression, compile_expression
 
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
@@ -170,13 +171,17 @@ class VariableAction(ActionOperation):
     def from_action(cls, action: ActionDict) -> Self:
         return cls(variable=action["variable"], value=action["action"]["value"])
 
+    @cached_property
+    def compiled_value(self) -> CompiledExpression:
+        return compile_expression(self.value)
+
     def eval(
         self,
         context: DataMapping,
         submission: Submission,
     ) -> DataMapping:
         with log_errors(self.value, self.rule):
-            return {self.variable: jsonLogic(self.value, context)}
+            return {self.variable: self.compiled_value(context)}
 
 
 @dataclass
@@ -0,0 +1,157 @@
+"""
+Dependency analysis of form logic rules.
+
+Every logic rule reads a number of variables (in its trigger and in the expressions of
+its actions) and may write variables (through its actions). Rules are evaluated in
+order, so a variable written by a rule can only affect the rules that come after it.
+
+The :class:`RuleDependencyGraph` indexes the rules of a form by the variables they read,
+which allows determining which rules can possibly be affected by a change in the
+submission data without evaluating all of them.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import FormLogic
+from openforms.utils.json_logic import compile_expression
+from openforms.utils.json_logic.compilation import paths_overlap
+
+
+def _root(key: str) -> str:
+    return key.split(".", 1)[0]
+
+
+@dataclass(frozen=True)
+class RuleDependencies:
+    rule: FormLogic
+    inputs: frozenset[str]
+    """
+    The variable paths read by the trigger and actions of the rule.
+    """
+    outputs: frozenset[str]
+    """
+    The variables that may be written by the actions of the rule.
+    """
+    reads_all: bool = False
+    """
+    Whether the rule reads variables that can not be determined statically, in which
+    case it must be considered as depending on every variable.
+    """
+
+    @classmethod
+    def from_rule(cls, rule: FormLogic) -> "RuleDependencies":
+        trigger = rule.compiled_trigger
+        inputs = set(trigger.input_keys)
+        outputs = set()
+        reads_all = trigger.has_dynamic_inputs
+
+        for action in rule.actions:
+            details = action.get("action", {})
+            match details.get("type"):
+                case LogicActionTypes.variable:
+                    value = compile_expression(details.get("value"))
+                    inputs.update(value.input_keys)
+                    reads_all = reads_all or value.has_dynamic_inputs
+                    outputs.add(action["variable"])
+                case LogicActionTypes.fetch_from_service:
+                    # the request parameters are templated with the submission data
+                    reads_all = True
+                    outputs.add(action["variable"])
+                case LogicActionTypes.evaluate_dmn:
+                    config = details.get("config", {})
+                    inputs.update(
+                        item["form_variable"]
+                        for item in config.get("input_mapping", [])
+                    )
+                    outputs.update(
+                        item["form_variable"]
+                        for item in config.get("output_mapping", [])
+                    )
+
+        return cls(
+            rule=rule,
+            inputs=frozenset(inputs),
+            outputs=frozenset(outputs),
+            reads_all=reads_all,
+        )
+
+    def reads(self, key: str) -> bool:
+        if self.reads_all:
+            return True
+        return any(paths_overlap(key, input_key) for input_key in self.inputs)
+
+
+class RuleDependencyGraph:
+    """
+    Index of the (ordered) logic rules of a form by the variables they read.
+    """
+
+    def __init__(self, rules: Sequence[FormLogic]):
+        self.nodes = [RuleDependencies.from_rule(rule) for rule in rules]
+        self._positions = {rule.pk: position for position, rule in enumerate(rules)}
+        self._readers: dict[str, list[int]] = {}
+        self._reads_all: list[int] = []
+
+        for position, node in enumerate(self.nodes):
+            if node.reads_all:
+                self._reads_all.append(position)
+                continue
+            for root in {_root(key) for key in node.inputs}:
+                self._readers.setdefault(root, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get_position(self, rule: FormLogic) -> int:
+        return self._positions[rule.pk]
+
+    def get_affected_positions(self, changed_keys: Iterable[str]) -> list[int]:
+        """
+        Determine which rules need to be re-evaluated after the given variables changed.
+
+        Rules reading a changed variable are affected, and so are the rules after them
+        reading any variable written by an affected rule. Only the candidate rules are
+        inspected, in rule order.
+
+        :arg changed_keys: The (dotted) keys of the variables that were changed.
+        :returns: The positions of the affected rules, in evaluation order.
+        """
+        # the changed keys, together with the position of the rule that changed them
+        # (-1 means they were changed before any rule was evaluated)
+        dirty: list[tuple[int, str]] = [(-1, key) for key in changed_keys]
+        heap = list(self._reads_all)
+        for _, key in dirty:
+            heap.extend(self._readers.get(_root(key), []))
+        heapq.heapify(heap)
+
+        affected: list[int] = []
+        last_position = -1
+        while heap:
+            position = heapq.heappop(heap)
+            if position <= last_position:
+                continue
+            last_position = position
+
+            node = self.nodes[position]
+            if not node.reads_all and not any(
+                origin < position and node.reads(key) for origin, key in dirty
+            ):
+                continue
+
+            affected.append(position)
+            for key in node.outputs:
+                dirty.append((position, key))
+                for reader in self._readers.get(_root(key), []):
+                    if reader > position:
+                        heapq.heappush(heap, reader)
+
+        return affected
+
+    def get_affected_rules(self, changed_keys: Iterable[str]) -> list[FormLogic]:
+        return [
+            self.nodes[position].rule
+            for position in self.get_affected_positions(changed_keys)
+        ]
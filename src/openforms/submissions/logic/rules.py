@@ -1,22 +1,181 @@
-from typing import Iterable, Iterator
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Mapping
+from uuid import uuid4
+
+from django.core.cache import cache
 
 import elasticapm
-from json_logic import jsonLogic
 
 from openforms.formio.datastructures import FormioData
-from openforms.forms.models import FormLogic, FormStep
+from openforms.forms.models import FormLogic
 
 from ..models import Submission, SubmissionStep
 from .actions import ActionOperation
+from .dependencies import RuleDependencyGraph
 from .log_utils import log_errors
 
 
-def _include_rule(form_steps: list[FormStep], rule: FormLogic, step_index: int) -> bool:
-    # rules that always apply
-    if not rule.trigger_from_step:
+@dataclass
+class RuleOutcome:
+    """
+    The outcome of evaluating a single logic rule.
+    """
+
+    triggered: bool
+    mutations: list[dict] = field(default_factory=list)
+    """
+    The variable mutations (native Python values) performed by each action of the
+    rule, in order.
+    """
+
+
+@dataclass
+class LogicEvaluationRecord:
+    """
+    The record of a logic evaluation, used to speed up subsequent evaluations.
+
+    :attr:`data` holds a snapshot of the (flat, by variable key) values the rules were
+    evaluated against, before any rule mutated them. This allows determining what
+    changed since this evaluation.
+    """
+
+    fingerprint: str
+    data: dict[str, Any]
+    outcomes: dict[int, RuleOutcome] = field(default_factory=dict)
+
+
+# the number of forms to keep the compiled logic rules of in memory, per process
+FORM_LOGIC_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class CompiledFormLogic:
+    """
+    The logic rules of a form, in evaluation order, with their triggers and actions
+    compiled.
+
+    Instances are shared between requests (and threads) and must be treated as
+    read-only.
+    """
+
+    rules: tuple[FormLogic, ...]
+    graph: RuleDependencyGraph
+
+
+def _get_logic_version_cache_key(form_id: int) -> str:
+    return f"form-logic-version:{form_id}"
+
+
+def get_form_logic_version(form_id: int) -> str:
+    """
+    Get the current version of the logic rules of a form.
+
+    The version is a random token that is replaced whenever the logic rules change,
+    see :func:`invalidate_form_logic`.
+    """
+    key = _get_logic_version_cache_key(form_id)
+    if (version := cache.get(key)) is None:
+        version = uuid4().hex
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def invalidate_form_logic(form_id: int) -> None:
+    """
+    Discard the compiled logic rules of a form in all processes.
+    """
+    cache.delete(_get_logic_version_cache_key(form_id))
+
+
+@lru_cache(maxsize=FORM_LOGIC_CACHE_SIZE)
+def _compile_form_logic(form_id: int, version: str) -> CompiledFormLogic:
+    rules = tuple(
+        FormLogic.objects.select_related("trigger_from_step").filter(form_id=form_id)
+    )
+    # the action operations are compiled lazily (and then memoized on the shared rule
+    # instances) - actions with incomplete configuration may only error when they
+    # are actually triggered.
+    return CompiledFormLogic(rules=rules, graph=RuleDependencyGraph(rules))
+
+
+def get_compiled_form_logic(form) -> CompiledFormLogic:
+    """
+    Return the compiled logic rules of the form.
+
+    The compiled rules are cached per process for the current logic version, and on
+    the form instance so that the version is only looked up once.
+    """
+    compiled = getattr(form, "_cached_logic_rules", None)
+    if compiled is None:
+        # the version must be determined *before* loading the rules, so that changes
+        # committed while loading result in a new version
+        version = get_form_logic_version(form.pk)
+        compiled = _compile_form_logic(form.pk, version)
+        form._cached_logic_rules = compiled
+    return compiled
+
+
+def get_rule_dependency_graph(form) -> RuleDependencyGraph:
+    """
+    Return the dependency graph of all logic rules of the form.
+    """
+    return get_compiled_form_logic(form).graph
+
+
+def get_rules_fingerprint(rules: Iterable[FormLogic]) -> str:
+    """
+    Calculate a fingerprint of the content of the rules, in evaluation order.
+
+    Evaluation records are only valid for the exact same set of rules.
+    """
+    content = [(rule.pk, rule.json_logic_trigger, rule.actions) for rule in rules]
+    serialized = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.md5(serialized.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _values_differ(value: Any, other: Any) -> bool:
+    # stricter than ``!=``, since JsonLogic distinguishes between 1 and True
+    if type(value) is not type(other):
+        return True
+    match value:
+        case dict():
+            return value.keys() != other.keys() or any(
+                _values_differ(item, other[key]) for key, item in value.items()
+            )
+        case list():
+            return len(value) != len(other) or any(
+                _values_differ(item, other_item)
+                for item, other_item in zip(value, other)
+            )
+        case _:
+            return value != other
+
+
+def get_changed_keys(old: Mapping[str, Any], new: Mapping[str, Any]) -> set[str]:
+    """
+    Determine the keys of the data that differ between old and new.
+    """
+    return {
+        key
+        for key in old.keys() | new.keys()
+        if key not in old or key not in new or _values_differ(old[key], new[key])
+    }
+
+
+def _include_rule(
+    step_indices: Mapping[int, int], rule: FormLogic, step_index: int
+) -> bool:
+    # rules that always apply. A trigger-from step that is no longer part of the form
+    # has been deleted after the rules were cached, in which case the database has
+    # cleared the reference.
+    trigger_from_index = step_indices.get(rule.trigger_from_step_id)
+    if trigger_from_index is None:
         return True
 
-    trigger_from_index = form_steps.index(rule.trigger_from_step)
     # if the current step is before the trigger-from step, do not include the rule
     if step_index < trigger_from_index:
         return False
@@ -30,26 +189,17 @@ def get_rules_to_evaluate(
     """
     Given a submission, return the logic rules ready for evaluation.
 
-    As a side-effect, the form logic query results are cached on ``submission.form``.
+    The compiled rules are shared between requests, see
+    :func:`get_compiled_form_logic`.
 
     :arg submission: A submission instance to retrieve the rules for
     :arg current_step: The (optional) step at which the rules need to be evaluated. If
       not provided, the step following the last completed step is used, or the first
       step in the form if there are no completed steps.
-    :returns: An iterable of :class`openforms.forms.models.FormLogic` instances. This
-      may be a queryset, but could also be a list. Typically cached on the form instance
-      for performance reasons.
-    """
-    # some callers evaluate logic for all steps at once, so we can avoid repeated queries
-    # by caching the rules on the form instance.
-    # Note that form.formlogic_set.all() is never cached by django, so we can't rely
-    # on that.
-    rules = getattr(submission.form, "_cached_logic_rules", None)
-    if rules is None:
-        rules = FormLogic.objects.select_related("trigger_from_step").filter(
-            form=submission.form
-        )
-        submission.form._cached_logic_rules = rules
+    :returns: An iterable of :class`openforms.forms.models.FormLogic` instances. The
+      instances are shared between requests and must not be modified.
+    """
+    rules = get_compiled_form_logic(submission.form).rules
 
     submission_state = submission.load_execution_state()
     # if there are no form steps, there is no usable form -> there are no logic rules
@@ -65,11 +215,11 @@ def get_rules_to_evaluate(
         else -1
     )
 
-    return [
-        rule
-        for rule in rules
-        if _include_rule(submission_state.form_steps, rule, step_index)
-    ]
+    step_indices = {
+        form_step.pk: index
+        for index, form_step in enumerate(submission_state.form_steps)
+    }
+    return [rule for rule in rules if _include_rule(step_indices, rule, step_index)]
 
 
 def get_current_step(submission: Submission) -> SubmissionStep | None:
@@ -110,6 +260,8 @@ def iter_evaluate_rules(
     rules: Iterable[FormLogic],
     data: FormioData,
     submission: Submission,
+    reusable_outcomes: Mapping[int, RuleOutcome] | None = None,
+    outcomes: dict[int, RuleOutcome] | None = None,
 ) -> Iterator[tuple[ActionOperation, dict]]:
     """
     Iterate over the rules and evaluate the trigger, yielding action operations and
@@ -125,11 +277,30 @@ def iter_evaluate_rules(
       all variables present in the :class:`SubmissionValueVariableState`. This data
       structure is updated after every mutation.
     :arg submission: Submission instance.
+    :arg reusable_outcomes: Outcomes of an earlier evaluation, by rule ID, that are
+      known to be unaffected by the changes in data since then. These rules are not
+      evaluated again, instead their recorded outcome is replayed.
+    :arg outcomes: If provided, the outcome of every rule is recorded in it, by rule
+      ID.
     :returns: An iterator yielding :class:`ActionOperation` instances and the performed
       mutations as native Python objects.
     """
     state = submission.load_submission_value_variables_state()
+    reusable_outcomes = reusable_outcomes or {}
     for rule in rules:
+        if (outcome := reusable_outcomes.get(rule.pk)) is not None:
+            if outcomes is not None:
+                outcomes[rule.pk] = outcome
+            if not outcome.triggered:
+                continue
+            for operation, mutations_python in zip(
+                rule.action_operations, outcome.mutations
+            ):
+                if mutations_python:
+                    data.set_many(mutations_python)
+                yield operation, mutations_python
+            continue
+
         with elasticapm.capture_span(
             "evaluate_rule",
             span_type="app.submissions.logic",
@@ -137,7 +308,11 @@ def iter_evaluate_rules(
         ):
             triggered = False
             with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(jsonLogic(rule.json_logic_trigger, data.data))
+                triggered = bool(rule.compiled_trigger(data.data))
+
+            outcome = RuleOutcome(triggered=triggered)
+            if outcomes is not None:
+                outcomes[rule.pk] = outcome
 
             if not triggered:
                 continue
@@ -148,8 +323,9 @@ def iter_evaluate_rules(
                         key: state.variables[key].to_python(value)
                         for key, value in mutations.items()
                     }
-                    data.update(mutations_python)
+                    data.set_many(mutations_python)
                 else:
                     mutations_python = {}
 
+                outcome.mutations.append(mutations_python)
                 yield operation, mutations_python
@@ -0,0 +1,110 @@
+"""
+Management command to benchmark the generation of submission reports (PDF).
+
+The reports are rendered in a pool of worker processes that have the PDF renderer
+loaded upfront, like the Celery workers do when ``PDF_WORKER_PRELOAD`` is enabled. The
+rendered reports are discarded, existing reports are left untouched.
+"""
+
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connections
+
+from openforms.utils.pdf import warm_up
+
+from ...models import Submission, SubmissionReport
+
+
+def _render_report(submission_id: int) -> float:
+    submission = Submission.objects.select_related("auth_info", "form").get(
+        pk=submission_id
+    )
+    start = time.perf_counter()
+    SubmissionReport(submission=submission).render_pdf()
+    return time.perf_counter() - start
+
+
+def _wait_for_worker(delay: float) -> None:
+    # keeps the worker busy so that the other workers pick up the other calls
+    time.sleep(delay)
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the PDF reports of the given submissions and display the throughput. "
+        "You may want to specify the LOG_LEVEL=WARNING envvar to surpress log output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "submission_id",
+            type=int,
+            nargs="+",
+            help="Submission ID(s) to render the report of.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="Number of times to render the report of each submission.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help=(
+                "Number of worker processes to render the reports in. Use 0 to render "
+                "them in the current process. Defaults to the number of CPUs."
+            ),
+        )
+
+    def handle(self, **options):
+        submission_ids = list(
+            Submission.objects.filter(id__in=options["submission_id"])
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if missing := set(options["submission_id"]) - set(submission_ids):
+            raise CommandError(
+                "Submission(s) {ids} do not exist.".format(
+                    ids=", ".join(str(pk) for pk in sorted(missing))
+                )
+            )
+
+        jobs = submission_ids * options["repeat"]
+        workers = options["workers"]
+        if workers == 0:
+            warm_up()
+            start = time.perf_counter()
+            durations = [_render_report(submission_id) for submission_id in jobs]
+            elapsed = time.perf_counter() - start
+        else:
+            # the forked worker processes may not share the database connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=warm_up,
+            ) as executor:
+                # wait for all the workers to be started and warmed up, which should
+                # not be part of the measurement
+                list(executor.map(_wait_for_worker, [0.1] * workers))
+
+                start = time.perf_counter()
+                durations = list(executor.map(_render_report, jobs))
+                elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"Rendered {len(jobs)} report(s) in {elapsed:.2f}s using "
+            f"{workers or 'no'} worker process(es)."
+        )
+        self.stdout.write(f"Reports per second: {len(jobs) / elapsed:.2f}")
+        self.stdout.write(
+            f"Render time per report: {statistics.mean(durations):.3f}s (mean), "
+            f"{max(durations):.3f}s (max)"
+        )
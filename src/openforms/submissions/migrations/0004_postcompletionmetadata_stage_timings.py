@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-18 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0003_alter_submissionvaluevariable_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postcompletionmetadata",
+            name="stage_timings",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Start time and duration (in seconds) of each of the tasks, keyed by the task name.",
+                verbose_name="stage timings",
+            ),
+        ),
+    ]
@@ -34,6 +34,15 @@ class PostCompletionMetadata(models.Model):
         choices=PostSubmissionEvents.choices,
         max_length=100,
     )
+    stage_timings = models.JSONField(
+        _("stage timings"),
+        default=dict,
+        blank=True,
+        help_text=_(
+            "Start time and duration (in seconds) of each of the tasks, keyed by the "
+            "task name."
+        ),
+    )
 
     class Meta:
         verbose_name = _("post completion metadata")
@@ -4,7 +4,7 @@ import logging
 import uuid
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
 
 from django.conf import settings
 from django.db import models, transaction
@@ -549,16 +549,26 @@ class Submission(models.Model):
         return self._variables_state
 
     @elasticapm.capture_span(span_type="app.data.loading")
-    def load_execution_state(self, refresh: bool = False) -> SubmissionState:
+    def load_execution_state(
+        self, refresh: bool = False, form_steps: Iterable[FormStep] | None = None
+    ) -> SubmissionState:
         """
         Retrieve the current execution state of steps from the database.
+
+        :arg refresh: Discard the previously loaded state.
+        :arg form_steps: The (ordered) form steps of the form with their form
+          definitions, if they were already loaded. The instances become part of the
+          execution state and may be modified, so they must not be shared between
+          submissions.
         """
         if hasattr(self, "_execution_state") and not refresh:
             return self._execution_state
 
-        form_steps = list(
-            self.form.formstep_set.select_related("form_definition").order_by("order")
-        )
+        if form_steps is None:
+            form_steps = self.form.formstep_set.select_related(
+                "form_definition"
+            ).order_by("order")
+        form_steps = list(form_steps)
         # ⚡️ no select_related/prefetch ON PURPOSE - while processing the form steps,
         # we're doing this in python as we have the objects already from the query
         # above.
@@ -57,27 +57,33 @@ class SubmissionReport(models.Model):
     def __str__(self):
         return self.title
 
-    def generate_submission_report_pdf(self) -> str:
+    def render_pdf(self) -> tuple[str, bytes]:
         """
-        Generate the submission report as a PDF.
+        Render the submission report, without storing it.
 
-        :return: string with the HTML used for the PDF generation, so that contents
-          can be tested.
+        :return: tuple of the HTML used for the PDF generation and the PDF itself.
         """
-
         with override(self.submission.language_code):
-            form = self.submission.form
-            html_report, pdf_report = render_to_pdf(
+            return render_to_pdf(
                 "report/submission_report.html",
                 context={
                     "report": Report(self.submission),
                     THEME_OVERRIDE_CONTEXT_VAR: self.submission.form.theme,
                 },
             )
-            self.content = ContentFile(
-                content=pdf_report,
-                name=f"{form.slug}.pdf",
-            )
+
+    def generate_submission_report_pdf(self) -> str:
+        """
+        Generate the submission report as a PDF.
+
+        :return: string with the HTML used for the PDF generation, so that contents
+          can be tested.
+        """
+        html_report, pdf_report = self.render_pdf()
+        self.content = ContentFile(
+            content=pdf_report,
+            name=f"{self.submission.form.slug}.pdf",
+        )
         self.save()
         return html_report
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
-from typing import TYPE_CHECKING, Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, Sequence, overload
 
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import connections, models
 from django.utils import timezone
 from django.utils.dateparse import parse_date
 from django.utils.functional import empty
@@ -252,8 +253,9 @@ class SubmissionValueVariablesState:
         .. todo:: apply variable.datatype/format to obtain python objects? This also
            needs to properly serialize back to JSON though!
         """
+        new_values = data.get_many(self.variables, default=empty)
         for key, variable in self.variables.items():
-            new_value = data.get(key, default=empty)
+            new_value = new_values[key]
             if new_value is empty:
                 continue
             variable.value = new_value
@@ -268,11 +270,12 @@ class SubmissionValueVariablesState:
         :return: A data mapping (key: variable key, value: native python object for the
             value) ready for (template context) evaluation.
         """
-        dynamic_values = {
-            key: variable.to_python() for key, variable in self.variables.items()
-        }
-        static_values = self.static_data()
-        return FormioData({**dynamic_values, **static_values})
+        data = FormioData()
+        data.set_many(
+            {key: variable.to_python() for key, variable in self.variables.items()}
+        )
+        data.set_many(self.get_static_data())
+        return data
 
 
 class SubmissionValueVariableManager(models.Manager):
@@ -294,29 +297,28 @@ class SubmissionValueVariableManager(models.Manager):
                 )
             )
 
-        variables_to_create = []
-        variables_to_update = []
+        variables_to_upsert = []
         variables_keys_to_delete = []
-        formio_data = FormioData(data)
+        new_values = FormioData(data).get_many(submission_variables, default=empty)
         for key, variable in submission_variables.items():
-            try:
-                variable.value = formio_data[key]
-            except KeyError:
-                if update_missing_variables:
-                    if variable.pk:
-                        variables_keys_to_delete.append(variable.key)
-                    else:
-                        variable.value = variable.form_variable.get_initial_value()
-                    continue
+            if (new_value := new_values[key]) is not empty:
+                variable.value = new_value
+            elif update_missing_variables:
+                if variable.pk:
+                    variables_keys_to_delete.append(variable.key)
+                else:
+                    variable.value = variable.form_variable.get_initial_value()
+                continue
 
-            if not variable.pk:
-                variables_to_create.append(variable)
-            else:
-                variables_to_update.append(variable)
+            if variable.pk and not variable.has_changed:
+                continue
+            variables_to_upsert.append(variable)
 
-        self.bulk_create(variables_to_create)
-        self.bulk_update(variables_to_update, fields=["value"])
-        self.filter(submission=submission, key__in=variables_keys_to_delete).delete()
+        self.bulk_upsert(submission, variables_to_upsert)
+        if variables_keys_to_delete:
+            self.filter(
+                submission=submission, key__in=variables_keys_to_delete
+            ).delete()
 
         # Variables that are deleted are not automatically updated in the state
         # (i.e. they remain present with their pk)
@@ -325,6 +327,60 @@ class SubmissionValueVariableManager(models.Manager):
                 keys=variables_keys_to_delete
             )
 
+    def bulk_upsert(
+        self, submission: Submission, variables: Sequence[SubmissionValueVariable]
+    ) -> None:
+        """
+        Insert or update the values of the variables in a single query.
+
+        Variables are matched on their key, existing records only get their value
+        updated. The primary keys of created records are set on the instances.
+        """
+        if not variables:
+            return
+
+        now = timezone.now()
+        opts = self.model._meta
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {opts.db_table} (
+                    submission_id, key, value, source, is_initially_prefilled,
+                    created_at, modified_at
+                )
+                SELECT %s, item.key, item.value, item.source,
+                    item.is_initially_prefilled, %s, %s
+                FROM unnest(%s::text[], %s::jsonb[], %s::text[], %s::boolean[])
+                    AS item(key, value, source, is_initially_prefilled)
+                ON CONFLICT (submission_id, key) DO UPDATE SET value = EXCLUDED.value
+                RETURNING id, key
+                """,
+                [
+                    submission.pk,
+                    now,
+                    now,
+                    [variable.key for variable in variables],
+                    [
+                        (
+                            None
+                            if variable.value is None
+                            else json.dumps(variable.value, cls=ValueEncoder)
+                        )
+                        for variable in variables
+                    ],
+                    [variable.source for variable in variables],
+                    [variable.is_initially_prefilled for variable in variables],
+                ],
+            )
+            ids = {key: pk for pk, key in cursor.fetchall()}
+
+        for variable in variables:
+            if not variable.pk:
+                variable.pk = ids[variable.key]
+                variable.created_at = variable.modified_at = now
+                variable._state.adding = False
+            variable._persisted_value = variable.value
+
 
 class SubmissionValueVariable(models.Model):
     submission = models.ForeignKey(
@@ -373,6 +429,13 @@ class SubmissionValueVariable(models.Model):
     objects = SubmissionValueVariableManager()
 
     form_variable: FormVariable | None = None
+    # the deserialized value of the variable, see :meth:`to_python`
+    _python_value: tuple[VariableValue, FormVariable | None, VariableValue] | None = (
+        None
+    )
+
+    # the value as it was loaded from the database, see :attr:`has_changed`
+    _persisted_value: VariableValue | object = empty
 
     class Meta:
         verbose_name = _("Submission value variable")
@@ -382,6 +445,27 @@ class SubmissionValueVariable(models.Model):
     def __str__(self):
         return _("Submission value variable {key}").format(key=self.key)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._persisted_value = instance.__dict__.get("value", empty)
+        return instance
+
+    @property
+    def has_changed(self) -> bool:
+        """
+        Check if the value differs from the value that was loaded from the database.
+
+        Containers may have been mutated in place, so only scalar values are
+        compared - anything else is always considered changed.
+        """
+        persisted, value = self._persisted_value, self.value
+        return not (
+            isinstance(value, str | int | float | bool | None)
+            and type(value) is type(persisted)
+            and value == persisted
+        )
+
     def to_python(self, value: VariableValue | object = empty) -> VariableValue:
         """
         Deserialize a value into the appropriate python type, using the data type
@@ -393,10 +477,20 @@ class SubmissionValueVariable(models.Model):
         to correctly interpret the data. For the time being, this is not needed yet
         as we focus on NL first.
 
-        :param value: JSON value to deserialize. If empty, ``self.value`` is used.
+        :param value: JSON value to deserialize. If empty, ``self.value`` is used, and
+          the result is memoized until the value or the form variable is replaced.
         """
         if value is empty:
-            value = self.value
+            if (cached := self._python_value) is not None:
+                cached_value, cached_form_variable, python_value = cached
+                if (
+                    cached_value is self.value
+                    and cached_form_variable is self.form_variable
+                ):
+                    return python_value
+            python_value = self.to_python(self.value)
+            self._python_value = (self.value, self.form_variable, python_value)
+            return python_value
 
         if value is None:
             return None
@@ -2,9 +2,10 @@ import logging
 
 from django.db import transaction
 from django.db.models import F
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
+from openforms.forms.models import FormLogic
 from openforms.submissions.models import (
     Submission,
     SubmissionFileAttachment,
@@ -12,6 +13,8 @@ from openforms.submissions.models import (
 )
 from openforms.utils.files import _delete_obj_files, get_file_field_names
 
+from .logic.rules import invalidate_form_logic
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,3 +89,17 @@ def increment_submissions_form_counter(sender, instance: Submission, **kwargs):
     if instance.form.submission_limit:
         instance.form.submission_counter = F("submission_counter") + 1
         instance.form.save(update_fields=("submission_counter",))
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=FormLogic,
+    dispatch_uid="submission.invalidate_form_logic",
+)
+def invalidate_compiled_form_logic(sender, instance: FormLogic, **kwargs):
+    # Invalidate right away for the current process and again after the commit, so
+    # that other processes can't pick up the previous rules under a new version.
+    # Note that the logic rules bulk update endpoint bulk creates the rules, and
+    # invalidates the compiled rules itself.
+    invalidate_form_logic(instance.form_id)
+    transaction.on_commit(lambda: invalidate_form_logic(instance.form_id))
@@ -2,20 +2,119 @@
 Utility to interact with the celery task status.
 """
 
+import hashlib
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import timedelta
+from functools import cached_property
 
+from django.core.cache import cache
 from django.urls import reverse
 
 from celery import states
+from celery.backends.base import KeyValueStoreBackend
+from celery.backends.redis import RedisBackend
 from celery.result import AsyncResult
 from rest_framework.request import Request
 
 from openforms.appointments.models import AppointmentInfo
+from openforms.celery import app
 
 from .constants import ProcessingResults, ProcessingStatuses
 from .models import Submission
 from .utils import add_submmission_to_session, get_report_download_url
 
+# Finished tasks don't change state anymore, so their state is remembered and the
+# result backend is not queried for them again. The results are cleaned up after two
+# days (see :func:`openforms.submissions.tasks.cleanup_on_completion_results`).
+TASK_STATE_CACHE_TIMEOUT = int(timedelta(days=2).total_seconds())
+
+
+def _get_cache_key(task_id: str) -> str:
+    return f"submissions:task-state:{task_id}"
+
+
+def fetch_task_states(task_ids: Sequence[str]) -> dict[str, str]:
+    """
+    Retrieve the states of the tasks from the Celery result backend.
+
+    Key-value store backends (like Redis) are queried for all tasks in a single round
+    trip rather than for each task separately.
+    """
+    backend = app.backend
+    if not isinstance(backend, KeyValueStoreBackend):
+        return {task_id: AsyncResult(task_id).state for task_id in task_ids}
+
+    keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+    values = backend.mget(keys) if keys else []
+    # depending on the client, the values are returned as a list or a mapping
+    if hasattr(values, "items"):
+        values = [values.get(key) for key in keys]
+    task_states = {}
+    for task_id, value in zip(task_ids, values):
+        # tasks without meta in the result backend are unknown (yet)
+        meta = backend.decode_result(value) if value else {}
+        task_states[task_id] = meta.get("status", states.PENDING)
+    return task_states
+
+
+def get_task_states(task_ids: Sequence[str]) -> dict[str, str]:
+    """
+    Get the states of the tasks, re-using the known states of finished tasks.
+    """
+    cache_keys = {task_id: _get_cache_key(task_id) for task_id in task_ids}
+    cached = cache.get_many(cache_keys.values())
+    task_states = {
+        task_id: cached[key] for task_id, key in cache_keys.items() if key in cached
+    }
+
+    if missing := [task_id for task_id in cache_keys if task_id not in task_states]:
+        fetched = fetch_task_states(missing)
+        cache.set_many(
+            {
+                cache_keys[task_id]: state
+                for task_id, state in fetched.items()
+                if state in states.READY_STATES
+            },
+            timeout=TASK_STATE_CACHE_TIMEOUT,
+        )
+        task_states.update(fetched)
+
+    return task_states
+
+
+def wait_for_task_updates(
+    task_ids: Sequence[str], known_states: dict[str, str], timeout: float
+) -> bool:
+    """
+    Block until the state of one of the tasks changes, or the timeout expires.
+
+    The Redis result backend publishes every task state update on the channel of the
+    task key, so instead of polling the result backend, the channels are subscribed
+    to. Other result backends are not supported - no waiting happens for them.
+
+    :returns: whether a (possible) change of the task states was detected.
+    """
+    backend = app.backend
+    if not task_ids or not isinstance(backend, RedisBackend):
+        return False
+
+    pubsub = backend.client.pubsub(ignore_subscribe_messages=True)
+    try:
+        pubsub.subscribe(*[backend.get_key_for_task(task_id) for task_id in task_ids])
+        # the states may have changed before the subscriptions were active
+        if fetch_task_states(task_ids) != known_states:
+            return True
+
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if pubsub.get_message(timeout=remaining) is not None:
+                return True
+        return False
+    finally:
+        pubsub.close()
+
 
 @dataclass
 class SubmissionProcessingStatus:
@@ -24,7 +123,7 @@ class SubmissionProcessingStatus:
 
     def get_async_results(self) -> list[AsyncResult]:
         """Retrieve the results for the task scheduled ONLY when the submission was completed."""
-        if not hasattr(self, "_async_result"):
+        if not hasattr(self, "_async_results"):
             task_ids = self.submission.post_completion_task_ids
             self._async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._async_results
@@ -48,12 +147,21 @@ class SubmissionProcessingStatus:
             self._all_async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._all_async_results
 
+    @cached_property
+    def task_states(self) -> list[str]:
+        """
+        The states of the tasks scheduled when the submission was completed.
+        """
+        task_ids = self.submission.post_completion_task_ids
+        task_states = get_task_states(task_ids)
+        return [task_states[task_id] for task_id in task_ids]
+
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any((result.state == states.FAILURE for result in results))
-        all_ready = all((result.state in states.READY_STATES for result in results))
-        if results and (any_failed or all_ready):
+        task_states = self.task_states
+        any_failed = any((state == states.FAILURE for state in task_states))
+        all_ready = all((state in states.READY_STATES for state in task_states))
+        if task_states and (any_failed or all_ready):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -62,9 +170,9 @@ class SubmissionProcessingStatus:
         if self.status != ProcessingStatuses.done:
             return ""
 
-        results = self.get_async_results()
-        all_success = all((result.state == states.SUCCESS for result in results))
-        any_failed = any((result.state == states.FAILURE for result in results))
+        task_states = self.task_states
+        all_success = all((state == states.SUCCESS for state in task_states))
+        any_failed = any((state == states.FAILURE for state in task_states))
 
         if all_success:
             return ProcessingResults.success
@@ -141,6 +249,46 @@ class SubmissionProcessingStatus:
         results = self.get_all_async_results()
         for result in results:
             result.forget()
+        cache.delete_many([_get_cache_key(result.id) for result in results])
+
+    def wait_for_change(self, timeout: float) -> "SubmissionProcessingStatus":
+        """
+        Wait (at most ``timeout`` seconds) for the processing to progress.
+
+        :returns: the up to date processing status - a new instance if the task states
+          (may) have changed.
+        """
+        if timeout <= 0 or self.status == ProcessingStatuses.done:
+            return self
+        task_ids = self.submission.post_completion_task_ids
+        known_states = dict(zip(task_ids, self.task_states))
+        if not wait_for_task_updates(task_ids, known_states, timeout=timeout):
+            return self
+        # the tasks update the submission while processing it
+        self.submission.refresh_from_db()
+        return SubmissionProcessingStatus(self.request, self.submission)
+
+    def get_etag(self) -> str:
+        """
+        Calculate the ETag of the processing status while it is still in progress.
+
+        While in progress, the status only depends on the task states and a couple of
+        fields that can be checked cheaply, which allows the (frequent) polling to
+        be answered with ``304 Not Modified``. Once the processing is done, an empty
+        string is returned - the final status contains (timestamped) tokens and is
+        only retrieved once.
+        """
+        if self.status == ProcessingStatuses.done:
+            return ""
+        bits = [
+            *self.task_states,
+            self.submission.public_registration_reference,
+            self.error_message,
+        ]
+        serialized = "\n".join(bits)
+        return hashlib.md5(
+            serialized.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
 
     def ensure_failure_can_be_managed(self) -> None:
         """
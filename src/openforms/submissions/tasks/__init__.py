@@ -1,11 +1,14 @@
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.db.models import F, Func, JSONField, Value
 from django.utils import timezone
 
-from celery import chain
-from celery.result import AsyncResult
+from celery import Task, chain, group
+from celery.result import AsyncResult, GroupResult, ResultBase
+from celery.signals import task_postrun, task_prerun
 
 from openforms.appointments.tasks import maybe_register_appointment
 from openforms.celery import app
@@ -54,20 +57,17 @@ def on_post_submission_event(submission_id: int, event: PostSubmissionEvents) ->
     # Finalise completion: schedule confirmation emails and maybe hash identifying attributes
     finalise_completion_task = finalise_completion.si(submission_id)
 
+    # The appointment and the (pre-)registration reference are both part of the
+    # report, which in turn is sent along with the registration. Only the appointment
+    # registration and the pre-registration are independent of each other.
     actions_chain = chain(
-        register_appointment_task,
-        pre_registration_task,
+        group(register_appointment_task, pre_registration_task),
         generate_report_task,
         register_submission_task,
         payment_status_update_task,
         finalise_completion_task,
     )
 
-    async_result: AsyncResult = actions_chain.delay()
-
-    # obtain all the task IDs so we can check the state later
-    task_ids = async_result.as_list()
-
     # NOTE - this is "risky" since we're running outside of the transaction (this code
     # should run in transaction.on_commit)!
     if event == PostSubmissionEvents.on_completion:
@@ -77,12 +77,37 @@ def on_post_submission_event(submission_id: int, event: PostSubmissionEvents) ->
             trigger_event=PostSubmissionEvents.on_completion,
         ).delete()
 
-    PostCompletionMetadata.objects.create(
-        tasks_ids=task_ids,
+    # created upfront so that the tasks can record their timings
+    metadata = PostCompletionMetadata.objects.create(
         submission_id=submission_id,
         trigger_event=event,
     )
 
+    async_result: AsyncResult = actions_chain.delay()
+
+    # obtain all the task IDs so we can check the state later
+    metadata.tasks_ids = get_task_ids(async_result)
+    metadata.save(update_fields=["tasks_ids"])
+
+
+def get_task_ids(result: ResultBase) -> list[str]:
+    """
+    Collect the IDs of the tasks of a (chained) result, including the group members.
+
+    Unlike :meth:`celery.result.AsyncResult.as_list`, the ID of a group itself is
+    left out, as it never gets a state of its own.
+    """
+    task_ids = []
+    node = result
+    while node is not None:
+        if isinstance(node, GroupResult):
+            for child in node.children or []:
+                task_ids += get_task_ids(child)
+        else:
+            task_ids.append(node.id)
+        node = node.parent
+    return task_ids
+
 
 @app.task(ignore_result=True)
 def retry_processing_submissions():
@@ -150,3 +175,56 @@ def finalise_completion(submission_id: int) -> None:
         submission_id
     )
     hash_identifying_attributes_task.delay()
+
+
+# Tasks of the post-submission chain, of which the timings are recorded. They all take
+# the submission ID as first argument.
+POST_SUBMISSION_STAGES = frozenset(
+    task.name
+    for task in (
+        maybe_register_appointment,
+        pre_registration,
+        generate_submission_report,
+        register_submission,
+        update_submission_payment_status,
+        finalise_completion,
+    )
+)
+
+_stage_start_times: dict[str, tuple[datetime, float]] = {}
+
+
+@task_prerun.connect
+def start_stage_timer(task_id: str, task: Task, **kwargs) -> None:
+    if task.name not in POST_SUBMISSION_STAGES:
+        return
+    _stage_start_times[task_id] = (timezone.now(), time.perf_counter())
+
+
+@task_postrun.connect
+def record_stage_timing(
+    task_id: str, task: Task, args: tuple, state: str | None = None, **kwargs
+) -> None:
+    if (start := _stage_start_times.pop(task_id, None)) is None:
+        return
+    started, start_counter = start
+    timing = {
+        "started": started.isoformat(),
+        "duration": round(time.perf_counter() - start_counter, 3),
+        "state": state,
+    }
+    latest_metadata = (
+        PostCompletionMetadata.objects.filter(submission_id=args[0])
+        .order_by("-created_on")
+        .values("pk")[:1]
+    )
+    # the stages of a group run concurrently, so the timings are merged in the
+    # database rather than overwriting each other
+    PostCompletionMetadata.objects.filter(pk__in=latest_metadata).update(
+        stage_timings=Func(
+            F("stage_timings"),
+            Value({task.name.rsplit(".", 1)[-1]: timing}, output_field=JSONField()),
+            template="%(expressions)s",
+            arg_joiner=" || ",
+        )
+    )
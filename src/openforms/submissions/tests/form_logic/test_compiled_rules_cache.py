@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from openforms.forms.models import Form
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+)
+
+from ...logic.rules import get_compiled_form_logic
+
+
+class CompiledFormLogicCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create()
+        FormStepFactory.create(form=cls.form)
+        cls.rule = FormLogicFactory.create(
+            form=cls.form,
+            json_logic_trigger={"==": [{"var": "a"}, 1]},
+            actions=[{"action": {"type": "disable-next"}}],
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(cache.clear)
+
+    def test_compiled_rules_shared_between_form_instances(self):
+        compiled = get_compiled_form_logic(Form(pk=self.form.pk))
+
+        with self.assertNumQueries(0):
+            compiled_again = get_compiled_form_logic(Form(pk=self.form.pk))
+
+        self.assertIs(compiled_again, compiled)
+        self.assertEqual(compiled.rules, (self.rule,))
+
+    def test_changes_to_rules_invalidate_cache(self):
+        compiled = get_compiled_form_logic(Form(pk=self.form.pk))
+
+        with self.subTest("rule updated"):
+            self.rule.json_logic_trigger = {"==": [{"var": "a"}, 2]}
+            self.rule.save()
+
+            updated = get_compiled_form_logic(Form(pk=self.form.pk))
+
+            self.assertIsNot(updated, compiled)
+            self.assertEqual(
+                updated.rules[0].json_logic_trigger, {"==": [{"var": "a"}, 2]}
+            )
+
+        with self.subTest("rule deleted"):
+            self.rule.delete()
+
+            deleted = get_compiled_form_logic(Form(pk=self.form.pk))
+
+            self.assertEqual(deleted.rules, ())
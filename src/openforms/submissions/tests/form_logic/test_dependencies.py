@@ -0,0 +1,93 @@
+from django.test import SimpleTestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...logic.dependencies import RuleDependencyGraph
+
+
+def _set_variable(variable: str, value) -> dict:
+    return {
+        "variable": variable,
+        "action": {"type": LogicActionTypes.variable, "value": value},
+    }
+
+
+def _hide(component: str) -> dict:
+    return {
+        "component": component,
+        "action": {
+            "type": LogicActionTypes.property,
+            "property": {"value": "hidden", "type": "bool"},
+            "state": True,
+        },
+    }
+
+
+class RuleDependencyGraphTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.rules = [
+            # 0: a -> b
+            FormLogicFactory.build(
+                pk=1,
+                json_logic_trigger={"!!": [{"var": "a"}]},
+                actions=[_set_variable("b", {"+": [{"var": "a"}, 1]})],
+            ),
+            # 1: b -> hide
+            FormLogicFactory.build(
+                pk=2,
+                json_logic_trigger={">": [{"var": "b"}, 10]},
+                actions=[_hide("c")],
+            ),
+            # 2: nested.x -> hide
+            FormLogicFactory.build(
+                pk=3,
+                json_logic_trigger={"==": [{"var": "nested.x"}, "foo"]},
+                actions=[_hide("d")],
+            ),
+            # 3: c -> a (writes a variable read by an earlier rule)
+            FormLogicFactory.build(
+                pk=4,
+                json_logic_trigger={"==": [{"var": "c"}, 1]},
+                actions=[_set_variable("a", 5)],
+            ),
+            # 4: reads everything
+            FormLogicFactory.build(
+                pk=5,
+                json_logic_trigger={"var": {"cat": ["nested", ".y"]}},
+                actions=[_hide("e")],
+            ),
+        ]
+        self.graph = RuleDependencyGraph(self.rules)
+
+    def test_dependencies(self):
+        node = self.graph.nodes[0]
+
+        self.assertEqual(node.inputs, {"a"})
+        self.assertEqual(node.outputs, {"b"})
+        self.assertFalse(node.reads_all)
+        self.assertTrue(self.graph.nodes[4].reads_all)
+
+    def test_changed_variable_affects_readers_and_their_dependants(self):
+        affected = self.graph.get_affected_positions(["a"])
+
+        self.assertEqual(affected, [0, 1, 4])
+
+    def test_outputs_do_not_affect_earlier_rules(self):
+        affected = self.graph.get_affected_positions(["c"])
+
+        self.assertEqual(affected, [3, 4])
+
+    def test_nested_keys(self):
+        with self.subTest("parent changed"):
+            self.assertEqual(self.graph.get_affected_positions(["nested"]), [2, 4])
+
+        with self.subTest("sibling changed"):
+            self.assertEqual(self.graph.get_affected_positions(["nested.y"]), [4])
+
+    def test_no_changes(self):
+        affected = self.graph.get_affected_rules([])
+
+        self.assertEqual(affected, [self.rules[4]])
@@ -0,0 +1,140 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
+from openforms.utils.json_logic import CompiledExpression
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+
+from ...form_logic import evaluate_form_logic
+from ...models import Submission
+from ..factories import SubmissionFactory
+
+
+class IncrementalLogicEvaluationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        form = FormFactory.create()
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "number", "key": "a"},
+                    {"type": "textfield", "key": "b"},
+                    {"type": "textfield", "key": "c"},
+                ]
+            },
+        )
+        FormVariableFactory.create(
+            form=form,
+            key="double",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.float,
+        )
+        # 1. depends on a
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">": [{"var": "a"}, 0]},
+            actions=[
+                {
+                    "variable": "double",
+                    "action": {
+                        "type": LogicActionTypes.variable,
+                        "value": {"*": [{"var": "a"}, 2]},
+                    },
+                }
+            ],
+        )
+        # 2. depends on the output of rule 1
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">": [{"var": "double"}, 10]},
+            actions=[
+                {
+                    "component": "c",
+                    "action": {
+                        "type": LogicActionTypes.property,
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        # 3. depends on b
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "b"}, "disable"]},
+            actions=[
+                {
+                    "component": "a",
+                    "action": {
+                        "type": LogicActionTypes.property,
+                        "property": {"value": "disabled", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        cls.submission = SubmissionFactory.create(form=form)
+
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(cache.clear)
+
+    def _evaluate(self, data: dict, incremental: bool):
+        # simulate separate requests by loading fresh instances
+        submission = Submission.objects.get(pk=self.submission.pk)
+        step = submission.load_execution_state().submission_steps[0]
+        configuration = evaluate_form_logic(
+            submission, step, data, incremental=incremental
+        )
+        return configuration, step.data
+
+    def test_incremental_result_matches_full_evaluation(self):
+        sequence = [
+            {"a": 3, "b": "", "c": ""},
+            {"a": 6, "b": "", "c": ""},
+            {"a": 6, "b": "disable", "c": ""},
+            {"a": 6, "b": "disable", "c": "foo"},
+            {"a": 1, "b": "", "c": "foo"},
+        ]
+
+        for data in sequence:
+            with self.subTest(data=data):
+                incremental_result = self._evaluate(data, incremental=True)
+                full_result = self._evaluate(data, incremental=False)
+
+                self.assertEqual(incremental_result, full_result)
+
+    def test_only_affected_rules_are_evaluated(self):
+        self._evaluate({"a": 6, "b": "", "c": ""}, incremental=True)
+
+        with patch.object(
+            CompiledExpression, "__call__", autospec=True, return_value=False
+        ) as mock_evaluate:
+            self._evaluate({"a": 6, "b": "disable", "c": ""}, incremental=True)
+
+        evaluated = [call.args[0].expression for call in mock_evaluate.call_args_list]
+        self.assertEqual(evaluated, [{"==": [{"var": "b"}, "disable"]}])
+
+    def test_rule_changes_invalidate_previous_evaluation(self):
+        self._evaluate({"a": 6, "b": "", "c": ""}, incremental=True)
+        rule = self.submission.form.formlogic_set.get(
+            json_logic_trigger={">": [{"var": "double"}, 10]}
+        )
+        rule.json_logic_trigger = {">": [{"var": "double"}, 100]}
+        rule.save()
+
+        configuration, _ = self._evaluate({"a": 6, "b": "", "c": ""}, incremental=True)
+
+        self.assertNotIn("hidden", configuration["components"][2])
@@ -1,15 +1,18 @@
 from datetime import datetime
+from unittest.mock import patch
 
+from django.db.models import QuerySet
 from django.test import TestCase, tag
 from django.utils import timezone
 
+import tablib
 from freezegun import freeze_time
 from privates.test import temp_private_root
 
 from openforms.formio.tests.factories import SubmittedFileFactory
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 
-from ..exports import create_submission_export
+from ..exports import ExportFileTypes, create_submission_export, export_submissions
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -385,3 +388,112 @@ class ExportTests(TestCase):
         self.assertEqual(len(dataset), 2)
         self.assertEqual(len(dataset[0]), 3)
         self.assertEqual(len(dataset[1]), 3)
+
+
+class StreamingExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name", "label": "Name"},
+                    {"type": "textfield", "key": "multi", "multiple": True},
+                    {"type": "textarea", "key": "remarks", "label": "Remarks"},
+                ]
+            },
+        )
+        for index in range(3):
+            SubmissionStepFactory.create(
+                submission__form=cls.form,
+                submission__completed=True,
+                form_step=cls.form.formstep_set.get(),
+                data={
+                    "name": f"Name {index}",
+                    "multi": ["a", "b"],
+                    "remarks": "multiple\nlines, with a comma",
+                },
+            )
+
+    def test_streamed_content_matches_dataset_export(self):
+        dataset = create_submission_export(Submission.objects.order_by("pk"))
+
+        for file_type in (
+            ExportFileTypes.CSV,
+            ExportFileTypes.JSON,
+            ExportFileTypes.XML,
+        ):
+            with self.subTest(file_type=file_type.extension):
+                response = export_submissions(
+                    Submission.objects.order_by("pk"), file_type
+                )
+
+                content = b"".join(response.streaming_content)
+
+                expected = dataset.export(file_type.extension)
+                if isinstance(expected, str):
+                    expected = expected.encode("utf-8")
+                self.assertEqual(content, expected)
+
+    def test_xlsx_export(self):
+        response = export_submissions(
+            Submission.objects.order_by("pk"), ExportFileTypes.XLSX
+        )
+
+        dataset = tablib.Dataset().load(
+            b"".join(response.streaming_content), format="xlsx"
+        )
+
+        self.assertEqual(
+            dataset.headers,
+            ["Formuliernaam", "Inzendingdatum", "name", "multi", "remarks"],
+        )
+        self.assertEqual(len(dataset), 3)
+        self.assertEqual(dataset[0][2], "Name 0")
+        self.assertEqual(dataset[0][3], "['a', 'b']")
+
+    def test_number_of_queries_does_not_depend_on_number_of_submissions(self):
+        # submissions are loaded in chunks, with the data of the form loaded once
+        create_submission_export(
+            Submission.objects.order_by("pk")
+        )  # warm up the logic cache
+
+        with self.assertNumQueries(7):
+            create_submission_export(Submission.objects.order_by("pk"))
+
+        SubmissionStepFactory.create(
+            submission__form=self.form,
+            submission__completed=True,
+            form_step=self.form.formstep_set.get(),
+            data={"name": "Name 3"},
+        )
+
+        with self.assertNumQueries(7):
+            create_submission_export(Submission.objects.order_by("pk"))
+
+    def test_submissions_are_loaded_in_chunks(self):
+        response = export_submissions(
+            Submission.objects.order_by("pk"), ExportFileTypes.CSV
+        )
+        content = b"".join(response.streaming_content)
+
+        with (
+            patch("openforms.submissions.exports.EXPORT_CHUNK_SIZE", 2),
+            patch.object(
+                QuerySet, "in_bulk", autospec=True, side_effect=QuerySet.in_bulk
+            ) as m_in_bulk,
+        ):
+            chunked_response = export_submissions(
+                Submission.objects.order_by("pk"), ExportFileTypes.CSV
+            )
+            chunked_content = b"".join(chunked_response.streaming_content)
+
+        self.assertEqual(chunked_content, content)
+        # three submissions in chunks of two
+        self.assertEqual(m_in_bulk.call_count, 2)
+        pks = list(Submission.objects.order_by("pk").values_list("pk", flat=True))
+        self.assertEqual(
+            [call.args[1] for call in m_in_bulk.call_args_list], [pks[:2], pks[2:]]
+        )
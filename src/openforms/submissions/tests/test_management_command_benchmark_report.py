@@ -0,0 +1,39 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from ..models import SubmissionReport
+from .factories import SubmissionFactory
+
+
+@patch("openforms.submissions.management.commands.benchmark_report.warm_up")
+@patch.object(SubmissionReport, "render_pdf", return_value=("<html></html>", b"%PDF"))
+class CommandTests(TestCase):
+    def test_render_reports_in_process(self, mock_render_pdf, mock_warm_up):
+        submission1, submission2 = SubmissionFactory.create_batch(2, completed=True)
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_report",
+            str(submission1.pk),
+            str(submission2.pk),
+            "--repeat=3",
+            "--workers=0",
+            stdout=stdout,
+        )
+
+        mock_warm_up.assert_called_once_with()
+        self.assertEqual(mock_render_pdf.call_count, 6)
+        output = stdout.getvalue()
+        self.assertIn("Rendered 6 report(s)", output)
+        self.assertIn("Reports per second:", output)
+        # the reports are not stored
+        self.assertFalse(SubmissionReport.objects.exists())
+
+    def test_unknown_submission(self, mock_render_pdf, mock_warm_up):
+        with self.assertRaisesMessage(CommandError, "Submission(s) 123 do not exist."):
+            call_command("benchmark_report", "123", "--workers=0", stdout=StringIO())
+
+        mock_render_pdf.assert_not_called()
@@ -3,14 +3,18 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from django.core import mail
-from django.test import TestCase, override_settings, tag
+from django.test import SimpleTestCase, TestCase, override_settings, tag
 from django.utils.translation import gettext_lazy as _
 
+from celery.backends.cache import CacheBackend
+from celery.result import AsyncResult, GroupResult
+from celery.signals import task_postrun, task_prerun
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from testfixtures import LogCapture
 
 from openforms.authentication.service import AuthAttribute
+from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.emails.tests.factories import ConfirmationEmailTemplateFactory
 from openforms.forms.constants import LogicActionTypes, PropertyTypes
@@ -27,8 +31,15 @@ from openforms.utils.tests.logging import ensure_logger_level
 
 from ..constants import PostSubmissionEvents, RegistrationStatuses
 from ..models import SubmissionReport
-from ..tasks import on_post_submission_event
-from .factories import SubmissionFactory
+from ..tasks import (
+    cleanup_temporary_files_for,
+    finalise_completion,
+    generate_submission_report,
+    get_task_ids,
+    on_post_submission_event,
+    pre_registration,
+)
+from .factories import PostCompletionMetadataFactory, SubmissionFactory
 
 
 @temp_private_root()
@@ -1368,3 +1379,71 @@ class PaymentFlowTests(TestCase):
             on_post_submission_event(submission.id, PostSubmissionEvents.on_completion)
 
         mock_registration.assert_called_once()
+
+
+class GetTaskIdsTests(SimpleTestCase):
+    def test_chain_with_group(self):
+        # avoid the (redis) result backend subscribing to the results
+        backend = CacheBackend(app=app, backend="memory")
+        group_result = GroupResult(
+            "group",
+            [AsyncResult("a", backend=backend), AsyncResult("b", backend=backend)],
+        )
+        first = AsyncResult("c", parent=group_result)
+        last = AsyncResult("d", parent=first)
+
+        self.assertEqual(get_task_ids(last), ["d", "c", "a", "b"])
+
+    def test_plain_chain(self):
+        result = AsyncResult("b", parent=AsyncResult("a"))
+
+        self.assertEqual(get_task_ids(result), result.as_list())
+
+
+class StageTimingTests(TestCase):
+    def _run_task(self, task, task_id: str, submission_id: int) -> None:
+        args = (submission_id,)
+        task_prerun.send(sender=task, task_id=task_id, task=task, args=args, kwargs={})
+        task_postrun.send(
+            sender=task,
+            task_id=task_id,
+            task=task,
+            args=args,
+            kwargs={},
+            retval=None,
+            state="SUCCESS",
+        )
+
+    def test_timings_recorded_on_latest_metadata(self):
+        with freeze_time("2024-01-01T12:00:00Z"):
+            submission = SubmissionFactory.create(completed=True)
+        old_metadata = submission.postcompletionmetadata_set.get()
+        metadata = PostCompletionMetadataFactory.create(
+            submission=submission, trigger_event=PostSubmissionEvents.on_retry
+        )
+
+        with freeze_time("2024-01-02T12:00:00Z"):
+            self._run_task(pre_registration, "task-1", submission.pk)
+            self._run_task(generate_submission_report, "task-2", submission.pk)
+
+        metadata.refresh_from_db()
+        self.assertEqual(
+            set(metadata.stage_timings),
+            {"pre_registration", "generate_submission_report"},
+        )
+        timing = metadata.stage_timings["pre_registration"]
+        self.assertEqual(timing["started"], "2024-01-02T12:00:00+00:00")
+        self.assertEqual(timing["state"], "SUCCESS")
+        self.assertGreaterEqual(timing["duration"], 0)
+        old_metadata.refresh_from_db()
+        self.assertEqual(old_metadata.stage_timings, {})
+
+    def test_other_tasks_ignored(self):
+        submission = SubmissionFactory.create(completed=True)
+        metadata = submission.postcompletionmetadata_set.get()
+
+        self._run_task(finalise_completion, "task-1", submission.pk)
+        self._run_task(cleanup_temporary_files_for, "task-2", submission.pk)
+
+        metadata.refresh_from_db()
+        self.assertEqual(list(metadata.stage_timings), ["finalise_completion"])
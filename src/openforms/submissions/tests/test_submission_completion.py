@@ -35,6 +35,10 @@ from openforms.registrations.base import BasePlugin
 from openforms.registrations.registry import Registry
 from openforms.registrations.tests.utils import patch_registry
 from openforms.submissions.pricing import InvalidPrice
+from openforms.validations.registry import (
+    ValidationResult,
+    register as validations_register,
+)
 from openforms.variables.constants import FormVariableDataTypes
 
 from ..constants import SUBMISSIONS_SESSION_KEY, PostSubmissionEvents
@@ -118,6 +122,52 @@ class SubmissionCompletionTests(SubmissionsMixin, APITestCase):
         ]
         self.assertIn("steps.0.data.firstName", invalid_param_names)
 
+    def test_plugin_validations_deduplicated_over_steps(self):
+        form = FormFactory.create()
+        for key in ("kvkNumber", "otherKvkNumber"):
+            FormStepFactory.create(
+                form=form,
+                form_definition__configuration={
+                    "components": [
+                        {
+                            "type": "textfield",
+                            "key": key,
+                            "label": "KvK number",
+                            "validate": {"plugins": ["kvk-kvkNumber"]},
+                        }
+                    ]
+                },
+            )
+        submission = SubmissionFactory.create(form=form)
+        step1, step2 = form.formstep_set.all()
+        SubmissionStepFactory.create(
+            submission=submission, form_step=step1, data={"kvkNumber": "12345678"}
+        )
+        SubmissionStepFactory.create(
+            submission=submission, form_step=step2, data={"otherKvkNumber": "12345678"}
+        )
+        self._add_submission_to_session(submission)
+        endpoint = reverse("api:submission-complete", kwargs={"uuid": submission.uuid})
+
+        with patch.object(
+            validations_register,
+            "validate",
+            return_value=ValidationResult(False, messages=["Unknown KvK number."]),
+        ) as mock_validate:
+            response = self.client.post(endpoint, {"privacy_policy_accepted": True})
+
+        mock_validate.assert_called_once_with(
+            "kvk-kvkNumber", value="12345678", submission=submission
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        invalid_param_names = [
+            param["name"] for param in response.json()["invalidParams"]
+        ]
+        self.assertEqual(
+            invalid_param_names,
+            ["steps.0.data.kvkNumber", "steps.1.data.otherKvkNumber"],
+        )
+
     @patch("openforms.submissions.api.mixins.on_post_submission_event")
     @freeze_time("2020-12-11T10:53:19+01:00")
     def test_complete_submission(self, mock_on_post_submission_event):
@@ -1,11 +1,15 @@
+import time
 from datetime import timedelta
 from decimal import Decimal
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from django.test import TestCase, tag
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings, tag
 from django.utils import timezone
 
-from celery import states
+from celery import Celery, states
+from celery.backends.cache import CacheBackend
+from celery.backends.redis import RedisBackend
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from rest_framework import status
@@ -13,6 +17,7 @@ from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from openforms.appointments.tests.factories import AppointmentInfoFactory
+from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.frontend import get_frontend_redirect_url
 from openforms.payments.constants import PaymentStatus
@@ -25,6 +30,7 @@ from ..constants import (
     ProcessingResults,
     ProcessingStatuses,
 )
+from ..status import fetch_task_states, get_task_states, wait_for_task_updates
 from ..tasks import cleanup_on_completion_results
 from ..tokens import submission_status_token_generator
 from .factories import (
@@ -34,6 +40,10 @@ from .factories import (
 )
 
 
+def task_states(state: str):
+    return lambda task_ids: dict.fromkeys(task_ids, state)
+
+
 class SubmissionStatusPermissionTests(APITestCase):
     def setUp(self):
         super().setUp()
@@ -111,6 +121,7 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
     def setUp(self):
         super().setUp()
         self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(cache.clear)
 
     def test_no_task_id_registered(self):
         submission = SubmissionFactory.create(
@@ -147,8 +158,10 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(check_status_url)
 
@@ -168,10 +181,12 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             states.RETRY,
         ]
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
             for state in in_progress_states:
                 with self.subTest(celery_state=state):
-                    mock_AsyncResult.return_value.state = state
+                    mock_fetch_task_states.side_effect = task_states(state)
 
                     response = self.client.get(check_status_url)
 
@@ -183,6 +198,95 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
                     self.assertEqual(response_data["result"], "")
                     self.assertEqual(response_data["paymentUrl"], "")
 
+    def test_unchanged_in_progress_status_not_modified(self):
+        submission = SubmissionFactory.create(completed=True)
+        token = submission_status_token_generator.make_token(submission)
+        check_status_url = reverse(
+            "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
+        )
+
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.STARTED)
+            response = self.client.get(check_status_url)
+            etag = response["ETag"]
+
+            with self.subTest("unchanged"):
+                response = self.client.get(check_status_url, HTTP_IF_NONE_MATCH=etag)
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response.content, b"")
+
+            with self.subTest("task state changed"):
+                mock_fetch_task_states.side_effect = task_states(states.RETRY)
+
+                response = self.client.get(check_status_url, HTTP_IF_NONE_MATCH=etag)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotEqual(response["ETag"], etag)
+
+            with self.subTest("done"):
+                mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
+
+                response = self.client.get(check_status_url, HTTP_IF_NONE_MATCH=etag)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json()["status"], ProcessingStatuses.done)
+                self.assertNotIn("ETag", response)
+
+    @override_settings(SUBMISSION_STATUS_MAX_WAIT=10)
+    def test_wait_for_processing_to_progress(self):
+        submission = SubmissionFactory.create(completed=True)
+        token = submission_status_token_generator.make_token(submission)
+        check_status_url = reverse(
+            "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
+        )
+
+        def finish_tasks(task_ids, known_states, timeout):
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
+            return True
+
+        with (
+            patch(
+                "openforms.submissions.status.fetch_task_states",
+                side_effect=task_states(states.STARTED),
+            ) as mock_fetch_task_states,
+            patch(
+                "openforms.submissions.status.wait_for_task_updates",
+                side_effect=finish_tasks,
+            ) as mock_wait_for_task_updates,
+        ):
+            response = self.client.get(check_status_url, {"wait": 30})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], ProcessingStatuses.done)
+        mock_wait_for_task_updates.assert_called_once_with(
+            ["some-id"], {"some-id": states.STARTED}, timeout=10
+        )
+
+    def test_wait_disabled(self):
+        submission = SubmissionFactory.create(completed=True)
+        token = submission_status_token_generator.make_token(submission)
+        check_status_url = reverse(
+            "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
+        )
+
+        with (
+            patch(
+                "openforms.submissions.status.fetch_task_states",
+                side_effect=task_states(states.STARTED),
+            ),
+            patch(
+                "openforms.submissions.status.wait_for_task_updates"
+            ) as mock_wait_for_task_updates,
+        ):
+            response = self.client.get(check_status_url, {"wait": 30})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+        mock_wait_for_task_updates.assert_not_called()
+
     def test_finished_celery_states(self):
         submission = SubmissionFactory.create(completed=True)
         token = submission_status_token_generator.make_token(submission)
@@ -195,10 +299,14 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             states.FAILURE,
         ]
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
             for state in finished_states:
                 with self.subTest(celery_state=state):
-                    mock_AsyncResult.return_value.state = state
+                    mock_fetch_task_states.side_effect = task_states(state)
+                    # the state of finished tasks is remembered
+                    cache.clear()
 
                     response = self.client.get(check_status_url)
 
@@ -219,10 +327,14 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             (states.FAILURE, ProcessingResults.failed),
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
             for state, expected_result in expected:
                 with self.subTest(celery_state=state):
-                    mock_AsyncResult.return_value.state = state
+                    mock_fetch_task_states.side_effect = task_states(state)
+                    # the state of finished tasks is remembered
+                    cache.clear()
 
                     response = self.client.get(check_status_url)
 
@@ -240,8 +352,10 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.FAILURE
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.FAILURE)
 
             response = self.client.get(check_status_url)
 
@@ -267,6 +381,7 @@ class SubmissionStatusExtraInformationTests(APITestCase):
     def setUp(self):
         super().setUp()
         self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(cache.clear)
 
     def test_succesful_processing(self):
         submission = SubmissionFactory.create(
@@ -282,8 +397,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(check_status_url)
 
@@ -313,8 +430,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.FAILURE
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.FAILURE)
 
             response = self.client.get(check_status_url)
 
@@ -345,8 +464,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(check_status_url)
 
@@ -372,8 +493,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(check_status_url)
 
@@ -399,8 +522,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(check_status_url)
 
@@ -430,8 +555,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(check_status_url)
             response_data = response.json()
@@ -463,8 +590,10 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        with patch(
+            "openforms.submissions.status.fetch_task_states"
+        ) as mock_fetch_task_states:
+            mock_fetch_task_states.side_effect = task_states(states.SUCCESS)
 
             response = self.client.get(
                 check_status_url, headers={"X-CSP-Nonce": "-dummy-"}
@@ -499,6 +628,116 @@ class SubmissionStatusExtraInformationTests(APITestCase):
         self.assertEqual(response_data["paymentUrl"], "")
 
 
+class TaskStatesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.backend = CacheBackend(app=app, backend="memory")
+        patcher = patch.object(Celery, "backend", new=self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.clear)
+
+    def test_states_fetched_in_one_call(self):
+        self.backend.store_result("task-1", None, states.SUCCESS)
+        self.backend.store_result("task-2", None, states.STARTED)
+
+        with patch.object(self.backend, "mget", wraps=self.backend.mget) as mock_mget:
+            result = fetch_task_states(["task-1", "task-2", "task-3"])
+
+        self.assertEqual(
+            result,
+            {
+                "task-1": states.SUCCESS,
+                "task-2": states.STARTED,
+                "task-3": states.PENDING,
+            },
+        )
+        mock_mget.assert_called_once()
+
+    def test_finished_states_are_not_fetched_again(self):
+        self.backend.store_result("task-1", None, states.SUCCESS)
+        self.backend.store_result("task-2", None, states.STARTED)
+        get_task_states(["task-1", "task-2"])
+        self.backend.forget("task-1")
+        self.backend.store_result("task-2", None, states.FAILURE)
+
+        with patch(
+            "openforms.submissions.status.fetch_task_states", wraps=fetch_task_states
+        ) as mock_fetch_task_states:
+            result = get_task_states(["task-1", "task-2"])
+
+        self.assertEqual(result, {"task-1": states.SUCCESS, "task-2": states.FAILURE})
+        mock_fetch_task_states.assert_called_once_with(["task-2"])
+
+
+class WaitForTaskUpdatesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.backend = RedisBackend(app=app, url="redis://localhost:6379/0")
+        patcher = patch.object(Celery, "backend", new=self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.mock_client = MagicMock()
+        patcher = patch.object(RedisBackend, "client", new=self.mock_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pubsub = self.mock_client.pubsub.return_value
+
+    @patch(
+        "openforms.submissions.status.fetch_task_states",
+        return_value={"task-1": states.STARTED},
+    )
+    def test_task_state_published(self, mock_fetch_task_states):
+        self.pubsub.get_message.side_effect = [None, {"type": "message"}]
+
+        changed = wait_for_task_updates(
+            ["task-1"], {"task-1": states.STARTED}, timeout=5
+        )
+
+        self.assertTrue(changed)
+        self.pubsub.subscribe.assert_called_once_with(b"celery-task-meta-task-1")
+        self.pubsub.close.assert_called_once_with()
+
+    @patch(
+        "openforms.submissions.status.fetch_task_states",
+        return_value={"task-1": states.SUCCESS},
+    )
+    def test_task_state_changed_before_subscribing(self, mock_fetch_task_states):
+        changed = wait_for_task_updates(
+            ["task-1"], {"task-1": states.STARTED}, timeout=5
+        )
+
+        self.assertTrue(changed)
+        self.pubsub.get_message.assert_not_called()
+
+    @patch(
+        "openforms.submissions.status.fetch_task_states",
+        return_value={"task-1": states.STARTED},
+    )
+    def test_timeout(self, mock_fetch_task_states):
+        self.pubsub.get_message.side_effect = lambda timeout: time.sleep(timeout)
+
+        changed = wait_for_task_updates(
+            ["task-1"], {"task-1": states.STARTED}, timeout=0.05
+        )
+
+        self.assertFalse(changed)
+        self.pubsub.close.assert_called_once_with()
+
+    def test_other_result_backends_not_supported(self):
+        with patch.object(
+            Celery, "backend", new=CacheBackend(app=app, backend="memory")
+        ):
+            changed = wait_for_task_updates(
+                ["task-1"], {"task-1": states.STARTED}, timeout=5
+            )
+
+        self.assertFalse(changed)
+
+
 @patch("openforms.submissions.status.AsyncResult.forget", return_value=None)
 class CleanupTaskTests(TestCase):
     def setUp(self):
@@ -209,6 +209,27 @@ class SubmissionValueVariableModelTests(TestCase):
             time_value = time_var.to_python(time(9, 41))
             self.assertEqual(time_value, time(9, 41))
 
+    def test_to_python_is_memoized(self):
+        variable = SubmissionValueVariableFactory.create(
+            value="2022-09-13",
+            form_variable__user_defined=True,
+            form_variable__data_type=FormVariableDataTypes.date,
+        )
+        variable.form_variable = variable.submission.form.formvariable_set.get()
+
+        with self.subTest("same value"):
+            self.assertIs(variable.to_python(), variable.to_python())
+
+        with self.subTest("value replaced"):
+            variable.value = "2022-09-14"
+
+            self.assertEqual(variable.to_python(), date(2022, 9, 14))
+
+        with self.subTest("form variable replaced"):
+            variable.form_variable = None
+
+            self.assertEqual(variable.to_python(), "2022-09-14")
+
     def test_is_initially_prefilled_is_set(self):
         config = {
             "display": "form",
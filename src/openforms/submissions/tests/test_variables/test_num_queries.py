@@ -12,6 +12,7 @@ from openforms.submissions.tests.factories import (
     SubmissionValueVariableFactory,
 )
 
+from ...models import Submission
 from ...models.submission_value_variable import (
     SubmissionValueVariable,
     SubmissionValueVariablesState,
@@ -155,9 +156,9 @@ class SubmissionVariablesPerformanceTests(APITestCase):
 
         # 1. load_variables_state: retrieve form variables
         # 2. load_variables_state: retrieve submission value variables
-        # 3. bulk_create var3 and var4 submission value variables
-        # 4. bulk_update var1 and var2 submission value variables
-        with self.assertNumQueries(4):
+        # 3. upsert var1 and var2 (updated) and var3 and var4 (created) submission
+        #    value variables
+        with self.assertNumQueries(3):
             submission_step.data = {
                 "var1": "test1-modified",
                 "var2": "test2-modified",
@@ -165,6 +166,42 @@ class SubmissionVariablesPerformanceTests(APITestCase):
                 "var4": "test4",
             }
 
+        self.assertEqual(
+            submission_step.data,
+            {
+                "var1": "test1-modified",
+                "var2": "test2-modified",
+                "var3": "test3",
+                "var4": "test4",
+            },
+        )
+
+    def test_update_step_data_unchanged(self):
+        form = FormFactory.create()
+        form_step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"key": "var1", "type": "textfield"},
+                    {"key": "var2", "type": "textfield"},
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission,
+            form_step=form_step,
+            data={"var1": "test1", "var2": "test2"},
+        )
+        # load the persisted state, like a new request does
+        submission = Submission.objects.get(pk=submission.pk)
+        submission_step = submission.load_execution_state().submission_steps[0]
+
+        # 1. load_variables_state: retrieve form variables
+        # 2. load_variables_state: retrieve submission value variables
+        with self.assertNumQueries(2):
+            submission_step.data = {"var1": "test1", "var2": "test2"}
+
     def test_get_step_data(self):
         form = FormFactory.create()
         form_step = FormStepFactory.create(
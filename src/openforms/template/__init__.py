@@ -6,13 +6,10 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
-
-Possible future features:
-
-* Caching for string-based templates
-* ...
+* Caching of the parsed string-based templates, per process.
 """
 
+from functools import lru_cache
 from typing import Iterator
 
 from django.template.backends.django import Template as DjangoTemplate
@@ -23,15 +20,27 @@ from .backends.sandboxed_django import backend as sandbox_backend, openforms_bac
 
 __all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
 
+# the number of distinct template sources to keep parsed in memory, per process
+TEMPLATE_CACHE_SIZE = 1024
+
 
 def parse(source: str, backend=sandbox_backend) -> DjangoTemplate:
     """
     Parse the template fragment using the specified backend.
 
+    Parsed templates are cached on the source and backend, so the same template
+    instance may be returned to multiple callers. Like templates loaded from files,
+    they can be rendered any number of times (with different contexts).
+
     :returns: A template instance of the specified backend
     :raises: :class:`django.template.TemplateSyntaxError` if there are any
       syntax errors
     """
+    return _parse(source, backend)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse(source: str, backend) -> DjangoTemplate:
     template = backend.from_string(source)
     assert isinstance(template, DjangoTemplate)
     return template
@@ -0,0 +1,81 @@
+from unittest.mock import Mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.utils.module_loading import import_string
+
+from openforms.celery import app, get_routed_queues, warn_about_unconsumed_queues
+
+
+class TaskRoutesTests(SimpleTestCase):
+    def _get_queue(self, task_name: str) -> str:
+        route = app.amqp.router.route({}, task_name)
+        return route["queue"].name
+
+    def test_task_references_correct(self):
+        """
+        Assert that the routed tasks exist, as routes of unknown tasks are ignored.
+        """
+        for task_path in settings.CELERY_TASK_ROUTES:
+            with self.subTest(task=task_path):
+                try:
+                    task = import_string(task_path)
+                except ImportError:
+                    self.fail(
+                        f"Could not import task '{task_path}' in settings.CELERY_TASK_ROUTES"
+                    )
+                else:
+                    self.assertEqual(task.name, task_path)
+
+    def test_submission_processing_routes(self):
+        expected_queues = {
+            "openforms.appointments.tasks.maybe_register_appointment": "user-facing",
+            "openforms.registrations.tasks.pre_registration": "user-facing",
+            "openforms.submissions.tasks.pdf.generate_submission_report": "pdf",
+            "openforms.registrations.tasks.register_submission": "registration",
+            "openforms.payments.tasks.update_submission_payment_status": "registration",
+            "openforms.submissions.tasks.finalise_completion": "user-facing",
+        }
+
+        for task_name, queue in expected_queues.items():
+            with self.subTest(task=task_name):
+                self.assertEqual(self._get_queue(task_name), queue)
+
+    def test_maintenance_jobs_routes(self):
+        for task_name in (
+            "openforms.data_removal.tasks.delete_submissions",
+            "openforms.data_removal.tasks.make_sensitive_data_anonymous",
+            "openforms.submissions.tasks.cleanup.cleanup_on_completion_results",
+        ):
+            with self.subTest(task=task_name):
+                self.assertEqual(self._get_queue(task_name), "maintenance")
+
+    def test_other_tasks_use_default_queue(self):
+        self.assertEqual(
+            self._get_queue("openforms.forms.tasks.activate_forms"), "celery"
+        )
+
+
+class UnconsumedQueuesWarningTests(SimpleTestCase):
+    def _start_worker(self, *queues: str):
+        instance = Mock()
+        instance.app.amqp.queues.consume_from = dict.fromkeys(queues)
+        warn_about_unconsumed_queues(sender="worker@host", instance=instance)
+
+    def test_routed_queues(self):
+        self.assertEqual(
+            get_routed_queues(),
+            {"celery", "user-facing", "pdf", "registration", "maintenance"},
+        )
+
+    def test_worker_consuming_all_queues(self):
+        with self.assertNoLogs("openforms.celery"):
+            self._start_worker(*get_routed_queues())
+
+    def test_worker_consuming_the_default_queue_only(self):
+        with self.assertLogs("openforms.celery", level="WARNING") as logs:
+            self._start_worker("celery")
+
+        self.assertIn(
+            "maintenance, pdf, registration, user-facing", logs.records[0].getMessage()
+        )
@@ -88,14 +88,16 @@ class FormInlineStyleCSPTests(CSPMixin, APITestCase):
         self.assertEqual(response.json()["explanationTemplate"], expected)
 
 
-@patch("openforms.submissions.status.AsyncResult")
+@patch("openforms.submissions.status.fetch_task_states")
 @patch(
     "openforms.submissions.models.submission.GlobalConfiguration.get_solo",
     return_value=GlobalConfiguration(),
 )
 class SubmissionConfirmationInlineStyleCSPTests(CSPMixin, APITestCase):
-    def test_form_level_confirmation_template(self, mock_get_solo, mock_AsyncResult):
-        mock_AsyncResult.return_value.state = states.SUCCESS
+    def test_form_level_confirmation_template(
+        self, mock_get_solo, mock_fetch_task_states
+    ):
+        mock_fetch_task_states.return_value = {"123": states.SUCCESS}
         submission = SubmissionFactory.create(
             completed=True,
             with_report=False,
@@ -128,9 +130,9 @@ class SubmissionConfirmationInlineStyleCSPTests(CSPMixin, APITestCase):
         self.assertHTMLEqual(confirmation_page, expected)
 
     def test_global_config_level_confirmation_template(
-        self, mock_get_solo, mock_AsyncResult
+        self, mock_get_solo, mock_fetch_task_states
     ):
-        mock_AsyncResult.return_value.state = states.SUCCESS
+        mock_fetch_task_states.return_value = {"123": states.SUCCESS}
         mock_get_solo.return_value = GlobalConfiguration(
             submission_confirmation_template="""
             <p>This is some <span style="color: red;">inline styled</span> HTML.</p>
@@ -2,6 +2,7 @@
 Utilities to parse/process jsonLogic expressions.
 """
 
+from .compilation import *  # noqa
 from .datastructures import *  # noqa
 from .introspection import *  # noqa
 
@@ -9,5 +10,7 @@ __all__ = [
     "OPERATION_DESCRIPTION_BUILDERS",
     "generate_rule_description",
     "ComponentMeta",
+    "CompiledExpression",
+    "compile_expression",
     "introspect_json_logic",
 ]
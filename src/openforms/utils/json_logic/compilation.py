@@ -0,0 +1,280 @@
+"""
+Compile JsonLogic expressions into Python callables.
+
+The :func:`json_logic.jsonLogic` interpreter re-parses the expression tree on every
+evaluation. For logic rules that are evaluated over and over again (e.g. on every
+logic check of a submission), we compile the expression once into a tree of closures
+that produce the exact same results as the interpreter, including its (lack of)
+short-circuiting and the way it handles empty operands.
+
+While compiling, the variables read by the expression are collected so that callers
+can determine which expressions are affected by a change in the data.
+"""
+
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    jsonLogic,
+    missing,
+    missing_some,
+    operations,
+)
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+type Evaluator = Callable[[Any], Any]
+
+# the number of distinct expressions to keep compiled in memory, per process
+CACHE_SIZE = 4096
+
+# operators whose result does not (only) depend on the data they're evaluated against
+IMPURE_OPERATORS = {"today"}
+
+
+@dataclass
+class _Inputs:
+    keys: set[str] = field(default_factory=set)
+    dynamic: bool = False
+
+
+class CompiledExpression:
+    """
+    A JsonLogic expression compiled to a Python callable.
+
+    Calling an instance with the data to evaluate against produces the same result
+    as ``jsonLogic(expression, data)``.
+    """
+
+    def __init__(self, expression: JSON):
+        self.expression = expression
+        inputs = _Inputs()
+        self._evaluate = _compile(expression, inputs)
+        self.input_keys: frozenset[str] = frozenset(inputs.keys)
+        """
+        The (dotted) variable paths read by the expression.
+        """
+        self.has_dynamic_inputs: bool = inputs.dynamic
+        """
+        Whether the expression reads variables that can only be determined at
+        evaluation time (or reads the complete data structure), or uses operators that
+        are not a pure function of the data.
+        """
+
+    def __repr__(self):
+        return f"<CompiledExpression {self.expression!r}>"
+
+    def __call__(self, data: Any = None) -> Any:
+        return self._evaluate(data)
+
+    def reads(self, key: str) -> bool:
+        """
+        Check if a change to the variable ``key`` can affect the result.
+        """
+        if self.has_dynamic_inputs:
+            return True
+        return any(paths_overlap(key, input_key) for input_key in self.input_keys)
+
+
+def paths_overlap(path: str, other: str) -> bool:
+    """
+    Check if two dotted paths refer to (parts of) the same data.
+    """
+    if path == other:
+        return True
+    if len(path) < len(other):
+        path, other = other, path
+    return path.startswith(other) and path[len(other)] == "."
+
+
+def compile_expression(expression: JSON) -> CompiledExpression:
+    """
+    Compile a JsonLogic expression, re-using earlier compilations when possible.
+
+    Compiled expressions are cached (per process) on the content of the expression,
+    so any change to the expression results in a new compilation.
+    """
+    try:
+        serialized = json.dumps(expression)
+    except (TypeError, ValueError):
+        return CompiledExpression(expression)
+    return _compile_serialized(serialized)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_serialized(serialized: str) -> CompiledExpression:
+    return CompiledExpression(json.loads(serialized))
+
+
+def _constant(value: Any) -> Evaluator:
+    return lambda data: value
+
+
+def _interpret(expression: JSON) -> Evaluator:
+    # fall back to the interpreter for shapes we don't explicitly support, so that
+    # the exact same errors are raised at evaluation time
+    return lambda data: jsonLogic(expression, data)
+
+
+def _compile(expression: JSON, inputs: _Inputs) -> Evaluator:
+    if isinstance(expression, list):
+        items = [_compile(item, inputs) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # You've recursed to a primitive, stop!
+    if expression is None or not isinstance(expression, dict):
+        return _constant(expression)
+
+    try:
+        operator, values = destructure(expression)
+    except AssertionError:
+        inputs.dynamic = True
+        return _interpret(expression)
+
+    if not isinstance(values, list) and not isinstance(values, tuple):
+        values = [values]
+
+    if operator in IMPURE_OPERATORS:
+        inputs.dynamic = True
+
+    match operator:
+        case "map" | "reduce":
+            return _compile_scoped(expression, operator, values, inputs)
+        case "var":
+            return _compile_var(values, inputs)
+        case "missing" | "missing_some":
+            _collect_missing_inputs(operator, values, inputs)
+
+    args = [_compile(value, inputs) for value in values]
+
+    match operator:
+        case "missing":
+            return lambda data: missing(data or {}, *[arg(data or {}) for arg in args])
+        case "missing_some":
+            return lambda data: missing_some(
+                data or {}, *[arg(data or {}) for arg in args]
+            )
+
+    if operator not in operations:
+
+        def _unrecognized(data):
+            data = data or {}
+            for arg in args:
+                arg(data)
+            raise ValueError("Unrecognized operation %s" % operator)
+
+        return _unrecognized
+
+    func = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+
+    if not empty_values:
+
+        def _evaluate(data):
+            data = data or {}
+            return func(*[arg(data) for arg in args])
+
+        return _evaluate
+
+    def _evaluate_with_empty_check(data):
+        data = data or {}
+        operands = [arg(data) for arg in args]
+        if any([operand in empty_values for operand in operands]):
+            return None
+        return func(*operands)
+
+    return _evaluate_with_empty_check
+
+
+def _compile_var(values: list[JSON], inputs: _Inputs) -> Evaluator:
+    args = [_compile(value, inputs) for value in values]
+    name = values[0] if values else None
+
+    if isinstance(name, dict | list) or name is None or name == "":
+        inputs.dynamic = True
+    else:
+        inputs.keys.add(str(name))
+
+    # optimize the common case of a literal variable name without default
+    if len(values) == 1 and isinstance(name, str) and name:
+        path = name.split(".")
+
+        def _lookup(data):
+            data = data or {}
+            try:
+                for key in path:
+                    try:
+                        data = data[key]
+                    except TypeError:
+                        data = data[int(key)]
+            except (KeyError, TypeError, ValueError, IndexError):
+                return None
+            return data
+
+        return _lookup
+
+    return lambda data: get_var(data or {}, *[arg(data or {}) for arg in args])
+
+
+def _collect_missing_inputs(operator: str, values: list[JSON], inputs: _Inputs):
+    names = values
+    if operator == "missing_some":
+        names = values[-1] if values else []
+    elif values and isinstance(values[0], list):
+        names = values[0]
+    if not isinstance(names, list):
+        inputs.dynamic = True
+        return
+    for name in names:
+        if isinstance(name, dict | list) or name is None or name == "":
+            inputs.dynamic = True
+        else:
+            inputs.keys.add(str(name))
+
+
+def _compile_scoped(
+    expression: JSON, operator: str, values: list[JSON], inputs: _Inputs
+) -> Evaluator:
+    # the scoped logic is evaluated against the items of the iterable rather than the
+    # data itself, so it does not add input keys. It can still be dynamic though (e.g.
+    # with impure operators like ``today``), in which case the expression is too.
+    scoped_inputs = _Inputs()
+    match (operator, values):
+        case ("map", [iterable_path, scoped_logic]):
+            get_iterable = _compile(iterable_path, inputs)
+            scoped = _compile(scoped_logic, scoped_inputs)
+            inputs.dynamic |= scoped_inputs.dynamic
+
+            def _map(data):
+                iterable = get_iterable(data or {}) or []
+                return list(map(scoped, iterable))
+
+            return _map
+
+        case ("reduce", [iterable_path, scoped_logic, initializer]):
+            get_iterable = _compile(iterable_path, inputs)
+            scoped = _compile(scoped_logic, scoped_inputs)
+            inputs.dynamic |= scoped_inputs.dynamic
+
+            def _reduce(data):
+                iterable = get_iterable(data or {})
+                if not isinstance(iterable, list):
+                    return initializer
+                accumulator = initializer
+                for current in iterable:
+                    accumulator = scoped(
+                        {"accumulator": accumulator, "current": current}
+                    )
+                return accumulator
+
+            return _reduce
+
+        case _:
+            inputs.dynamic = True
+            return _interpret(expression)
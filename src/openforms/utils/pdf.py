@@ -1,5 +1,7 @@
 import logging
 import mimetypes
+import os
+from functools import lru_cache
 from io import BytesIO
 from pathlib import PurePosixPath
 from urllib.parse import ParseResult, urljoin, urlparse
@@ -12,6 +14,18 @@ from django.template.loader import render_to_string
 
 logger = logging.getLogger(__name__)
 
+# the number of local static/media files (stylesheets, fonts, images...) to keep in
+# memory, per process
+ASSET_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=ASSET_CACHE_SIZE)
+def _read_asset(path: str, mtime_ns: int) -> bytes:
+    # the modification time is part of the cache key so that replaced files (e.g. an
+    # updated theme stylesheet upload) are read again
+    with open(path, "rb") as f:
+        return f.read()
+
 
 class UrlFetcher:
     """
@@ -71,8 +85,8 @@ class UrlFetcher:
                 redirected_url=orig_url,
                 filename=path.parts[-1],
             )
-            with open(absolute_path, "rb") as f:
-                result["file_obj"] = BytesIO(f.read())
+            content = _read_asset(absolute_path, os.stat(absolute_path).st_mtime_ns)
+            result["file_obj"] = BytesIO(content)
             return result
         return weasyprint.default_url_fetcher(orig_url)
 
@@ -108,3 +122,16 @@ def render_to_pdf(template_name: str, context: dict) -> tuple[str, bytes]:
     )
     pdf: bytes = html_object.write_pdf(pdf_variant="pdf/ua-1")
     return rendered_html, pdf
+
+
+def warm_up() -> None:
+    """
+    Prepare the current process for rendering PDFs.
+
+    Importing WeasyPrint and rendering the first document (which initializes Pango
+    and the font configuration) is slow. Doing it upfront keeps this out of the first
+    PDF rendered by a (long-lived) worker process.
+    """
+    import weasyprint  # heavy import
+
+    weasyprint.HTML(string="<p></p>").write_pdf()
@@ -0,0 +1,59 @@
+"""
+Streaming request bodies for (large) file uploads.
+"""
+
+from base64 import b64encode
+from typing import BinaryIO, Iterator
+
+
+class Base64StreamingBody:
+    """
+    File-like request body embedding the base64 encoded content of a file.
+
+    The body consists of a head, the encoded file content and a tail. The file is read
+    and encoded in chunks while the request is being sent, so that neither the file
+    content nor its encoded form are loaded in memory as a whole. The length of the body
+    is known upfront, so the request is sent with a ``Content-Length`` header rather
+    than chunked.
+    """
+
+    # multiple of 3, so that the encoded chunks can be concatenated
+    chunk_size = 3 * 64 * 1024
+
+    def __init__(self, head: bytes, content: BinaryIO, size: int, tail: bytes):
+        self._head = head
+        self._tail = tail
+        self._length = len(head) + 4 * ((size + 2) // 3) + len(tail)
+        self._chunks = self._iter_chunks(content)
+        self._buffer = b""
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._buffer:
+            yield self._buffer
+            self._buffer = b""
+        yield from self._chunks
+
+    def _iter_chunks(self, content: BinaryIO) -> Iterator[bytes]:
+        yield self._head
+        remainder = b""
+        while chunk := content.read(self.chunk_size):
+            chunk = remainder + chunk
+            # reads may return less than requested, carry over what can't be encoded
+            # independently yet
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            yield b64encode(chunk[:cutoff])
+        yield b64encode(remainder) + self._tail
+
+    def read(self, size: int | None = -1) -> bytes:
+        while size is None or size < 0 or len(self._buffer) < size:
+            if (chunk := next(self._chunks, None)) is None:
+                break
+            self._buffer += chunk
+        if size is None or size < 0:
+            size = len(self._buffer)
+        result, self._buffer = self._buffer[:size], self._buffer[size:]
+        return result
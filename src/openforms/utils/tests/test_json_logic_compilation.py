@@ -0,0 +1,137 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from json_logic import jsonLogic
+
+from ..json_logic import compile_expression
+
+EXPRESSIONS = [
+    True,
+    None,
+    "text",
+    [1, {"var": "a"}],
+    {"var": "a"},
+    {"var": ["a"]},
+    {"var": ["missing", "default"]},
+    {"var": "nested.b"},
+    {"var": "items.1"},
+    {"var": "items.10"},
+    {"var": ""},
+    {"var": {"cat": ["nest", "ed.b"]}},
+    {"==": [{"var": "a"}, "1"]},
+    {"===": [{"var": "a"}, 1]},
+    {"!=": [{"var": "a"}, 2]},
+    {">": [{"var": "a"}, 0]},
+    {"<=": [{"var": "unknown"}, 5]},
+    {"<": [0, {"var": "a"}, 2]},
+    {"+": [{"var": "a"}, "2.5"]},
+    {"*": [{"var": "a"}, None]},
+    {"-": [{"var": "a"}]},
+    {"/": [{"var": "a"}, 4]},
+    {"%": [7, 4]},
+    {"and": [{"var": "a"}, {"var": "unknown"}]},
+    {"or": [{"var": "unknown"}, "fallback"]},
+    {"!": {"var": "a"}},
+    {"!!": [{"var": "items"}]},
+    {"if": [{"var": "a"}, "yes", "no"]},
+    {"if": [False, 1, {"var": "a"}, 2, 3]},
+    {"?:": [{"var": "unknown"}, 1, 2]},
+    {"in": ["b", {"var": "nested.b"}]},
+    {"in": [None, {"var": "items"}]},
+    {"cat": ["a", {"var": "a"}, None]},
+    {"min": [1, {"var": "a"}]},
+    {"max": [{"var": "unknown"}, 1]},
+    {"merge": [[1], {"var": "items"}, 4]},
+    {"missing": ["a", "unknown", "nested.b"]},
+    {"missing": [["a", "unknown"]]},
+    {"missing_some": [1, ["unknown", "a"]]},
+    {"map": [{"var": "items"}, {"*": [{"var": ""}, 2]}]},
+    {"map": [{"var": "unknown"}, {"var": ""}]},
+    {"reduce": [{"var": "items"}, {"+": [{"var": "accumulator"}, 1]}, 0]},
+    {"reduce": [{"var": "a"}, {"+": [{"var": "accumulator"}, 1]}, 10]},
+    {"date": {"var": "date"}},
+    {"date": {"var": "unknown"}},
+    {">": [{"date": {"var": "date"}}, {"date": "2020-01-01"}]},
+    {"+": [{"date": {"var": "date"}}, {"rdelta": [1, 0, 0]}]},
+]
+
+DATA = {
+    "a": 1,
+    "nested": {"b": "abc"},
+    "items": [1, 2, 3],
+    "date": "2021-05-05",
+}
+
+
+class CompiledExpressionTests(SimpleTestCase):
+    def test_results_match_interpreter(self):
+        for expression in EXPRESSIONS:
+            for data in (DATA, {}, None):
+                with self.subTest(expression=expression, data=data):
+                    compiled = compile_expression(expression)
+
+                    self.assertEqual(compiled(data), jsonLogic(expression, data))
+
+    def test_errors_match_interpreter(self):
+        expressions = [
+            {"unknown-operator": [1, 2]},
+            {"var": "a", "other": "b"},
+            {"date": "not a date"},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                with self.assertRaises(Exception) as interpreter_error:
+                    jsonLogic(expression, DATA)
+                with self.assertRaises(type(interpreter_error.exception)):
+                    compile_expression(expression)(DATA)
+
+    def test_compiled_expressions_are_cached(self):
+        compiled = compile_expression({"==": [{"var": "a"}, 1]})
+
+        self.assertIs(compile_expression({"==": [{"var": "a"}, 1]}), compiled)
+        self.assertIsNot(compile_expression({"==": [{"var": "a"}, 2]}), compiled)
+
+    def test_python_types(self):
+        expression = {">": [{"var": "date"}, {"date": "2020-01-01"}]}
+
+        result = compile_expression(expression)({"date": date(2021, 1, 1)})
+
+        self.assertTrue(result)
+
+    def test_input_keys(self):
+        expression = {
+            "and": [
+                {"==": [{"var": "a"}, 1]},
+                {"in": ["b", {"var": ["nested.b", []]}]},
+                {"missing": ["c"]},
+                {"reduce": [{"var": "items"}, {"var": "current.price"}, 0]},
+            ]
+        }
+
+        compiled = compile_expression(expression)
+
+        self.assertEqual(compiled.input_keys, {"a", "nested.b", "c", "items"})
+        self.assertFalse(compiled.has_dynamic_inputs)
+        self.assertTrue(compiled.reads("nested"))
+        self.assertTrue(compiled.reads("items.2"))
+        self.assertFalse(compiled.reads("nested.c"))
+        self.assertFalse(compiled.reads("current"))
+
+    def test_dynamic_inputs(self):
+        expressions = [
+            {"var": ""},
+            {"var": {"cat": ["a", "b"]}},
+            {"missing": {"merge": [["a"], ["b"]]}},
+            {">": [{"today": []}, {"var": "date"}]},
+            {"map": [{"var": "items"}, {"today": []}]},
+            {"reduce": [{"var": "items"}, {"today": []}, 0]},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                compiled = compile_expression(expression)
+
+                self.assertTrue(compiled.has_dynamic_inputs)
+                self.assertTrue(compiled.reads("anything"))
@@ -0,0 +1,133 @@
+"""
+Run the validation plugins of many components concurrently.
+
+Validation plugins typically call external services, which makes them the slow part
+of validating a complete submission. While a batch is active, the
+:class:`openforms.validations.drf_validators.PluginValidator` does not call the
+plugins directly but records the calls instead, which are then executed (once per
+unique plugin and value) in a bounded thread pool. Validating the data again
+afterwards picks up the stored results.
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from typing import Self
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.utils import translation
+
+from openforms.submissions.models import Submission
+from openforms.typing import JSONValue
+
+from .registry import ValidationResult, register
+
+_current_batch: ContextVar[PluginValidationBatch | None] = ContextVar(
+    "plugin_validation_batch", default=None
+)
+
+type CallKey = tuple[str, str]
+
+
+class PluginValidationBatch:
+    """
+    Collect the plugin validations performed while the batch is active.
+
+    Use the batch as a context manager to activate it. It can be (re-)activated
+    multiple times, both to collect the calls and to look up the results.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        if max_workers is None:
+            max_workers = settings.VALIDATION_PLUGINS_MAX_WORKERS
+        self.max_workers = max_workers
+        self.deferred: int = 0
+        self._pending: dict[CallKey, tuple[str, JSONValue, Submission]] = {}
+        self._results: dict[CallKey, ValidationResult | Exception] = {}
+        self._tokens: list[Token[PluginValidationBatch | None]] = []
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_current_batch.set(self))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current_batch.reset(self._tokens.pop())
+
+    def validate(
+        self, plugin_id: str, value: JSONValue, submission: Submission
+    ) -> ValidationResult | None:
+        """
+        Look up the result of a plugin validation, or record it for later execution.
+
+        :returns: the validation result, or ``None`` if the validation has been deferred
+          until :meth:`run` is called.
+        """
+        try:
+            key = (plugin_id, json.dumps(value, sort_keys=True, cls=DjangoJSONEncoder))
+        except (TypeError, ValueError):
+            return register.validate(plugin_id, value=value, submission=submission)
+
+        if key in self._results:
+            result = self._results[key]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.deferred += 1
+        self._pending.setdefault(key, (plugin_id, value, submission))
+        return None
+
+    def run(self) -> None:
+        """
+        Execute the deferred plugin validations, concurrently if there is more than one.
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        max_workers = min(self.max_workers, len(pending))
+        if max_workers <= 1:
+            for key, call in pending.items():
+                self._results[key] = _call_plugin(*call)
+            return
+
+        language = translation.get_language()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="plugin-validation"
+        ) as executor:
+            futures = {
+                key: executor.submit(_call_plugin_in_thread, language, *call)
+                for key, call in pending.items()
+            }
+        for key, future in futures.items():
+            self._results[key] = future.result()
+
+
+def _call_plugin(
+    plugin_id: str, value: JSONValue, submission: Submission
+) -> ValidationResult | Exception:
+    try:
+        return register.validate(plugin_id, value=value, submission=submission)
+    except Exception as exc:
+        # re-raised when the result is looked up, like the plugin being called inline
+        return exc
+
+
+def _call_plugin_in_thread(
+    language: str | None, plugin_id: str, value: JSONValue, submission: Submission
+) -> ValidationResult | Exception:
+    try:
+        # the (lazy) error messages are evaluated in the thread
+        with translation.override(language):
+            return _call_plugin(plugin_id, value, submission)
+    finally:
+        # the thread gets its own database connection(s), which must not leak
+        connections.close_all()
+
+
+def get_current_batch() -> PluginValidationBatch | None:
+    return _current_batch.get()
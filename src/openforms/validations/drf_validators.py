@@ -11,6 +11,7 @@ from rest_framework import serializers
 from openforms.submissions.models import Submission
 from openforms.typing import JSONValue
 
+from .batch import get_current_batch
 from .registry import register
 
 
@@ -45,8 +46,21 @@ class PluginValidator:
             submission, Submission
         ), "You must pass the submission in the serializer context"
 
-        # evaluate all plugins to collect the error messages in case none is valid
+        # collect the error messages of all plugins in case none is valid
         messages: list[str] = []
+
+        # inside a batch, the plugin calls are deferred until they can be executed
+        # together, after which the validation is performed again. Only the first
+        # plugin without a result is deferred, the next one only if all the earlier
+        # plugins turned out to be invalid.
+        if (batch := get_current_batch()) is not None:
+            for plugin in self.plugins:
+                result = batch.validate(plugin, value=value, submission=submission)
+                if result is None or result.is_valid:
+                    return
+                messages += result.messages
+            raise serializers.ValidationError(messages, code="invalid")
+
         for plugin in self.plugins:
             result = register.validate(plugin, value=value, submission=submission)
             # as soon as one is valid -> abort, there are no validation messages to
@@ -0,0 +1,143 @@
+import threading
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+
+from openforms.submissions.models import Submission
+from openforms.validations.base import BasePlugin
+from openforms.validations.batch import PluginValidationBatch, get_current_batch
+from openforms.validations.drf_validators import PluginValidator
+from openforms.validations.registry import Registry
+
+register = Registry()
+
+
+@register("recording")
+class RecordingValidator(BasePlugin[str]):
+    for_components = ("textfield",)
+    verbose_name = "Recording validator"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls: list[tuple[str, str]] = []
+        self.barrier: threading.Barrier | None = None
+
+    def __call__(self, value, submission):
+        self.calls.append((value, threading.current_thread().name))
+        if self.barrier is not None:
+            # only passes if the calls are made concurrently
+            self.barrier.wait(timeout=5)
+        if value != "VALID":
+            raise serializers.ValidationError(_("Enter a valid value."))
+
+
+@register("other")
+class OtherRecordingValidator(RecordingValidator):
+    verbose_name = "Other recording validator"
+
+
+@patch("openforms.validations.batch.register", new=register)
+class PluginValidationBatchTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.validator: RecordingValidator = register["recording"]  # type: ignore
+        self.validator.calls = []
+        self.addCleanup(setattr, self.validator, "barrier", None)
+
+    def test_calls_deferred_and_deduplicated(self):
+        submission = Submission()
+        batch = PluginValidationBatch(max_workers=1)
+
+        with batch:
+            self.assertIs(get_current_batch(), batch)
+            first = batch.validate("recording", "VALID", submission)
+            second = batch.validate("recording", "VALID", submission)
+
+        self.assertIsNone(get_current_batch())
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        self.assertEqual(batch.deferred, 2)
+        self.assertEqual(self.validator.calls, [])
+
+        batch.run()
+
+        self.assertEqual(len(self.validator.calls), 1)
+        result = batch.validate("recording", "VALID", submission)
+        assert result is not None
+        self.assertTrue(result.is_valid)
+
+    def test_calls_run_concurrently(self):
+        self.validator.barrier = threading.Barrier(3)
+        submission = Submission()
+        batch = PluginValidationBatch(max_workers=3)
+        for value in ("VALID", "INVALID", "OTHER"):
+            batch.validate("recording", value, submission)
+
+        with translation.override("nl"):
+            batch.run()
+
+        self.assertEqual(len(self.validator.calls), 3)
+        for _value, thread_name in self.validator.calls:
+            self.assertTrue(thread_name.startswith("plugin-validation"))
+        invalid = batch.validate("recording", "INVALID", submission)
+        assert invalid is not None
+        self.assertFalse(invalid.is_valid)
+        # the messages are translated in the language of the request
+        self.assertEqual(invalid.messages, ["Voer een geldige waarde in."])
+
+
+@patch("openforms.validations.batch.register", new=register)
+@patch("openforms.validations.drf_validators.register", new=register)
+class PluginValidatorBatchTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.first: RecordingValidator = register["recording"]  # type: ignore
+        self.second: RecordingValidator = register["other"]  # type: ignore
+        self.first.calls = []
+        self.second.calls = []
+        self.field = Mock(context={"submission": Submission()})
+
+    def test_first_valid_plugin_short_circuits(self):
+        validator = PluginValidator(["recording", "other"])
+        batch = PluginValidationBatch(max_workers=1)
+
+        with batch:
+            validator("VALID", self.field)
+        # only the first plugin is deferred
+        self.assertEqual(batch.deferred, 1)
+
+        batch.run()
+        with batch:
+            validator("VALID", self.field)
+
+        self.assertEqual(batch.deferred, 1)
+        self.assertEqual(len(self.first.calls), 1)
+        self.assertEqual(self.second.calls, [])
+
+    def test_next_plugin_deferred_when_earlier_plugins_are_invalid(self):
+        validator = PluginValidator(["recording", "other"])
+        batch = PluginValidationBatch(max_workers=1)
+
+        with batch:
+            validator("INVALID", self.field)
+        batch.run()
+        with batch:
+            validator("INVALID", self.field)
+
+        self.assertEqual(batch.deferred, 2)
+        self.assertEqual(len(self.first.calls), 1)
+        self.assertEqual(self.second.calls, [])
+
+        batch.run()
+        with batch, self.assertRaises(serializers.ValidationError) as exc_context:
+            validator("INVALID", self.field)
+
+        self.assertEqual(len(self.second.calls), 1)
+        # the messages of both plugins
+        self.assertEqual(len(exc_context.exception.detail), 2)
@@ -7,12 +7,22 @@ from openforms.plugins.plugin import AbstractBasePlugin
 from openforms.submissions.models import Submission
 from openforms.typing import JSONObject, StrOrPromise
 
-from .constants import DATA_TYPE_TO_JSON_SCHEMA, FormVariableDataTypes
+from .cache import get_initial_value
+from .constants import (
+    DATA_TYPE_TO_JSON_SCHEMA,
+    FormVariableDataTypes,
+    StaticVariableVolatility,
+)
 
 
 class BaseStaticVariable(ABC, AbstractBasePlugin):
     name: ClassVar[StrOrPromise]
     data_type: ClassVar[FormVariableDataTypes]
+    volatility: ClassVar[StaticVariableVolatility | None] = None
+    """
+    How long the value remains valid, which determines how long it can be cached. If
+    not specified, the value is computed every time it is needed.
+    """
 
     @abstractmethod
     def get_initial_value(self, submission: Submission | None = None):
@@ -31,7 +41,7 @@ class BaseStaticVariable(ABC, AbstractBasePlugin):
             name=self.name,
             key=self.identifier,
             data_type=self.data_type,
-            initial_value=self.get_initial_value(submission=submission),
+            initial_value=get_initial_value(self, submission=submission),
         )
         variable.json_schema = self.as_json_schema()
         return variable
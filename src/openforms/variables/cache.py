@@ -0,0 +1,92 @@
+"""
+Cache the values of static variables according to their declared volatility.
+
+* :attr:`~.StaticVariableVolatility.process` values are kept in memory until the
+  settings change.
+* :attr:`~.StaticVariableVolatility.request` and
+  :attr:`~.StaticVariableVolatility.submission` values are stored in the ``request``
+  cache, which only holds them for the duration of the current request. Outside of a
+  request-response cycle they are computed every time.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from django.core.signals import setting_changed
+
+from .constants import StaticVariableVolatility
+
+if TYPE_CHECKING:
+    from openforms.submissions.models import Submission
+
+    from .base import BaseStaticVariable
+
+_MISSING = object()
+
+_process_values: dict[str, Any] = {}
+
+
+def _get_key(variable: BaseStaticVariable) -> str:
+    # identifiers are only unique within a registry
+    variable_cls = type(variable)
+    return f"static-variable:{variable_cls.__module__}.{variable_cls.__qualname__}"
+
+
+def _get_generation_key(submission_id: int) -> str:
+    return f"static-variables:{submission_id}:generation"
+
+
+def get_initial_value(
+    variable: BaseStaticVariable, submission: Submission | None = None
+) -> Any:
+    """
+    Get the initial value of a static variable, re-using a cached value if possible.
+    """
+    cache = caches["request"]
+    key = _get_key(variable)
+
+    match variable.volatility:
+        case StaticVariableVolatility.process:
+            if (value := _process_values.get(key, _MISSING)) is _MISSING:
+                value = _process_values[key] = variable.get_initial_value(
+                    submission=submission
+                )
+            return value
+        case StaticVariableVolatility.request:
+            pass
+        case StaticVariableVolatility.submission if submission is None:
+            key = f"{key}:-"
+        case StaticVariableVolatility.submission if submission.pk:
+            generation = cache.get(_get_generation_key(submission.pk), 0)
+            key = f"{key}:{submission.pk}:{generation}"
+        case _:
+            return variable.get_initial_value(submission=submission)
+
+    if (value := cache.get(key, _MISSING)) is _MISSING:
+        value = variable.get_initial_value(submission=submission)
+        cache.set(key, value)
+    return value
+
+
+def invalidate_submission_values(submission_id: int) -> None:
+    """
+    Discard the cached submission scoped values of a submission.
+
+    Call this when data that the static variables derive their value from changes
+    during a request, e.g. the authentication details.
+    """
+    cache = caches["request"]
+    key = _get_generation_key(submission_id)
+    cache.set(key, cache.get(key, 0) + 1)
+
+
+def clear_process_values(**kwargs) -> None:
+    _process_values.clear()
+
+
+setting_changed.connect(
+    clear_process_values,
+    dispatch_uid="openforms.variables.cache.clear_process_values",
+)
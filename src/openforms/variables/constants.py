@@ -23,6 +23,16 @@ class FormVariableDataTypes(models.TextChoices):
     date = "date", _("Date")
 
 
+class StaticVariableVolatility(models.TextChoices):
+    """
+    How long the value of a static variable remains valid.
+    """
+
+    process = "process", _("Per process")
+    submission = "submission", _("Per submission")
+    request = "request", _("Per request")
+
+
 class ServiceFetchMethods(models.TextChoices):
     get = "GET", "GET"
     post = "POST", "POST"
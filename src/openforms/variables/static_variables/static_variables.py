@@ -7,7 +7,7 @@ from django.utils.translation import gettext_lazy as _
 from openforms.submissions.models import Submission
 
 from ..base import BaseStaticVariable
-from ..constants import FormVariableDataTypes
+from ..constants import FormVariableDataTypes, StaticVariableVolatility
 from ..registry import register_static_variable
 
 
@@ -15,6 +15,7 @@ from ..registry import register_static_variable
 class Now(BaseStaticVariable):
     name = _("Now")
     data_type = FormVariableDataTypes.datetime
+    volatility = StaticVariableVolatility.request
 
     def get_initial_value(self, submission: Submission | None = None) -> datetime:
         # Issue #2827 - the frontend schedules a new logic check when data is changed,
@@ -32,6 +33,7 @@ class Now(BaseStaticVariable):
 class Today(BaseStaticVariable):
     name = _("Today")
     data_type = FormVariableDataTypes.date
+    volatility = StaticVariableVolatility.request
 
     def get_initial_value(self, submission: Submission | None = None) -> date:
         now_utc = timezone.now()
@@ -45,6 +47,7 @@ class Today(BaseStaticVariable):
 class CurrentYear(BaseStaticVariable):
     name = _("Current year")
     data_type = FormVariableDataTypes.int
+    volatility = StaticVariableVolatility.request
 
     def get_initial_value(self, submission: Submission | None = None) -> int:
         now_utc = timezone.now()
@@ -58,6 +61,7 @@ class CurrentYear(BaseStaticVariable):
 class Environment(BaseStaticVariable):
     name = _("Environment")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.process
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return str(settings.ENVIRONMENT)
@@ -70,6 +74,7 @@ class Environment(BaseStaticVariable):
 class FormName(BaseStaticVariable):
     name = _("Form name")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return submission.form.name if submission else ""
@@ -82,6 +87,7 @@ class FormName(BaseStaticVariable):
 class FormID(BaseStaticVariable):
     name = _("Form ID")
     data_type = FormVariableDataTypes.string
+    volatility = StaticVariableVolatility.submission
 
     def get_initial_value(self, submission: Submission | None = None) -> str:
         return str(submission.form.uuid) if submission else ""
@@ -1,11 +1,14 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 from uuid import UUID
 
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 
 from freezegun import freeze_time
 from jsonschema import Draft202012Validator
 
+from openforms.authentication.tests.factories import AuthInfoFactory
 from openforms.submissions.tests.factories import SubmissionFactory
 
 from ..registry import register_static_variable as register
@@ -162,3 +165,55 @@ class StaticVariablesValidJsonSchemaTests(TestCase):
     def test_form_id(self):
         schema = self._get_json_schema("form_id")
         self.assertValidSchema(schema)
+
+
+class VolatilityCacheTests(TestCase):
+    def _start_request(self):
+        request_cache = caches["request"]
+        request_cache.mark_request_started()
+        self.addCleanup(request_cache.close)
+
+    def test_not_cached_outside_of_request(self):
+        with freeze_time("2022-08-29T17:10:00+02:00") as frozen_time:
+            first = _get_variable("now").initial_value
+            frozen_time.tick(timedelta(minutes=1))
+            second = _get_variable("now").initial_value
+
+        self.assertNotEqual(first, second)
+
+    def test_request_scope(self):
+        self._start_request()
+
+        with freeze_time("2022-08-29T17:10:00+02:00") as frozen_time:
+            first = _get_variable("now").initial_value
+            frozen_time.tick(timedelta(minutes=1))
+            second = _get_variable("now").initial_value
+
+        self.assertEqual(first, second)
+
+    def test_submission_scope(self):
+        self._start_request()
+        submission1, submission2 = SubmissionFactory.create_batch(2)
+
+        with patch.object(
+            type(register["form_name"]), "get_initial_value", return_value="Form"
+        ) as mock_get_initial_value:
+            _get_variable("form_name", submission=submission1)
+            _get_variable("form_name", submission=submission1)
+            _get_variable("form_name", submission=submission2)
+
+        self.assertEqual(mock_get_initial_value.call_count, 2)
+
+    def test_submission_scope_invalidated_by_authentication(self):
+        self._start_request()
+        submission = SubmissionFactory.create()
+        self.assertEqual(
+            _get_variable("auth_bsn", submission=submission).initial_value, ""
+        )
+
+        AuthInfoFactory.create(submission=submission, value="111222333")
+
+        self.assertEqual(
+            _get_variable("auth_bsn", submission=submission).initial_value,
+            "111222333",
+        )
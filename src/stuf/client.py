@@ -14,7 +14,7 @@ subclass the base class and implement your domain specific logic in your own cla
 
 import logging
 import uuid
-from typing import Any, Literal, Protocol
+from typing import Any, BinaryIO, Literal, Protocol
 
 from django.template import loader
 
@@ -22,6 +22,7 @@ from ape_pie import APIClient, InvalidURLError
 from ape_pie.client import is_base_url
 from requests.models import Response
 
+from openforms.utils.streaming import Base64StreamingBody
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
@@ -38,6 +39,23 @@ def noop_log(*args, **kwargs) -> None:
     pass
 
 
+class Base64Content:
+    """
+    (File) content to include base64 encoded in the body of a templated request.
+
+    Use it as a template context value. Rather than being rendered in the template, the
+    content is read and encoded while the request is being sent.
+    """
+
+    def __init__(self, content: BinaryIO, size: int):
+        self.content = content
+        self.size = size
+        self._placeholder = uuid.uuid4().hex
+
+    def __str__(self) -> str:
+        return self._placeholder
+
+
 class BaseClient(APIClient):
     """
     A base client with :class:`requests.Session`'s interface.
@@ -155,7 +173,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | Base64StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -163,7 +181,7 @@ class BaseClient(APIClient):
 
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -209,7 +227,9 @@ class BaseClient(APIClient):
         Make a request by templating out a template with the provided context.
 
         The context is merged with the base context and the resolved template is
-        rendered into a string, suitable to be passed down to :meth:`request`.
+        rendered into a string, suitable to be passed down to :meth:`request`. If the
+        context contains :class:`Base64Content`, the rendered template is split around
+        it and the content is streamed in between.
         """
         full_context = {**self.build_base_context(), **(context or {})}
         ref_nr = full_context["referentienummer"]
@@ -220,6 +240,19 @@ class BaseClient(APIClient):
             extra={"ref_nr": ref_nr, "sector_alias": self.sector_alias},
         )
         body = loader.render_to_string(template, full_context)
+        streamed = [
+            value for value in full_context.values() if isinstance(value, Base64Content)
+        ]
+        if streamed:
+            assert len(streamed) == 1, "Only one streamed content is supported."
+            content = streamed[0]
+            head, tail = body.split(str(content))
+            body = Base64StreamingBody(
+                head=head.encode("utf-8"),
+                content=content.content,
+                size=content.size,
+                tail=tail.encode("utf-8"),
+            )
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
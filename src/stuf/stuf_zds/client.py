@@ -20,7 +20,7 @@ from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
 
-from ..client import BaseClient
+from ..client import Base64Content, BaseClient
 from ..constants import EndpointType
 from ..models import StufService
 from ..service_client_factory import ServiceClientFactory, get_client_init_kwargs
@@ -30,6 +30,10 @@ from .models import StufZDSConfig
 
 logger = logging.getLogger(__name__)
 
+# documents larger than this (in bytes) are not rendered in the SOAP message, but are
+# read and encoded while sending the request
+STREAMING_UPLOAD_THRESHOLD = 1024 * 1024
+
 nsmap = OrderedDict(
     (
         ("zkn", "http://www.egem.nl/StUF/sector/zkn/0310"),
@@ -307,7 +311,10 @@ class Client(BaseClient):
         doc_data: dict,
     ) -> None:
         document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
+        if document.content.size > STREAMING_UPLOAD_THRESHOLD:
+            inhoud = Base64Content(document.content, size=document.content.size)
+        else:
+            inhoud = base64.b64encode(document.content.read()).decode()
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -325,7 +332,7 @@ class Client(BaseClient):
             "document_identificatie": doc_id,
             "auteur": "open-forms",
             "taal": "nld",
-            "inhoud": base64_body,
+            "inhoud": inhoud,
             "status": "definitief",
             **doc_data,
         }
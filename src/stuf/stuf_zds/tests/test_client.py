@@ -1,6 +1,10 @@
+import threading
+from base64 import b64decode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import skipIf
 from unittest.mock import patch
 
+from django.core.files.base import ContentFile
 from django.template.loader import render_to_string
 from django.test import SimpleTestCase, TestCase, tag
 
@@ -10,11 +14,14 @@ from simple_certmanager.test.factories import CertificateFactory
 
 from openforms.logging.tests.utils import disable_timelinelog
 from openforms.registrations.exceptions import RegistrationFailed
+from openforms.submissions.models import SubmissionReport
 from openforms.tests.utils import can_connect
 
 from ...constants import EndpointType
 from ...tests.factories import StufServiceFactory
+from ...xml import fromstring
 from ..client import StufZDSClient, ZaakOptions
+from .utils import load_mock
 
 
 @requests_mock.Mocker()
@@ -167,3 +174,86 @@ class StufZdsRegressionTests(SimpleTestCase):
             client.get("https://example.com/path")
 
         assert m.last_request.timeout == 1  # type: ignore
+
+
+class StufServerRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.server.received_headers = self.headers
+        self.server.received_body = self.rfile.read(int(self.headers["Content-Length"]))
+        response = load_mock("voegZaakdocumentToe.xml", {"referentienummer": "1234"})
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@disable_timelinelog()
+@patch("stuf.stuf_zds.client.STREAMING_UPLOAD_THRESHOLD", 1024)
+class StufZdsStreamingDocumentTests(SimpleTestCase):
+    """
+    Send large documents to a local stand-in StUF server.
+
+    requests_mock does not consume (streamed) request bodies, so a real server is
+    used to check what actually goes over the wire.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StufServerRequestHandler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _create_document(self, content: bytes):
+        stuf_service = StufServiceFactory.build()
+        client = StufZDSClient(
+            stuf_service,
+            {
+                "omschrijving": "my-form",
+                "zds_documenttype_omschrijving_inzending": "dt-omschrijving",
+                "zds_zaakdoc_vertrouwelijkheid": "OPENBAAR",
+            },  # type: ignore
+        )
+        report = SubmissionReport(content=ContentFile(content, name="report.pdf"))
+        host, port = self.server.server_address
+        with (
+            client,
+            patch.object(
+                client, "to_absolute_url", return_value=f"http://{host}:{port}/"
+            ),
+        ):
+            client.create_zaak_document(
+                zaak_id="ZAAK-01", doc_id="DOC-01", submission_report=report
+            )
+
+    def test_large_document_is_streamed(self):
+        content = bytes(range(256)) * 100
+
+        self._create_document(content)
+
+        headers = self.server.received_headers
+        self.assertNotIn("Transfer-Encoding", headers)
+        self.assertEqual(int(headers["Content-Length"]), len(self.server.received_body))
+        xml = fromstring(self.server.received_body)
+        inhoud = xml.xpath(
+            "//zkn:object/zkn:inhoud",
+            namespaces={"zkn": "http://www.egem.nl/StUF/sector/zkn/0310"},
+        )[0]
+        self.assertEqual(b64decode(inhoud.text), content)
+        self.assertEqual(
+            inhoud.get("{http://www.egem.nl/StUF/StUF0301}bestandsnaam"),
+            "open-forms-inzending.pdf",
+        )
+
+    def test_small_document_is_rendered_in_template(self):
+        with patch("stuf.client.Base64StreamingBody") as mock_body:
+            self._create_document(b"small")
+
+        mock_body.assert_not_called()
+        self.assertIn(b">c21hbGw=</ZKN:inhoud>", self.server.received_body)